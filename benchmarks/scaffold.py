@@ -0,0 +1,175 @@
+"""Scaffolding throughput and latency benchmarks for every archetype.
+
+Runs offline against the working tree; uv is stubbed out so only nuv's own
+cost is measured.
+
+    uv run python benchmarks/scaffold.py                        # all archetypes, all modes
+    uv run python benchmarks/scaffold.py --archetype polars -n 200
+    uv run python benchmarks/scaffold.py --save benchmarks/baseline.json
+    uv run python benchmarks/scaffold.py --compare benchmarks/baseline.json --threshold 0.25
+
+Modes:
+    render         render every template of the archetype (template cache warm)
+    scaffold-tmpfs scaffold_files() into /dev/shm (falls back to the temp dir)
+    scaffold-disk  scaffold_files() into the system temp dir
+    full-run       run_new() end to end with uv stubbed out
+
+Exit code is 1 when --compare finds a p50 regression above --threshold.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from nuv._templates import TEMPLATES_ROOT, warm
+from nuv.commands.new import VALID_ARCHETYPES, render_template, run_new, scaffold_files
+
+MODES = ("render", "scaffold-tmpfs", "scaffold-disk", "full-run")
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _tmpfs_root() -> Path:
+    shm = Path("/dev/shm")
+    return shm if shm.is_dir() else Path(tempfile.gettempdir())
+
+
+def _count_files(root: Path) -> int:
+    return sum(1 for p in root.rglob("*") if p.is_file())
+
+
+def _bench_render(archetype: str) -> Callable[[int], int]:
+    archetype_root = TEMPLATES_ROOT / archetype
+    templates = [p.relative_to(archetype_root).as_posix() for p in sorted(archetype_root.rglob("*.tpl"))]
+
+    def run(_: int) -> int:
+        for tpl in templates:
+            render_template(tpl, archetype=archetype, name="bench-project", module_name="bench_project")
+        return len(templates)
+
+    return run
+
+
+def _bench_scaffold(archetype: str, root: Path) -> Callable[[int], int]:
+    def run(i: int) -> int:
+        target = root / f"bench-{archetype}-{i}"
+        target.mkdir()
+        scaffold_files(target, name="bench-project", module_name="bench_project", archetype=archetype)
+        return _count_files(target)
+
+    return run
+
+
+def _bench_full_run(archetype: str, root: Path) -> Callable[[int], int]:
+    def run(i: int) -> int:
+        target = root / f"bench-{archetype}-{i}"
+        with (
+            patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+            patch("nuv.commands.new.subprocess.run", return_value=MagicMock(returncode=0)),
+        ):
+            status = run_new("bench-project", at=str(target), archetype=archetype, install_mode="none")
+        if status != 0:
+            raise RuntimeError(f"run_new failed for {archetype}")
+        return _count_files(target)
+
+    return run
+
+
+def measure(archetype: str, mode: str, iterations: int, warmup: int) -> dict[str, float]:
+    root = Path(tempfile.mkdtemp(prefix="nuv-bench-", dir=_tmpfs_root() if mode == "scaffold-tmpfs" else None))
+    try:
+        match mode:
+            case "render":
+                fn = _bench_render(archetype)
+            case "full-run":
+                fn = _bench_full_run(archetype, root)
+            case _:
+                fn = _bench_scaffold(archetype, root)
+        for i in range(warmup):
+            fn(-1 - i)
+        samples: list[float] = []
+        files = 0
+        for i in range(iterations):
+            start = time.perf_counter()
+            files = fn(i)
+            samples.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    p50 = statistics.median(samples)
+    return {
+        "iterations": iterations,
+        "files": files,
+        "p50_ms": p50 * 1000,
+        "p95_ms": _percentile(samples, 95) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "files_per_sec": files / p50 if p50 else 0.0,
+    }
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float) -> list[str]:
+    """Return a line per benchmark whose p50 regressed by more than *threshold* (a fraction)."""
+    regressions: list[str] = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None or previous["p50_ms"] <= 0:
+            continue
+        change = current["p50_ms"] / previous["p50_ms"] - 1
+        if change > threshold:
+            regressions.append(f"{key}: p50 {previous['p50_ms']:.3f} ms -> {current['p50_ms']:.3f} ms (+{change:.0%})")
+    return regressions
+
+
+def _format_table(results: dict[str, dict[str, float]]) -> str:
+    header = f"{'benchmark':<24} {'files':>5} {'p50 ms':>9} {'p95 ms':>9} {'files/s':>10}"
+    lines = [header, "-" * len(header)]
+    for key, r in results.items():
+        lines.append(f"{key:<24} {r['files']:>5.0f} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} {r['files_per_sec']:>10.0f}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark nuv scaffolding.")
+    parser.add_argument("--archetype", action="append", choices=VALID_ARCHETYPES, help="Archetype to benchmark (repeatable; default: all).")
+    parser.add_argument("--mode", action="append", choices=MODES, help="Mode to benchmark (repeatable; default: all).")
+    parser.add_argument("-n", "--iterations", type=int, default=50, help="Timed iterations per benchmark (default: 50).")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed warmup iterations (default: 3).")
+    parser.add_argument("--save", metavar="PATH", help="Write results as JSON to PATH.")
+    parser.add_argument("--compare", metavar="PATH", help="Compare p50 against a baseline JSON written by --save.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown as a fraction (default: 0.2).")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+    warm()
+    results: dict[str, dict[str, float]] = {}
+    for archetype in args.archetype or VALID_ARCHETYPES:
+        for mode in args.mode or MODES:
+            results[f"{archetype}/{mode}"] = measure(archetype, mode, args.iterations, args.warmup)
+    sys.stdout.write(_format_table(results))
+
+    if args.save:
+        payload = {"python": platform.python_version(), "platform": platform.platform(), "results": results}
+        Path(args.save).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            sys.stderr.write(f"REGRESSION {line}\n")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
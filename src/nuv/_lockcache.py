@@ -0,0 +1,80 @@
+"""Content-addressed cache of known-good ``uv.lock`` files.
+
+Entries are keyed by a hash of the archetype's rendered ``pyproject.toml``
+with the project name replaced by a placeholder, so every project generated
+from the same (archetype, python_version, template revision) shares one lock.
+The project's own ``[[package]]`` entry is stored under a sentinel name and
+rewritten for each new project on restore.
+
+The cache lives in ``$NUV_CACHE_DIR`` or ``$XDG_CACHE_HOME/nuv`` (default
+``~/.cache/nuv``), under ``locks/``. Delete an entry to force re-resolution.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+PROJECT_SENTINEL = "__nuv_project__"
+
+# The generated project's own entry: the only [[package]] whose source is the project directory.
+_OWN_PACKAGE = re.compile(r'(\[\[package\]\]\nname = ")([^"]+)("\nversion = "[^"]*"\nsource = \{ (?:editable|virtual) = "\." \})')
+
+
+def cache_dir() -> Path:
+    if explicit := os.environ.get("NUV_CACHE_DIR"):
+        return Path(explicit)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "nuv"
+
+
+def lock_key(normalized_pyproject: str) -> str:
+    return hashlib.sha256(normalized_pyproject.encode("utf-8")).hexdigest()
+
+
+def _entry(key: str) -> Path:
+    return cache_dir() / "locks" / f"{key}.lock"
+
+
+def _normalize_package_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def restore(key: str, target: Path, *, name: str) -> bool:
+    """Write the cached lock for *key* into *target* as ``uv.lock``; return whether there was one."""
+    entry = _entry(key)
+    try:
+        cached = entry.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        log.debug("lock cache miss %s", key[:12])
+        return False
+    (target / "uv.lock").write_text(cached.replace(f'"{PROJECT_SENTINEL}"', f'"{_normalize_package_name(name)}"'), encoding="utf-8")
+    log.info("restored cached uv.lock %s", key[:12])
+    return True
+
+
+def store(key: str, target: Path) -> bool:
+    """Copy *target*'s ``uv.lock`` into the cache under *key*; return whether it was stored."""
+    lock_path = target / "uv.lock"
+    if not lock_path.is_file():
+        return False
+    normalized, count = _OWN_PACKAGE.subn(rf"\g<1>{PROJECT_SENTINEL}\g<3>", lock_path.read_text(encoding="utf-8"))
+    if count != 1:
+        log.debug("not caching %s: expected one project package entry, found %d", lock_path, count)
+        return False
+    entry = _entry(key)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=entry.parent, prefix=".tmp-", suffix=".lock")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(normalized)
+    os.replace(tmp, entry)
+    log.info("cached uv.lock %s", key[:12])
+    return True
+
+
+def evict(key: str) -> None:
+    _entry(key).unlink(missing_ok=True)
@@ -0,0 +1,73 @@
+"""Load, pre-parse, and cache archetype templates.
+
+Templates are ``str.format()`` files under ``nuv/templates/<archetype>/``. Each
+one is parsed once into a tuple of segments and rendered from memory
+afterwards; the cache key includes the file's mtime so edits to a template
+during development are still picked up.
+"""
+
+import string
+from functools import lru_cache
+from pathlib import Path
+
+TEMPLATES_ROOT = Path(__file__).parent / "templates"
+
+_FORMATTER = string.Formatter()
+
+Segment = tuple[str, str | None, str, str | None]
+
+
+class CompiledTemplate:
+    """A template parsed into ``(literal, field, format_spec, conversion)`` segments."""
+
+    __slots__ = ("name", "segments")
+
+    def __init__(self, name: str, source: str) -> None:
+        self.name = name
+        self.segments: tuple[Segment, ...] = tuple((literal, field, spec or "", conversion) for literal, field, spec, conversion in _FORMATTER.parse(source))
+
+    def render(self, values: dict[str, str]) -> str:
+        parts: list[str] = []
+        for literal, field, spec, conversion in self.segments:
+            parts.append(literal)
+            if field is None:
+                continue
+            obj, _ = _FORMATTER.get_field(field, (), values)
+            if conversion is not None:
+                obj = _FORMATTER.convert_field(obj, conversion)
+            parts.append(format(obj, spec))
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _compile(archetype: str, tpl_name: str, mtime_ns: int) -> CompiledTemplate:
+    source = (TEMPLATES_ROOT / archetype / tpl_name).read_text(encoding="utf-8")
+    return CompiledTemplate(f"{archetype}/{tpl_name}", source)
+
+
+def load_template(archetype: str, tpl_name: str) -> CompiledTemplate:
+    try:
+        mtime_ns = (TEMPLATES_ROOT / archetype / tpl_name).stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {archetype}/{tpl_name}") from None
+    return _compile(archetype, tpl_name, mtime_ns)
+
+
+def warm(archetypes: tuple[str, ...] | None = None) -> int:
+    """Pre-compile every ``.tpl`` file for the given archetypes (default: all).
+
+    Returns the number of templates loaded.
+    """
+    if archetypes is None:
+        archetypes = tuple(sorted(p.name for p in TEMPLATES_ROOT.iterdir() if p.is_dir() and not p.name.startswith("_")))
+    count = 0
+    for archetype in archetypes:
+        archetype_root = TEMPLATES_ROOT / archetype
+        for tpl_path in sorted(archetype_root.rglob("*.tpl")):
+            load_template(archetype, tpl_path.relative_to(archetype_root).as_posix())
+            count += 1
+    return count
+
+
+def clear_cache() -> None:
+    _compile.cache_clear()
@@ -0,0 +1,91 @@
+"""Monotonic-clock spans for ``nuv new --timings``.
+
+Instrumented code wraps work in ``span(kind, label)``. Spans are only recorded
+while a ``recording()`` block is active in the current context, so the
+instrumentation costs a context-variable lookup when timings are off.
+"""
+
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+PHASE = "phase"
+RENDER = "render"
+WRITE = "write"
+SUBPROCESS = "subprocess"
+
+
+@dataclass(frozen=True)
+class Span:
+    kind: str
+    label: str
+    seconds: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def of_kind(self, kind: str) -> list[Span]:
+        return [span for span in self.spans if span.kind == kind]
+
+    def to_dict(self, **meta: Any) -> dict[str, Any]:
+        return {
+            **meta,
+            "phases": {span.label: span.seconds for span in self.of_kind(PHASE)},
+            "renders": [{"template": span.label, "seconds": span.seconds} for span in self.of_kind(RENDER)],
+            "writes": [{"path": span.label, "seconds": span.seconds, **span.extra} for span in self.of_kind(WRITE)],
+            "subprocesses": [{"command": span.label, "seconds": span.seconds, **span.extra} for span in self.of_kind(SUBPROCESS)],
+        }
+
+    def format_table(self, *, total_seconds: float | None = None) -> str:
+        rows: list[tuple[str, float]] = [(span.label, span.seconds) for span in self.of_kind(PHASE)]
+        for kind in (RENDER, WRITE):
+            spans = self.of_kind(kind)
+            if spans:
+                rows.append((f"  {kind} ({len(spans)} files)", sum(span.seconds for span in spans)))
+        rows.extend((f"  $ {span.label}", span.seconds) for span in self.of_kind(SUBPROCESS))
+        if total_seconds is not None:
+            rows.append(("total", total_seconds))
+        width = max([len("phase"), *(len(label) for label, _ in rows)])
+        lines = [f"{'phase':<{width}}  {'seconds':>9}"]
+        lines.extend(f"{label:<{width}}  {seconds:>9.4f}" for label, seconds in rows)
+        return "\n".join(lines) + "\n"
+
+
+_ACTIVE: ContextVar[Recorder | None] = ContextVar("nuv_timings", default=None)
+
+
+@contextmanager
+def recording() -> Generator[Recorder, None, None]:
+    recorder = Recorder()
+    token = _ACTIVE.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _ACTIVE.reset(token)
+
+
+@contextmanager
+def span(kind: str, label: str) -> Generator[dict[str, Any], None, None]:
+    """Time the enclosed block; the yielded dict is stored with the span (e.g. bytes, returncode)."""
+    extra: dict[str, Any] = {}
+    recorder = _ACTIVE.get()
+    if recorder is None:
+        yield extra
+        return
+    start = time.perf_counter()
+    try:
+        yield extra
+    finally:
+        recorder.add(Span(kind, label, time.perf_counter() - start, extra))
@@ -1,17 +1,32 @@
+"""argparse front-end for ``nuv``.
+
+Only argparse is imported at module load; command modules (and the
+subprocess/pathlib/json machinery they pull in) are imported once a
+subcommand actually runs, so ``nuv --help`` and argument errors stay cheap.
+"""
+
 import argparse
 from collections.abc import Sequence
 
-from nuv._logging import configure
-from nuv.commands.new import validate_python_version
-
 
 def _parse_python_version(value: str) -> str:
+    from nuv.commands.new import validate_python_version
+
     try:
         return validate_python_version(value)
     except ValueError as exc:
         raise argparse.ArgumentTypeError(str(exc)) from exc
 
 
+def _parse_jobs(value: str) -> int:
+    from nuv.commands.batch import validate_jobs
+
+    try:
+        return validate_jobs(int(value))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="nuv",
@@ -59,18 +74,99 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Keep partially generated files if setup steps fail.",
     )
+    new_parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Start resolving dependencies as soon as pyproject.toml is written, while the remaining files are scaffolded.",
+    )
+    new_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print a per-phase timing table (validate, scaffold, uv sync, tool install) to stderr.",
+    )
+    new_parser.add_argument(
+        "--timings-json",
+        metavar="PATH",
+        default=None,
+        help="Write per-phase, per-file, and subprocess timings as JSON to PATH.",
+    )
+    new_parser.add_argument(
+        "--lock-cache",
+        action="store_true",
+        help=(
+            "Reuse a cached uv.lock for this archetype and Python version and sync with --frozen; "
+            "on a miss, cache the lock uv resolves. Cached locks pin dependency versions until removed "
+            "from $NUV_CACHE_DIR (default: ~/.cache/nuv)."
+        ),
+    )
+    new_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Pass --offline to uv sync so only already-cached packages are used.",
+    )
+    new_parser.add_argument(
+        "--stage",
+        action="store_true",
+        help=("Scaffold into a hidden sibling directory and rename it into place once complete; on failure, hide the target with a rename and delete it in the background."),
+    )
+
+    batch_parser = subparsers.add_parser("batch", help="Create several projects from a TOML manifest.")
+    batch_parser.add_argument("manifest", metavar="MANIFEST", help="Path to a manifest.toml with [[project]] entries.")
+    batch_parser.add_argument(
+        "--install",
+        default="none",
+        choices=["editable", "none", "command-only"],
+        metavar="MODE",
+        help="Install behavior applied to every project (default: none).",
+    )
+    batch_parser.add_argument(
+        "--keep-on-failure",
+        action="store_true",
+        help="Keep partially generated files for projects whose setup fails.",
+    )
+    batch_parser.add_argument(
+        "-j",
+        "--jobs",
+        default=None,
+        metavar="N",
+        type=_parse_jobs,
+        help="Number of projects to create and sync concurrently (default: min(4, CPU count)).",
+    )
+    batch_parser.add_argument("--lock-cache", action="store_true", help="Reuse and populate the uv.lock cache (see `nuv new --help`).")
+    batch_parser.add_argument("--offline", action="store_true", help="Pass --offline to uv sync.")
+
+    warm_parser = subparsers.add_parser("warm", help="Pre-download every archetype's dependencies into uv's cache.")
+    warm_parser.add_argument(
+        "--archetype",
+        action="append",
+        choices=["script", "spark", "fastapi", "polars"],
+        metavar="TYPE",
+        help="Archetype to warm (repeatable; default: all).",
+    )
+    warm_parser.add_argument(
+        "--python-version",
+        action="append",
+        metavar="VERSION",
+        type=_parse_python_version,
+        help="Python version to warm (repeatable; default: each archetype's default).",
+    )
+    warm_parser.add_argument("--install-python", action="store_true", help="Also run `uv python install` for each Python version.")
+    warm_parser.add_argument("--lock-cache", action="store_true", help="Also store each resolved uv.lock in the nuv lock cache.")
 
     return parser
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    from nuv.commands.new import run_new
-
     parser = build_parser()
     args = parser.parse_args(argv)
+
+    from nuv._logging import configure
+
     configure(args.log_level)
 
     if args.command == "new":
+        from nuv.commands.new import run_new
+
         try:
             return run_new(
                 args.name,
@@ -79,6 +175,40 @@ def main(argv: Sequence[str] | None = None) -> int:
                 python_version=args.python_version,
                 install_mode=args.install,
                 keep_on_failure=args.keep_on_failure,
+                pipeline=args.pipeline,
+                timings=args.timings,
+                timings_json=args.timings_json,
+                lock_cache=args.lock_cache,
+                offline=args.offline,
+                stage=args.stage,
+            )
+        except Exception:  # pragma: no cover
+            parser.exit(status=1, message="ERROR unexpected failure\n")
+
+    if args.command == "batch":
+        from nuv.commands.batch import DEFAULT_JOBS, run_batch
+
+        try:
+            return run_batch(
+                args.manifest,
+                install_mode=args.install,
+                keep_on_failure=args.keep_on_failure,
+                jobs=args.jobs or DEFAULT_JOBS,
+                lock_cache=args.lock_cache,
+                offline=args.offline,
+            )
+        except Exception:  # pragma: no cover
+            parser.exit(status=1, message="ERROR unexpected failure\n")
+
+    if args.command == "warm":
+        from nuv.commands.warm import run_warm
+
+        try:
+            return run_warm(
+                archetypes=args.archetype,
+                python_versions=args.python_version,
+                install_python=args.install_python,
+                lock_cache=args.lock_cache,
             )
         except Exception:  # pragma: no cover
             parser.exit(status=1, message="ERROR unexpected failure\n")
@@ -0,0 +1,178 @@
+"""Scaffold many projects from a TOML manifest in a single process.
+
+Manifest format::
+
+    [defaults]                  # optional; applies to every [[project]]
+    archetype = "fastapi"
+    python_version = "3.14"
+
+    [[project]]
+    name = "billing-api"
+    at = "services/billing-api"  # optional; default ./<name>
+
+    [[project]]
+    name = "ingest"
+    archetype = "polars"
+
+Relative ``at`` paths (and the default ``./<name>``) are resolved against the
+directory containing the manifest.
+"""
+
+import logging
+import os
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from nuv._templates import warm
+from nuv.commands.new import (
+    DEFAULT_PYTHON_VERSION,
+    DEFAULT_PYTHON_VERSIONS,
+    VALID_ARCHETYPES,
+    run_new,
+    validate_install_mode,
+    validate_name,
+    validate_python_version,
+)
+
+log = logging.getLogger(__name__)
+
+ENTRY_KEYS = ("name", "archetype", "python_version", "at")
+DEFAULT_KEYS = ("archetype", "python_version")
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    name: str
+    archetype: str
+    python_version: str
+    target: Path
+
+
+def _parse_entry(raw: object, *, defaults: dict, base_dir: Path) -> ManifestEntry:
+    if not isinstance(raw, dict):
+        raise ValueError("entry must be a table")
+    unknown = sorted(set(raw) - set(ENTRY_KEYS))
+    if unknown:
+        raise ValueError(f"unknown keys {unknown}")
+    merged = {**defaults, **raw}
+    for key in ENTRY_KEYS:
+        if key in merged and not isinstance(merged[key], str):
+            raise ValueError(f"{key} must be a string")
+    name = validate_name(merged.get("name", ""))
+    archetype = merged.get("archetype", "script")
+    if archetype not in VALID_ARCHETYPES:
+        raise ValueError(f"Unknown archetype: {archetype!r}")
+    python_version = validate_python_version(merged.get("python_version") or DEFAULT_PYTHON_VERSIONS.get(archetype, DEFAULT_PYTHON_VERSION))
+    at = merged.get("at")
+    target = base_dir / (at if at else name)
+    return ManifestEntry(name=name, archetype=archetype, python_version=python_version, target=target)
+
+
+def load_manifest(path: Path) -> list[ManifestEntry]:
+    """Parse and validate every entry in *path*; raise ValueError listing all problems."""
+    if not path.is_file():
+        raise FileNotFoundError(f"Manifest not found: {path}")
+    try:
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    except tomllib.TOMLDecodeError as exc:
+        raise ValueError(f"Invalid manifest {path}: {exc}") from exc
+
+    defaults = data.get("defaults", {})
+    if not isinstance(defaults, dict):
+        raise ValueError("[defaults] must be a table")
+    unknown_defaults = sorted(set(defaults) - set(DEFAULT_KEYS))
+    if unknown_defaults:
+        raise ValueError(f"[defaults]: unknown keys {unknown_defaults}")
+    projects = data.get("project", [])
+    if not isinstance(projects, list):
+        raise ValueError("project must be an array of tables ([[project]])")
+    if not projects:
+        raise ValueError(f"Manifest has no [[project]] entries: {path}")
+
+    base_dir = path.parent
+    entries: list[ManifestEntry] = []
+    errors: list[str] = []
+    seen: dict[Path, str] = {}
+    for index, raw in enumerate(projects, start=1):
+        try:
+            entry = _parse_entry(raw, defaults=defaults, base_dir=base_dir)
+        except ValueError as exc:
+            errors.append(f"project #{index}: {exc}")
+            continue
+        resolved = entry.target.resolve()
+        if resolved in seen:
+            errors.append(f"project #{index}: target {entry.target} already used by {seen[resolved]!r}")
+            continue
+        if entry.target.exists():
+            errors.append(f"project #{index}: Directory already exists: {entry.target}")
+            continue
+        seen[resolved] = entry.name
+        entries.append(entry)
+    if errors:
+        raise ValueError("invalid manifest:\n  " + "\n  ".join(errors))
+    return entries
+
+
+def validate_jobs(jobs: int) -> int:
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got: {jobs}")
+    return jobs
+
+
+def run_batch(
+    manifest: str | Path,
+    *,
+    install_mode: str = "none",
+    keep_on_failure: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    lock_cache: bool = False,
+    offline: bool = False,
+) -> int:
+    """Create every project in *manifest*, running up to *jobs* projects concurrently.
+
+    Each project goes through ``run_new`` on its own worker, so a failed ``uv sync``
+    only rolls back that project. With more than one job, subprocess output is
+    prefixed with the project name.
+    """
+    try:
+        validate_install_mode(install_mode)
+        validate_jobs(jobs)
+        entries = load_manifest(Path(manifest))
+    except (ValueError, FileNotFoundError) as exc:
+        log.error("%s", exc)
+        return 1
+
+    warm(tuple(sorted({entry.archetype for entry in entries})))
+
+    def _create(entry: ManifestEntry) -> int:
+        return run_new(
+            entry.name,
+            at=str(entry.target),
+            archetype=entry.archetype,
+            python_version=entry.python_version,
+            install_mode=install_mode,
+            keep_on_failure=keep_on_failure,
+            output_prefix=entry.name if jobs > 1 else None,
+            lock_cache=lock_cache,
+            offline=offline,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(entries))) as pool:
+        statuses = list(pool.map(_create, entries))
+
+    failed: list[str] = []
+    for entry, status in zip(entries, statuses, strict=True):
+        if status == 0:
+            log.info("ok     %s (%s) -> %s", entry.name, entry.archetype, entry.target)
+        else:
+            log.error("failed %s (%s) -> %s", entry.name, entry.archetype, entry.target)
+            failed.append(entry.name)
+
+    log.info("batch: %d succeeded, %d failed", len(entries) - len(failed), len(failed))
+    if failed:
+        log.error("batch failures: %s", ", ".join(failed))
+        return 1
+    return 0
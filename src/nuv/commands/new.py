@@ -1,10 +1,23 @@
 import json
 import logging
+import os
 import re
+import secrets
 import shutil
 import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext, suppress
+from contextvars import copy_context
 from pathlib import Path
 
+from nuv import _lockcache
+from nuv._templates import load_template
+from nuv._timing import PHASE, RENDER, SUBPROCESS, WRITE, Recorder, recording, span
+
 log = logging.getLogger(__name__)
 
 INSTALL_MODES = ("editable", "none", "command-only")
@@ -22,7 +35,6 @@ def validate_name(name: str) -> str:
     return name
 
 
-_TEMPLATES_ROOT = Path(__file__).parent.parent / "templates"
 DEFAULT_PYTHON_VERSION = "3.14"
 DEFAULT_PYTHON_VERSIONS = {"script": "3.14", "spark": "3.13", "fastapi": "3.14", "polars": "3.14"}
 
@@ -47,20 +59,21 @@ def render_template(
     module_name: str,
     python_version: str = DEFAULT_PYTHON_VERSION,
 ) -> str:
-    tpl_path = _TEMPLATES_ROOT / archetype / tpl_name
-    if not tpl_path.exists():
-        raise FileNotFoundError(f"Template not found: {archetype}/{tpl_name}")
-    return tpl_path.read_text(encoding="utf-8").format(
-        name=name,
-        module_name=module_name,
-        python_version=python_version,
-        python_version_nodot=python_version.replace(".", ""),
-    )
+    with span(RENDER, f"{archetype}/{tpl_name}"):
+        return load_template(archetype, tpl_name).render(
+            {
+                "name": name,
+                "module_name": module_name,
+                "python_version": python_version,
+                "python_version_nodot": python_version.replace(".", ""),
+            }
+        )
 
 
 def write_with_trailing_newline(path: Path, content: str) -> None:
     normalized = content if content.endswith("\n") else f"{content}\n"
-    path.write_text(normalized, encoding="utf-8")
+    with span(WRITE, str(path)) as extra:
+        extra["bytes"] = path.write_text(normalized, encoding="utf-8")
 
 
 def generate_jupyter_notebook(name: str, *, python_version: str = DEFAULT_PYTHON_VERSION) -> str:
@@ -142,6 +155,25 @@ def generate_jupyter_notebook(name: str, *, python_version: str = DEFAULT_PYTHON
 VALID_ARCHETYPES = ("script", "spark", "fastapi", "polars")
 
 
+def scaffold_env_files(
+    target: Path,
+    *,
+    name: str,
+    module_name: str,
+    archetype: str = "script",
+    python_version: str = DEFAULT_PYTHON_VERSION,
+) -> None:
+    """Write the files uv needs to create the environment: ``.python-version`` and ``pyproject.toml``."""
+    if archetype not in VALID_ARCHETYPES:
+        raise ValueError(f"Unknown archetype: {archetype!r}")
+    validate_python_version(python_version)
+    write_with_trailing_newline(target / ".python-version", python_version)
+    write_with_trailing_newline(
+        target / "pyproject.toml",
+        render_template("pyproject.toml.tpl", archetype=archetype, name=name, module_name=module_name, python_version=python_version),
+    )
+
+
 def scaffold_files(
     target: Path,
     *,
@@ -149,6 +181,7 @@ def scaffold_files(
     module_name: str,
     archetype: str = "script",
     python_version: str = DEFAULT_PYTHON_VERSION,
+    env_files: bool = True,
 ) -> None:
     if archetype not in VALID_ARCHETYPES:
         raise ValueError(f"Unknown archetype: {archetype!r}")
@@ -161,9 +194,9 @@ def scaffold_files(
     }
 
     # Shared files
-    write_with_trailing_newline(target / ".python-version", python_version)
+    if env_files:
+        scaffold_env_files(target, **template_vars)
     write_with_trailing_newline(target / ".gitignore", render_template("gitignore.tpl", **template_vars))
-    write_with_trailing_newline(target / "pyproject.toml", render_template("pyproject.toml.tpl", **template_vars))
     write_with_trailing_newline(target / "README.md", render_template("readme.md.tpl", **template_vars))
     write_with_trailing_newline(target / "main.py", render_template("main.py.tpl", **template_vars))
 
@@ -197,12 +230,14 @@ def _scaffold_spark(
     write_with_trailing_newline(pkg_dir / "_logging.py", render_template("_logging.py.tpl", **template_vars))
     write_with_trailing_newline(pkg_dir / "config.py", render_template("config.py.tpl", **template_vars))
     write_with_trailing_newline(pkg_dir / "session.py", render_template("session.py.tpl", **template_vars))
+    write_with_trailing_newline(pkg_dir / "cache.py", render_template("cache.py.tpl", **template_vars))
 
     # src/<module_name>/jobs/
     jobs_dir = pkg_dir / "jobs"
     jobs_dir.mkdir()
     write_with_trailing_newline(jobs_dir / "__init__.py", render_template("jobs_init.py.tpl", **template_vars))
     write_with_trailing_newline(jobs_dir / "example.py", render_template("example_job.py.tpl", **template_vars))
+    write_with_trailing_newline(jobs_dir / "vectorized.py", render_template("vectorized_job.py.tpl", **template_vars))
 
     # tests/
     tests_dir = target / "tests"
@@ -215,6 +250,11 @@ def _scaffold_spark(
     write_with_trailing_newline(notebooks_dir / "explore.ipynb", generate_jupyter_notebook(name, python_version=template_vars["python_version"]))
     write_with_trailing_newline(notebooks_dir / "explore_marimo.py", render_template("explore_marimo.py.tpl", **template_vars))
 
+    # benchmarks/
+    benchmarks_dir = target / "benchmarks"
+    benchmarks_dir.mkdir()
+    write_with_trailing_newline(benchmarks_dir / "udf.py", render_template("benchmarks/udf.py.tpl", **template_vars))
+
 
 def _scaffold_fastapi(
     target: Path,
@@ -259,27 +299,116 @@ def _scaffold_polars(
     write_with_trailing_newline(pkg_dir / "_logging.py", render_template("_logging.py.tpl", **template_vars))
     write_with_trailing_newline(pkg_dir / "_io.py", render_template("_io.py.tpl", **template_vars))
     write_with_trailing_newline(pkg_dir / "_db.py", render_template("_db.py.tpl", **template_vars))
+    write_with_trailing_newline(pkg_dir / "_delta.py", render_template("_delta.py.tpl", **template_vars))
+    write_with_trailing_newline(pkg_dir / "_ingest.py", render_template("_ingest.py.tpl", **template_vars))
     write_with_trailing_newline(pkg_dir / "config.py", render_template("config.py.tpl", **template_vars))
     write_with_trailing_newline(pkg_dir / "main.py", render_template("main.py.tpl", **template_vars))
 
     tests_dir = target / "tests"
     write_with_trailing_newline(tests_dir / "conftest.py", render_template("conftest.py.tpl", **template_vars))
     write_with_trailing_newline(tests_dir / "test_io.py", render_template("test_io.py.tpl", **template_vars))
+    write_with_trailing_newline(tests_dir / "test_db.py", render_template("test_db.py.tpl", **template_vars))
+    write_with_trailing_newline(tests_dir / "test_delta.py", render_template("test_delta.py.tpl", **template_vars))
+    write_with_trailing_newline(tests_dir / "test_ingest.py", render_template("test_ingest.py.tpl", **template_vars))
 
     notebooks_dir = target / "notebooks"
     notebooks_dir.mkdir()
     write_with_trailing_newline(notebooks_dir / "explore.py", render_template("notebooks/explore.py.tpl", **template_vars))
 
+    benchmarks_dir = target / "benchmarks"
+    benchmarks_dir.mkdir()
+    write_with_trailing_newline(benchmarks_dir / "run.py", render_template("benchmarks/run.py.tpl", **template_vars))
+
     (target / "data" / "raw").mkdir(parents=True)
     (target / "data" / "features").mkdir(parents=True)
 
 
-def run_uv_sync(target: Path) -> None:
+_OUTPUT_LOCK = threading.Lock()
+
+
+def run_prefixed(command: list[str], *, cwd: Path, prefix: str) -> int:
+    """Run *command*, echoing each line of its combined output to stderr as ``[prefix] line``.
+
+    Used when several subprocesses run concurrently so their output stays attributable.
+    """
+    with subprocess.Popen(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+        for line in proc.stdout or ():
+            with _OUTPUT_LOCK:
+                sys.stderr.write(f"[{prefix}] {line}")
+        return proc.wait()
+
+
+def run_command(command: list[str], *, cwd: Path, output_prefix: str | None) -> int:
+    with span(SUBPROCESS, " ".join(command)) as extra:
+        if output_prefix is not None:
+            extra["returncode"] = run_prefixed(command, cwd=cwd, prefix=output_prefix)
+        else:
+            extra["returncode"] = subprocess.run(command, cwd=cwd, check=False).returncode
+        return extra["returncode"]
+
+
+class UvSyncError(RuntimeError):
+    """``uv sync`` ran and exited non-zero (as opposed to uv being missing)."""
+
+    def __init__(self, returncode: int) -> None:
+        super().__init__(f"uv sync failed (exit {returncode})")
+        self.returncode = returncode
+
+
+def run_uv_sync(target: Path, *, output_prefix: str | None = None, sync_args: Sequence[str] = ()) -> None:
+    if shutil.which("uv") is None:
+        raise RuntimeError("uv not found in PATH. Install uv: https://docs.astral.sh/uv/")
+    returncode = run_command(["uv", "sync", *sync_args], cwd=target, output_prefix=output_prefix)
+    if returncode != 0:
+        raise UvSyncError(returncode)
+
+
+def scaffold_and_sync_pipelined(
+    target: Path,
+    *,
+    name: str,
+    module_name: str,
+    archetype: str = "script",
+    python_version: str = DEFAULT_PYTHON_VERSION,
+    output_prefix: str | None = None,
+    sync_args: Sequence[str] = (),
+) -> None:
+    """Scaffold *target* while uv builds its environment.
+
+    ``.python-version`` and ``pyproject.toml`` are written first and
+    ``uv sync --no-install-project`` starts in the background to fetch the
+    interpreter and dependencies. The remaining files are written meanwhile,
+    then a final ``uv sync`` installs the project itself. A failure in either
+    half waits for the other to finish before being raised, so callers can
+    clean up safely.
+    """
     if shutil.which("uv") is None:
         raise RuntimeError("uv not found in PATH. Install uv: https://docs.astral.sh/uv/")
-    result = subprocess.run(["uv", "sync"], cwd=target, check=False)
-    if result.returncode != 0:
-        raise RuntimeError(f"uv sync failed (exit {result.returncode})")
+    scaffold_env_files(target, name=name, module_name=module_name, archetype=archetype, python_version=python_version)
+    ctx = copy_context()
+
+    def sync_env() -> int:
+        return ctx.run(run_command, ["uv", "sync", "--no-install-project", *sync_args], cwd=target, output_prefix=output_prefix)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        env_sync = pool.submit(sync_env)
+        scaffold_files(target, name=name, module_name=module_name, archetype=archetype, python_version=python_version, env_files=False)
+        returncode = env_sync.result()
+    if returncode != 0:
+        raise UvSyncError(returncode)
+    run_uv_sync(target, output_prefix=output_prefix, sync_args=sync_args)
+
+
+def lock_cache_key(*, archetype: str, python_version: str) -> str:
+    """Hash the archetype's ``pyproject.toml`` rendered with placeholder names (see ``nuv._lockcache``)."""
+    normalized = render_template(
+        "pyproject.toml.tpl",
+        archetype=archetype,
+        name=_lockcache.PROJECT_SENTINEL,
+        module_name=_lockcache.PROJECT_SENTINEL,
+        python_version=python_version,
+    )
+    return _lockcache.lock_key(f"{archetype}\n{normalized}")
 
 
 def build_tool_install_command(target: Path) -> list[str]:
@@ -299,9 +428,9 @@ def run_tool_install(target: Path, *, mode: str) -> None:
 
     if shutil.which("uv") is None:
         raise RuntimeError("uv not found in PATH. Install uv: https://docs.astral.sh/uv/")
-    result = subprocess.run(command, cwd=target, check=False)
-    if result.returncode != 0:
-        raise RuntimeError(f"uv tool install failed (exit {result.returncode})")
+    returncode = run_command(command, cwd=target, output_prefix=None)
+    if returncode != 0:
+        raise RuntimeError(f"uv tool install failed (exit {returncode})")
     log.info("installed tool in editable mode at %s", target)
 
 
@@ -312,6 +441,172 @@ def resolve_target(name: str, *, at: str | None, cwd: Path) -> Path:
     return target
 
 
+def _nuv_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("nuv")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def report_timings(
+    recorder: Recorder,
+    *,
+    target: Path | None,
+    build_dir: Path | None = None,
+    total_seconds: float,
+    show: bool,
+    json_path: str | None,
+    **meta: object,
+) -> None:
+    """Print *recorder* as a table on stderr and/or write it as JSON to *json_path*."""
+    if show:
+        sys.stderr.write(recorder.format_table(total_seconds=total_seconds))
+    if json_path is None:
+        return
+    data = recorder.to_dict(nuv_version=_nuv_version(), target=str(target) if target else None, total_seconds=total_seconds, **meta)
+    roots = [root for root in (target, build_dir) if root is not None]
+    for write in data["writes"]:
+        path = Path(write["path"])
+        for root in roots:
+            if path.is_relative_to(root):
+                write["path"] = path.relative_to(root).as_posix()
+                break
+    try:
+        Path(json_path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    except OSError as exc:
+        log.warning("Could not write timings to %s: %s", json_path, exc)
+
+
+def create_staging_dir(target: Path) -> Path:
+    """Create an empty sibling of *target* (same filesystem) to scaffold into before publishing."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.parent / f".{target.name}.nuv-staging-{secrets.token_hex(4)}"
+    staging.mkdir()
+    return staging
+
+
+def publish(staging: Path, target: Path) -> None:
+    """Atomically move a fully scaffolded *staging* directory to *target*.
+
+    ``os.rename`` silently replaces an existing empty directory, so *target* is
+    first claimed with an exclusive ``mkdir`` and only that placeholder, which
+    nuv owns, is replaced.
+    """
+    try:
+        target.mkdir()
+    except FileExistsError as exc:
+        raise ValueError(f"Directory already exists: {target}") from exc
+    try:
+        os.rename(staging, target)
+    except OSError as exc:
+        # Something was written into the placeholder in the meantime; it is no longer ours to remove.
+        raise ValueError(f"Directory already exists: {target}") from exc
+
+
+def discard_in_background(path: Path) -> None:
+    """Hide *path* with an atomic rename, then delete it from a detached process.
+
+    Large synced ``.venv`` trees take a while to remove; renaming first makes the
+    directory disappear immediately for file watchers and lets nuv exit without
+    waiting for the deletion.
+    """
+    trash = path.with_name(f".{path.name}.nuv-trash-{secrets.token_hex(4)}")
+    try:
+        os.rename(path, trash)
+        subprocess.Popen(
+            [sys.executable, "-c", "import shutil, sys; shutil.rmtree(sys.argv[1], ignore_errors=True)", str(trash)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        shutil.rmtree(trash if trash.exists() else path, ignore_errors=True)
+
+
+def _scaffold_and_sync(
+    target: Path,
+    *,
+    build_dir: Path,
+    name: str,
+    module_name: str,
+    archetype: str,
+    python_version: str,
+    output_prefix: str | None,
+    pipeline: bool,
+    lock_cache: bool,
+    offline: bool,
+    on_published: Callable[[], None],
+) -> None:
+    sync_args = ["--offline"] if offline else []
+    lock_key = lock_cache_key(archetype=archetype, python_version=python_version) if lock_cache else None
+    restored = lock_key is not None and _lockcache.restore(lock_key, build_dir, name=name)
+    if restored:
+        sync_args.insert(0, "--frozen")
+    try:
+        if pipeline:
+            with span(PHASE, "scaffold + uv sync"):
+                scaffold_and_sync_pipelined(
+                    target,
+                    name=name,
+                    module_name=module_name,
+                    archetype=archetype,
+                    python_version=python_version,
+                    output_prefix=output_prefix,
+                    sync_args=sync_args,
+                )
+        else:
+            with span(PHASE, "scaffold"):
+                scaffold_files(
+                    build_dir,
+                    name=name,
+                    module_name=module_name,
+                    archetype=archetype,
+                    python_version=python_version,
+                )
+            if build_dir != target:
+                with span(PHASE, "publish"):
+                    publish(build_dir, target)
+                on_published()
+            with span(PHASE, "uv sync"):
+                run_uv_sync(target, output_prefix=output_prefix, sync_args=sync_args)
+    except UvSyncError:
+        if not restored or lock_key is None:
+            raise
+        # Only blame the cached lock if uv can sync once it is allowed to re-resolve;
+        # otherwise the failure (network, offline cache miss, ...) is unrelated.
+        log.warning("uv sync --frozen failed with cached uv.lock %s; retrying with a fresh resolution", lock_key[:12])
+        (target / "uv.lock").unlink(missing_ok=True)
+        with span(PHASE, "uv sync (re-resolve)"):
+            run_uv_sync(target, output_prefix=output_prefix, sync_args=[arg for arg in sync_args if arg != "--frozen"])
+        log.warning("discarding cached uv.lock %s: it could not be synced", lock_key[:12])
+        _lockcache.evict(lock_key)
+        restored = False
+    if lock_key is not None and not restored:
+        _lockcache.store(lock_key, target)
+
+
+def _roll_back(build_dir: Path, target: Path, *, keep: bool, published: bool) -> None:
+    if build_dir == target:
+        if not keep:
+            shutil.rmtree(target, ignore_errors=True)
+        return
+    # Staged: *target* is only ours once publish() has succeeded; before that it
+    # may belong to another process that created it first.
+    if published:
+        if not keep:
+            discard_in_background(target)
+        return
+    if keep:
+        with suppress(ValueError):
+            publish(build_dir, target)
+        return
+    if build_dir.exists():
+        discard_in_background(build_dir)
+
+
 def run_new(
     name: str,
     *,
@@ -321,32 +616,75 @@ def run_new(
     python_version: str | None = None,
     install_mode: str = "command-only",
     keep_on_failure: bool = False,
+    output_prefix: str | None = None,
+    pipeline: bool = False,
+    timings: bool = False,
+    timings_json: str | None = None,
+    lock_cache: bool = False,
+    offline: bool = False,
+    stage: bool = False,
 ) -> int:
     if python_version is None:
         python_version = DEFAULT_PYTHON_VERSIONS.get(archetype, DEFAULT_PYTHON_VERSION)
     if cwd is None:
         cwd = Path.cwd()
     target: Path | None = None
-    created_target = False
-    try:
-        validated = validate_name(name)
-        target = resolve_target(validated, at=at, cwd=cwd)
-        module_name = validated.replace("-", "_")
-        target.mkdir(parents=True)
-        created_target = True
-        scaffold_files(
-            target,
-            name=validated,
-            module_name=module_name,
+    build_dir: Path | None = None
+    published = False
+
+    def _mark_published() -> None:
+        nonlocal published
+        published = True
+
+    status = 0
+    start = time.perf_counter()
+    with recording() if timings or timings_json else nullcontext() as recorder:
+        try:
+            with span(PHASE, "validate"):
+                validated = validate_name(name)
+                target = resolve_target(validated, at=at, cwd=cwd)
+                module_name = validated.replace("-", "_")
+                if stage and pipeline:
+                    raise ValueError("Staged creation cannot be combined with pipelined sync.")
+            if stage:
+                build_dir = create_staging_dir(target)
+            else:
+                target.mkdir(parents=True)
+                build_dir = target
+            _scaffold_and_sync(
+                target,
+                build_dir=build_dir,
+                name=validated,
+                module_name=module_name,
+                archetype=archetype,
+                python_version=python_version,
+                output_prefix=output_prefix,
+                pipeline=pipeline,
+                lock_cache=lock_cache,
+                offline=offline,
+                on_published=_mark_published,
+            )
+            with span(PHASE, "uv tool install"):
+                run_tool_install(target, mode=install_mode)
+        except (ValueError, RuntimeError, FileNotFoundError) as exc:
+            if build_dir is not None and target is not None:
+                _roll_back(build_dir, target, keep=keep_on_failure, published=published)
+            log.error("%s", exc)
+            status = 1
+    if recorder is not None:
+        report_timings(
+            recorder,
+            target=target if build_dir is not None else None,
+            build_dir=build_dir,
+            show=timings,
+            json_path=timings_json,
+            name=name,
             archetype=archetype,
             python_version=python_version,
+            pipeline=pipeline,
+            exit_code=status,
+            total_seconds=time.perf_counter() - start,
         )
-        run_uv_sync(target)
-        run_tool_install(target, mode=install_mode)
-    except (ValueError, RuntimeError, FileNotFoundError) as exc:
-        if created_target and target is not None and not keep_on_failure:
-            shutil.rmtree(target, ignore_errors=True)
-        log.error("%s", exc)
-        return 1
-    log.info("created %s/", target)
-    return 0
+    if status == 0:
+        log.info("created %s/", target)
+    return status
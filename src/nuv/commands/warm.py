@@ -0,0 +1,123 @@
+"""Pre-populate uv's caches so later ``nuv new`` runs are cache hits.
+
+For each (archetype, python_version) pair, the archetype's ``pyproject.toml``
+is rendered into a throwaway directory and ``uv sync --all-groups
+--no-install-project`` downloads every dependency group (including ``dev`` and
+``notebooks``) into uv's cache. The throwaway environment is discarded.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from nuv import _lockcache
+from nuv._templates import warm as warm_templates
+from nuv.commands.new import (
+    DEFAULT_PYTHON_VERSION,
+    DEFAULT_PYTHON_VERSIONS,
+    VALID_ARCHETYPES,
+    lock_cache_key,
+    run_command,
+    scaffold_env_files,
+    validate_python_version,
+)
+
+log = logging.getLogger(__name__)
+
+WARM_PROJECT_NAME = "nuv-warm"
+
+
+def uv_cache_dir() -> Path | None:
+    result = subprocess.run(["uv", "cache", "dir"], capture_output=True, text=True, check=False)
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return Path(result.stdout.strip())
+
+
+def directory_size(root: Path | None) -> int:
+    if root is None or not root.is_dir():
+        return 0
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{size} B" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def warm_one(archetype: str, python_version: str, *, install_python: bool, lock_cache: bool) -> None:
+    """Download every dependency group for one archetype/version into uv's cache."""
+    with tempfile.TemporaryDirectory(prefix=f"nuv-warm-{archetype}-") as tmp:
+        target = Path(tmp)
+        module_name = WARM_PROJECT_NAME.replace("-", "_")
+        scaffold_env_files(target, name=WARM_PROJECT_NAME, module_name=module_name, archetype=archetype, python_version=python_version)
+        if install_python:
+            returncode = run_command(["uv", "python", "install", python_version], cwd=target, output_prefix=None)
+            if returncode != 0:
+                raise RuntimeError(f"uv python install {python_version} failed (exit {returncode})")
+        returncode = run_command(["uv", "sync", "--all-groups", "--no-install-project"], cwd=target, output_prefix=None)
+        if returncode != 0:
+            raise RuntimeError(f"uv sync failed (exit {returncode})")
+        if lock_cache:
+            _lockcache.store(lock_cache_key(archetype=archetype, python_version=python_version), target)
+
+
+def run_warm(
+    *,
+    archetypes: Sequence[str] | None = None,
+    python_versions: Sequence[str] | None = None,
+    install_python: bool = False,
+    lock_cache: bool = False,
+) -> int:
+    try:
+        for archetype in archetypes or ():
+            if archetype not in VALID_ARCHETYPES:
+                raise ValueError(f"Unknown archetype: {archetype!r}")
+        for python_version in python_versions or ():
+            validate_python_version(python_version)
+        if shutil.which("uv") is None:
+            raise RuntimeError("uv not found in PATH. Install uv: https://docs.astral.sh/uv/")
+    except (ValueError, RuntimeError) as exc:
+        log.error("%s", exc)
+        return 1
+
+    selected = tuple(archetypes or VALID_ARCHETYPES)
+    warm_templates(selected)
+    cache = uv_cache_dir()
+    rows: list[tuple[str, str, str, float, int]] = []
+    failed = 0
+    for archetype in selected:
+        for python_version in python_versions or (DEFAULT_PYTHON_VERSIONS.get(archetype, DEFAULT_PYTHON_VERSION),):
+            before = directory_size(cache)
+            start = time.perf_counter()
+            status = "ok"
+            try:
+                warm_one(archetype, python_version, install_python=install_python, lock_cache=lock_cache)
+            except (ValueError, RuntimeError, FileNotFoundError) as exc:
+                log.error("%s %s: %s", archetype, python_version, exc)
+                status = "failed"
+                failed += 1
+            rows.append((archetype, python_version, status, time.perf_counter() - start, directory_size(cache) - before))
+
+    lines = [f"{'archetype':<10} {'python':<7} {'status':<7} {'seconds':>9} {'downloaded':>12}"]
+    lines.extend(f"{a:<10} {v:<7} {st:<7} {sec:>9.2f} {_format_bytes(size):>12}" for a, v, st, sec, size in rows)
+    lines.append(f"{'total':<10} {'':<7} {'':<7} {sum(r[3] for r in rows):>9.2f} {_format_bytes(sum(r[4] for r in rows)):>12}")
+    sys.stderr.write("\n".join(lines) + "\n")
+    return 1 if failed else 0
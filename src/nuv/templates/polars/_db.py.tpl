@@ -1,6 +1,84 @@
+"""DuckDB access for Polars code.
+
+One connection per process is opened lazily from ``Settings`` and shared; each
+thread queries through its own cursor, as DuckDB connections are not
+thread-safe. Frames registered with ``register`` are visible to the calling
+thread's cursor only. Results are converted through Arrow, which needs
+``pyarrow``.
+"""
+
+import threading
+from pathlib import Path
+
 import duckdb
 import polars as pl
 
+from {module_name}.config import Settings
+
+_lock = threading.Lock()
+_local = threading.local()
+_connection: duckdb.DuckDBPyConnection | None = None
+_settings: Settings | None = None
+
+
+def database_path(settings: Settings) -> str:
+    if settings.duckdb_database == ":memory:":
+        return ":memory:"
+    return str(settings.data_root / settings.duckdb_database)
+
+
+def connection(settings: Settings | None = None) -> duckdb.DuckDBPyConnection:
+    """Return the shared connection, opening it from *settings* on first use.
+
+    Raises ``ValueError`` if it is already open with different settings; ``close()`` it first.
+    """
+    global _connection, _settings
+    with _lock:
+        if _connection is not None and settings is not None and settings != _settings:
+            raise ValueError("The shared DuckDB connection is already open with different settings; call close() first")
+        if _connection is None:
+            settings = settings or Settings()
+            path = database_path(settings)
+            if path != ":memory:":
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            config: dict[str, str | float | list[str]] = {{}}  # the value type duckdb.connect declares
+            if settings.duckdb_threads is not None:
+                config["threads"] = settings.duckdb_threads
+            if settings.duckdb_memory_limit is not None:
+                config["memory_limit"] = settings.duckdb_memory_limit
+            _connection = duckdb.connect(path, config=config)
+            _settings = settings
+        return _connection
+
+
+def cursor() -> duckdb.DuckDBPyConnection:
+    """Return this thread's cursor on the shared connection."""
+    shared = connection()
+    if getattr(_local, "owner", None) is not shared:
+        _local.cursor = shared.cursor()
+        _local.owner = shared
+    return _local.cursor
+
+
+def close() -> None:
+    """Close the shared connection; the next query reopens it from ``Settings``."""
+    global _connection, _settings
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+            _settings = None
+
+
+def register(name: str, frame: pl.DataFrame | pl.LazyFrame) -> None:
+    """Expose *frame* to SQL as view *name* without copying it into DuckDB."""
+    cursor().register(name, frame)
+
+
+def unregister(name: str) -> None:
+    cursor().unregister(name)
+
 
-def sql(query: str) -> pl.DataFrame:
-    return duckdb.sql(query).pl()
\ No newline at end of file
+def sql(query: str, params: list | dict | None = None) -> pl.DataFrame:
+    """Run *query* and return the result as a Polars DataFrame built from DuckDB's Arrow output."""
+    return cursor().execute(query, params).pl()
@@ -0,0 +1,55 @@
+"""Maintenance for Delta tables written by ``_io.write_delta``.
+
+Appending small batches leaves a table with many small files, and every read
+has to open them all. ``compact`` rewrites them into fewer, larger files;
+``z_order`` does the same while clustering rows by the given columns so that
+filters on them skip more files; ``vacuum`` deletes the files that are no
+longer referenced once they are older than the retention period.
+"""
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from deltalake import DeltaTable
+
+DEFAULT_RETENTION_HOURS = 168
+
+
+def file_count(path: str | Path) -> int:
+    """Number of data files in the table's current version."""
+    return len(DeltaTable(path).file_uris())
+
+
+def compact(path: str | Path, *, target_size: int | None = None, partition_filters: list[tuple[str, str, Any]] | None = None) -> dict[str, Any]:
+    """Bin-pack small files into files of about *target_size* bytes; return deltalake's metrics."""
+    return DeltaTable(path).optimize.compact(target_size=target_size, partition_filters=partition_filters)
+
+
+def z_order(
+    path: str | Path,
+    columns: Sequence[str],
+    *,
+    target_size: int | None = None,
+    partition_filters: list[tuple[str, str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Rewrite the table clustered by *columns*; return deltalake's metrics."""
+    if not columns:
+        raise ValueError("z_order needs at least one column")
+    return DeltaTable(path).optimize.z_order(list(columns), target_size=target_size, partition_filters=partition_filters)
+
+
+def vacuum(
+    path: str | Path,
+    *,
+    retention_hours: int = DEFAULT_RETENTION_HOURS,
+    dry_run: bool = False,
+    enforce_retention_duration: bool = True,
+) -> list[str]:
+    """Delete unreferenced files older than *retention_hours*; return their paths.
+
+    Retention below the table's minimum (7 days by default) is refused unless
+    *enforce_retention_duration* is False, since readers of older versions may
+    still need those files.
+    """
+    return DeltaTable(path).vacuum(retention_hours=retention_hours, dry_run=dry_run, enforce_retention_duration=enforce_retention_duration)
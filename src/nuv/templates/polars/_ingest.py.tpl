@@ -0,0 +1,121 @@
+"""Convert large CSV/NDJSON files into partitioned Parquet in bounded memory.
+
+The source is scanned lazily and collected in batches by the streaming engine,
+so at most one batch is held in memory. Each batch is written as its own
+``part-NNNNN.parquet`` file (per partition when ``partition_by`` is given),
+producing the same hive layout that ``_io.scan_partitioned`` reads. Partition
+values are percent-encoded in directory names, as Hive and Polars expect.
+
+JSON input must be newline-delimited (``.ndjson``/``.jsonl``): a JSON array
+cannot be parsed incrementally. Convert one with ``jq -c '.[]'`` first.
+"""
+
+import re
+import shutil
+import tempfile
+import time
+import urllib.parse
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import polars as pl
+
+from {module_name}._io import scan
+
+COMPRESSIONS = ("lz4", "uncompressed", "snappy", "gzip", "brotli", "zstd")
+HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+MARKER = "_INGESTED"
+SAMPLE_ROWS = 1_000
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*$", re.IGNORECASE)
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte size such as ``512MB``, ``2GiB`` or ``1048576``."""
+    match = _SIZE.match(text)
+    if match is None:
+        raise ValueError(f"Invalid size: {{text!r}}")
+    number, unit = match.groups()
+    return int(float(number) * 1024 ** "_KMGT".index(unit.upper() or "_"))
+
+
+def rows_per_batch(lf: pl.LazyFrame, *, batch_size: int, max_memory: int | None) -> int:
+    """Cap *batch_size* so one batch stays within *max_memory*, estimated from a sample of rows."""
+    if max_memory is None:
+        return batch_size
+    sample = lf.head(SAMPLE_ROWS).collect()
+    if sample.height == 0:
+        return batch_size
+    row_bytes = max(1, int(sample.estimated_size()) // sample.height)
+    return max(1, min(batch_size, max_memory // row_bytes))
+
+
+def _partition_dir(out: Path, columns: Sequence[str], key: tuple) -> Path:
+    for column, value in zip(columns, key, strict=True):
+        encoded = HIVE_NULL if value is None else urllib.parse.quote(str(value), safe="")
+        out = out / f"{{column}}={{encoded}}"
+    return out
+
+
+def _check_replaceable(out: Path) -> None:
+    if out.exists() and not (out.is_dir() and ((out / MARKER).is_file() or not any(out.iterdir()))):
+        raise ValueError(f"Refusing to replace {{out}}: it is not empty and was not written by ingest")
+
+
+def ingest(
+    source: str | Path,
+    out: str | Path,
+    *,
+    partition_by: Sequence[str] = (),
+    batch_size: int = 100_000,
+    max_memory: int | None = None,
+    compression: str = "zstd",
+    progress: Callable[[int, float], None] | None = None,
+) -> int:
+    """Write *source* to the Parquet dataset *out* batch by batch; return the number of rows.
+
+    Parts are written to a fresh sibling directory that replaces *out* once every
+    batch is written, so a rerun never mixes in the previous run's files and a
+    failed run leaves the previous output untouched. Only an empty directory or a
+    previous ingest output (marked by a ``_INGESTED`` file) is replaced; anything
+    else raises ``ValueError``.
+
+    *progress* is called after every batch with the rows written so far and the
+    elapsed seconds.
+    """
+    out = Path(out).resolve()
+    _check_replaceable(out)
+    if Path(source).name.lower().endswith((".json", ".json.gz", ".json.zst")):
+        raise ValueError("JSON arrays can't be ingested in bounded memory; convert to NDJSON (e.g. jq -c '.[]') first")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression {{compression!r}}; expected one of {{', '.join(COMPRESSIONS)}}")
+    lf = scan(source)
+    missing = [column for column in partition_by if column not in lf.collect_schema()]
+    if missing:
+        raise ValueError(f"Unknown partition columns: {{missing}}")
+    size = rows_per_batch(lf, batch_size=batch_size, max_memory=max_memory)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=out.parent, prefix=f".{{out.name}}.ingest-"))
+    start = time.perf_counter()
+    rows = 0
+    try:
+        for index, batch in enumerate(lf.collect_batches(chunk_size=size, engine="streaming")):
+            name = f"part-{{index:05d}}.parquet"
+            if partition_by:
+                for key, part in batch.partition_by(list(partition_by), as_dict=True, include_key=False).items():
+                    directory = _partition_dir(staging, partition_by, key)
+                    directory.mkdir(parents=True, exist_ok=True)
+                    part.write_parquet(directory / name, compression=compression)
+            else:
+                batch.write_parquet(staging / name, compression=compression)
+            rows += batch.height
+            if progress is not None:
+                progress(rows, time.perf_counter() - start)
+        (staging / MARKER).touch()
+        _check_replaceable(out)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    if out.exists():
+        shutil.rmtree(out)
+    staging.rename(out)
+    return rows
@@ -1,7 +1,28 @@
+import glob
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Literal, overload
 
 import polars as pl
 
+from {module_name}.config import Settings
+
+IPC_SUFFIXES = (".arrow", ".ipc", ".feather")
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+COMPRESSED_SUFFIXES = {{".gz": "gzip", ".zst": "zstd"}}
+
+
+def _format_of(path: Path) -> tuple[str, str | None]:
+    """Return the format suffix of *path* and the codec implied by a trailing ``.gz``/``.zst``."""
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if len(suffixes) > 1 and suffixes[-1] in COMPRESSED_SUFFIXES:
+        return suffixes[-2], COMPRESSED_SUFFIXES[suffixes[-1]]
+    return path.suffix.lower(), None
+
 
 def read_csv(path: str | Path, **kwargs) -> pl.DataFrame:
     return pl.read_csv(path, **kwargs)
@@ -19,20 +40,272 @@ def read_json(path: str | Path, **kwargs) -> pl.DataFrame:
     return pl.read_json(path, **kwargs)
 
 
-def write(df: pl.DataFrame, path: str | Path, **kwargs) -> None:
+def read_ndjson(path: str | Path, **kwargs) -> pl.DataFrame:
+    return pl.read_ndjson(path, **kwargs)
+
+
+def read_ipc(path: str | Path, **kwargs) -> pl.DataFrame:
+    """Read an Arrow IPC (Feather v2) file; uncompressed local files are memory-mapped, not deserialised."""
+    return pl.read_ipc(path, **kwargs)
+
+
+def scan_csv(path: str | Path, **kwargs) -> pl.LazyFrame:
+    return pl.scan_csv(path, **kwargs)
+
+
+def scan_parquet(path: str | Path, **kwargs) -> pl.LazyFrame:
+    return pl.scan_parquet(path, **kwargs)
+
+
+def scan_delta(path: str | Path, **kwargs) -> pl.LazyFrame:
+    return pl.scan_delta(path, **kwargs)
+
+
+def scan_ndjson(path: str | Path, **kwargs) -> pl.LazyFrame:
+    # A JSON array can't be read incrementally; use newline-delimited JSON for lazy scans.
+    return pl.scan_ndjson(path, **kwargs)
+
+
+def scan_ipc(path: str | Path, **kwargs) -> pl.LazyFrame:
+    return pl.scan_ipc(path, **kwargs)
+
+
+def sink(lf: pl.LazyFrame, path: str | Path, *, compression: str | None = None, **kwargs) -> None:
+    """Stream *lf* to *path* without materialising it in memory; the format follows the suffix.
+
+    *compression* is passed to the format's writer (see ``write``).
+    """
+    path = Path(path)
+    suffix, implied = _format_of(path)
+    kwargs.setdefault("engine", "streaming")
+    if compression or implied:
+        kwargs["compression"] = compression or implied
+    if suffix == ".parquet":
+        lf.sink_parquet(path, **kwargs)
+    elif suffix == ".csv":
+        lf.sink_csv(path, **kwargs)
+    elif suffix in NDJSON_SUFFIXES:
+        lf.sink_ndjson(path, **kwargs)
+    elif suffix in IPC_SUFFIXES:
+        lf.sink_ipc(path, **kwargs)
+    else:
+        raise ValueError(f"Unsupported format: {{suffix}}")
+
+
+_SCANNERS: dict[str, Callable[..., pl.LazyFrame]] = {{
+    ".csv": scan_csv,
+    ".parquet": scan_parquet,
+    **dict.fromkeys(NDJSON_SUFFIXES, scan_ndjson),
+    **dict.fromkeys(IPC_SUFFIXES, scan_ipc),
+}}
+
+
+def scan(path: str | Path, **kwargs) -> pl.LazyFrame:
+    """Lazily scan *path*, choosing the reader from its suffix or directory layout."""
     path = Path(path)
-    suffix = path.suffix.lower()
+    if path.is_dir():
+        return scan_delta(path, **kwargs) if (path / "_delta_log").is_dir() else scan_partitioned(path, **kwargs)
+    suffix, _ = _format_of(path)
+    scanner = _SCANNERS.get(suffix)
+    if scanner is None:
+        raise ValueError(f"Unsupported format: {{suffix}}")
+    return scanner(path, **kwargs)
+
+
+def expand(pattern: str | Path) -> list[Path]:
+    """Return the files matching *pattern* (a glob, a directory, or a single file) in sorted order."""
+    pattern = Path(pattern)
+    if pattern.is_dir():
+        paths = sorted(p for p in pattern.iterdir() if p.is_file() and not p.name.startswith((".", "_")))
+    else:
+        paths = sorted(Path(p) for p in glob.glob(str(pattern), recursive=True))
+    if not paths:
+        raise FileNotFoundError(f"No files match {{pattern}}")
+    return paths
+
+
+@overload
+def _combine(frames: list[pl.DataFrame], paths: list[Path], on_drift: Literal["union", "error"]) -> pl.DataFrame: ...
+@overload
+def _combine(frames: list[pl.LazyFrame], paths: list[Path], on_drift: Literal["union", "error"]) -> pl.LazyFrame: ...
+def _combine(frames: list, paths: list[Path], on_drift: Literal["union", "error"]) -> pl.DataFrame | pl.LazyFrame:
+    if on_drift == "error":
+        expected = frames[0].collect_schema()
+        for path, frame in zip(paths[1:], frames[1:], strict=True):
+            schema = frame.collect_schema()
+            if schema != expected:
+                raise ValueError(f"Schema drift in {{path}}: expected {{dict(expected)}}, got {{dict(schema)}}")
+        return pl.concat(frames, how="vertical")
+    # Missing columns become null; differing dtypes are widened to a common supertype.
+    return pl.concat(frames, how="diagonal_relaxed")
+
+
+def read_many(
+    pattern: str | Path,
+    *,
+    max_workers: int = 8,
+    on_drift: Literal["union", "error"] = "union",
+    **kwargs,
+) -> pl.DataFrame:
+    """Read every file matching *pattern* on a thread pool and concatenate them.
+
+    With ``on_drift="union"`` files may have different columns or dtypes; with
+    ``"error"`` the first file whose schema differs raises ``ValueError``.
+    JSON arrays are supported here (but not by ``scan_many``).
+    """
+    paths = expand(pattern)
+
+    def read_one(path: Path) -> pl.DataFrame:
+        return read_json(path, **kwargs) if _format_of(path)[0] == ".json" else scan(path, **kwargs).collect()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        frames = list(pool.map(read_one, paths))
+    return _combine(frames, paths, on_drift)
+
+
+def scan_many(pattern: str | Path, *, on_drift: Literal["union", "error"] = "union", **kwargs) -> pl.LazyFrame:
+    """Lazily scan every file matching *pattern* as one LazyFrame.
+
+    With ``on_drift="error"`` same-format files go to Polars' native multi-file
+    scan, the fastest path, which fails at collect time if a file's schema
+    differs. With ``"union"`` each file is scanned separately and concatenated
+    as in ``read_many``, which tolerates drift but resolves every file's schema.
+    """
+    paths = expand(pattern)
+    formats = {{_format_of(path)[0] for path in paths}}
+    if on_drift == "error" and len(formats) == 1 and (scanner := _SCANNERS.get(formats.pop())):
+        return scanner(paths, **kwargs)
+    return _combine([scan(path, **kwargs) for path in paths], paths, on_drift)
+
+
+def fingerprint(path: str | Path) -> str:
+    """Identify the current contents of *path* (a file or a dataset directory) by name, size, and mtime."""
+    path = Path(path).resolve()
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    digest = hashlib.sha256()
+    for file in files:
+        stat = file.stat()
+        digest.update(f"{{file}}\0{{stat.st_size}}\0{{stat.st_mtime_ns}}\n".encode())
+    return digest.hexdigest()
+
+
+def cached(
+    path: str | Path,
+    query: Callable[[pl.LazyFrame], pl.LazyFrame] | None = None,
+    *,
+    settings: Settings | None = None,
+) -> pl.DataFrame:
+    """Return ``query(scan(path)).collect()``, memoised on disk as Arrow IPC.
+
+    The key covers the input's fingerprint and the query plan, so editing the
+    file or the query misses. Hits are memory-mapped rather than re-parsed.
+    Entries live in ``data_root/cache`` and the least recently used are evicted
+    once they exceed ``Settings.cache_max_bytes``.
+    """
+    settings = settings or Settings()
+    lf = scan(path)
+    if query is not None:
+        lf = query(lf)
+    # The serialized plan describes the query without reading the data.
+    key = hashlib.sha256(fingerprint(path).encode() + lf.serialize()).hexdigest()
+    cache_dir = settings.data_root / "cache"
+    entry = cache_dir / f"{{key}}.arrow"
+    if entry.exists():
+        os.utime(entry)
+        return pl.read_ipc(entry)
+    df = lf.collect()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    # Uncompressed IPC so hits can be memory-mapped.
+    df.write_ipc(tmp, compression="uncompressed")
+    os.replace(tmp, entry)
+    evict_cache(settings, keep=entry)
+    return df
+
+
+def evict_cache(settings: Settings | None = None, *, keep: Path | None = None) -> int:
+    """Delete least recently used cache entries until the cache fits its byte budget; return bytes freed."""
+    settings = settings or Settings()
+    entries = [(p, p.stat()) for p in (settings.data_root / "cache").glob("*.arrow")]
+    entries.sort(key=lambda item: item[1].st_mtime_ns)
+    total = sum(stat.st_size for _, stat in entries)
+    freed = 0
+    for entry, stat in entries:
+        if total - freed <= settings.cache_max_bytes:
+            break
+        if entry == keep:
+            continue
+        entry.unlink(missing_ok=True)
+        freed += stat.st_size
+    return freed
+
+
+def write(df: pl.DataFrame, path: str | Path, *, compression: str | None = None, **kwargs) -> None:
+    """Write *df* to *path* in the format named by its suffix.
+
+    *compression* picks the codec for that format: ``zstd``, ``lz4``, ``snappy``, ``gzip``,
+    ``brotli`` or ``uncompressed`` for Parquet; ``uncompressed``, ``lz4`` or ``zstd`` for
+    Arrow IPC (only uncompressed files can be memory-mapped); ``gzip`` or ``zstd`` for CSV
+    and NDJSON, implied by a ``.gz``/``.zst`` suffix such as ``events.ndjson.zst``.
+    ``None`` keeps Polars' default for the format.
+    """
+    path = Path(path)
+    suffix, implied = _format_of(path)
+    if compression or implied:
+        kwargs["compression"] = compression or implied
     if suffix == ".csv":
         df.write_csv(path, **kwargs)
     elif suffix == ".parquet":
         df.write_parquet(path, **kwargs)
     elif suffix == ".json":
         df.write_json(path, **kwargs)
+    elif suffix in NDJSON_SUFFIXES:
+        df.write_ndjson(path, **kwargs)
+    elif suffix in IPC_SUFFIXES:
+        df.write_ipc(path, **kwargs)
     else:
         raise ValueError(f"Unsupported format: {{suffix}}")
 
 
-def write_delta(df: pl.DataFrame, path: str | Path, mode: str = "overwrite", **kwargs) -> None:
+def write_partitioned(
+    df: pl.DataFrame,
+    root: str | Path,
+    partition_by: str | list[str],
+    *,
+    compression: Literal["lz4", "uncompressed", "snappy", "gzip", "brotli", "zstd"] = "zstd",
+    row_group_size: int = 512 * 1024,
+    file_size_bytes: int = 256 * 1024 * 1024,
+    **kwargs,
+) -> None:
+    """Write *df* as a hive-partitioned Parquet dataset (``root/col=value/...``).
+
+    ``file_size_bytes`` is the approximate in-memory size at which a partition is
+    split into another file; ``row_group_size`` is in rows.
+    """
+    df.write_parquet(
+        root,
+        partition_by=partition_by,
+        compression=compression,
+        row_group_size=row_group_size,
+        partition_chunk_size_bytes=file_size_bytes,
+        **kwargs,
+    )
+
+
+def scan_partitioned(root: str | Path, **kwargs) -> pl.LazyFrame:
+    """Lazily scan a dataset written by ``write_partitioned``.
+
+    Filters on partition columns are resolved from the directory names, so only
+    the matching partitions' files are opened.
+    """
+    kwargs.setdefault("hive_partitioning", True)
+    return pl.scan_parquet(root, **kwargs)
+
+
+def write_delta(df: pl.DataFrame, path: str | Path, mode: str = "overwrite", partition_by: str | list[str] | None = None, **kwargs) -> None:
+    if partition_by is not None:
+        kwargs["delta_write_options"] = {{**kwargs.get("delta_write_options", {{}}), "partition_by": partition_by}}
     df.write_delta(path, mode=mode, **kwargs)
 
 
@@ -44,4 +317,88 @@ def glimpse(df: pl.DataFrame) -> None:
     n_rows = df.height
     n_cols = df.width
     print(f"Rows: {{n_rows:,}}    Columns: {{n_cols:,}}")
-    print(dict(df.schema))
\ No newline at end of file
+    print(dict(df.schema))
+
+
+_FIXED_WIDTH_BYTES = {{
+    pl.Boolean: 1,
+    pl.Int8: 1,
+    pl.UInt8: 1,
+    pl.Int16: 2,
+    pl.UInt16: 2,
+    pl.Int32: 4,
+    pl.UInt32: 4,
+    pl.Float32: 4,
+    pl.Date: 4,
+    pl.Int64: 8,
+    pl.UInt64: 8,
+    pl.Float64: 8,
+    pl.Datetime: 8,
+    pl.Duration: 8,
+    pl.Time: 8,
+}}
+
+
+def _size_expr(name: str, dtype: pl.DataType) -> pl.Expr:
+    if dtype == pl.String:
+        return pl.col(name).str.len_bytes().sum().cast(pl.Int64)
+    width = _FIXED_WIDTH_BYTES.get(dtype.base_type())
+    return pl.len().cast(pl.Int64) * width if width else pl.lit(None, pl.Int64)
+
+
+def profile(
+    data: pl.DataFrame | pl.LazyFrame,
+    *,
+    quantiles: tuple[float, ...] = (0.25, 0.5, 0.75),
+    sample: float | None = None,
+    seed: int = 0,
+) -> pl.DataFrame:
+    """Summarise every column in one query: non-null and null counts, approximate
+    distinct count, min/max, quantiles (numeric columns), and estimated bytes.
+
+    All statistics are aggregated in a single ``select`` so the input is scanned
+    once. ``sample`` (0 < sample <= 1) profiles a deterministic hash-based
+    fraction of the rows instead of all of them.
+    """
+    lf = data.lazy()
+    if sample is not None:
+        if not 0 < sample <= 1:
+            raise ValueError(f"sample must be in (0, 1], got {{sample}}")
+        lf = lf.filter(pl.int_range(pl.len(), dtype=pl.UInt64).hash(seed) % 2**32 < int(sample * 2**32))
+    schema = lf.collect_schema()
+    exprs: list[pl.Expr] = []
+    for i, (name, dtype) in enumerate(schema.items()):
+        col = pl.col(name)
+        exprs += [
+            col.count().alias(f"{{i}}:count"),
+            col.null_count().alias(f"{{i}}:null_count"),
+            _size_expr(name, dtype).alias(f"{{i}}:bytes"),
+        ]
+        if not dtype.is_nested():
+            exprs += [
+                col.approx_n_unique().alias(f"{{i}}:n_unique"),
+                col.min().cast(pl.String).alias(f"{{i}}:min"),
+                col.max().cast(pl.String).alias(f"{{i}}:max"),
+            ]
+        if dtype.is_numeric():
+            exprs += [col.quantile(q).cast(pl.Float64).alias(f"{{i}}:p{{q * 100:g}}") for q in quantiles]
+    stats = lf.select(exprs).collect().row(0, named=True) if exprs else {{}}
+
+    rows = []
+    for i, (name, dtype) in enumerate(schema.items()):
+        row = {{
+            "column": name,
+            "dtype": str(dtype),
+            "count": stats[f"{{i}}:count"],
+            "null_count": stats[f"{{i}}:null_count"],
+            "n_unique": stats.get(f"{{i}}:n_unique"),
+            "min": stats.get(f"{{i}}:min"),
+            "max": stats.get(f"{{i}}:max"),
+        }}
+        row.update({{f"p{{q * 100:g}}": stats.get(f"{{i}}:p{{q * 100:g}}") for q in quantiles}})
+        row["bytes"] = stats[f"{{i}}:bytes"]
+        rows.append(row)
+    schema_out = {{"column": pl.String, "dtype": pl.String, "count": pl.Int64, "null_count": pl.Int64, "n_unique": pl.Int64, "min": pl.String, "max": pl.String}}
+    schema_out.update({{f"p{{q * 100:g}}": pl.Float64 for q in quantiles}})
+    schema_out["bytes"] = pl.Int64
+    return pl.DataFrame(rows, schema=schema_out)
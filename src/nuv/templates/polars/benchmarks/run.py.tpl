@@ -0,0 +1,164 @@
+"""Time the project's I/O and SQL helpers on synthetic data.
+
+The synthetic data and every input file are written once, up front, in this
+process. Each benchmark then runs in a fresh worker that only loads its input,
+and reports how far the timed runs raised the worker's peak RSS, so the figure
+belongs to the helper being measured rather than to data generation.
+
+    uv run python benchmarks/run.py                          # all formats, 200k rows
+    uv run python benchmarks/run.py --rows 5_000_000 --format parquet --format ipc
+    uv run python benchmarks/run.py --save benchmarks/baseline.json
+    uv run python benchmarks/run.py --compare benchmarks/baseline.json --threshold 0.25
+
+Each benchmark reports the median (p50) of its timed runs. --save writes the
+results, with the Python, Polars and platform versions, to a JSON file that
+--compare later reads as the baseline. Exit code is 1 when --compare finds a
+p50 regression above --threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import polars as pl
+
+FORMATS = ("csv", "parquet", "ipc", "delta")
+OPERATIONS = ("write", "read", "scan-filter-agg", "sql-agg")
+SOURCE = "source.parquet"
+
+
+def synthetic(rows: int, seed: int = 0) -> pl.DataFrame:
+    return pl.DataFrame(
+        {{
+            "id": pl.int_range(rows, eager=True),
+            "group": pl.int_range(rows, eager=True).hash(seed) % 100,
+            "value": (pl.int_range(rows, eager=True).hash(seed + 1) % 1_000_000).cast(pl.Float64) / 100,
+            "label": pl.int_range(rows, eager=True).cast(pl.String).str.zfill(12),
+        }}
+    )
+
+
+def _path(root: Path, fmt: str) -> Path:
+    return root / ("table" if fmt == "delta" else f"table.{{'arrow' if fmt == 'ipc' else fmt}}")
+
+
+def prepare(root: Path, rows: int, formats: Sequence[str]) -> None:
+    """Write the input of every benchmark under *root*: the raw frame for writes, one table per format for reads."""
+    from {module_name} import _io
+
+    df = synthetic(rows)
+    _io.write(df, root / SOURCE)
+    for fmt in formats:
+        if fmt == "delta":
+            _io.write_delta(df, _path(root, fmt))
+        else:
+            _io.write(df, _path(root, fmt))
+
+
+def _operation(op: str, fmt: str, root: Path, out: Path) -> Callable[[], object]:
+    from {module_name} import _db, _io
+
+    path = _path(root, fmt)
+    match op:
+        case "write":
+            df = _io.read_parquet(root / SOURCE)
+            return (lambda: _io.write_delta(df, _path(out, fmt))) if fmt == "delta" else (lambda: _io.write(df, _path(out, fmt)))
+        case "read":
+            return (lambda: _io.read_delta(path)) if fmt == "delta" else (lambda: _io.scan(path).collect())
+        case "scan-filter-agg":
+            return lambda: _io.scan(path).filter(pl.col("value") > 5_000).group_by("group").agg(pl.col("value").mean()).collect()
+        case _:
+
+            def query() -> pl.DataFrame:
+                _db.register("bench", _io.scan(path))
+                return _db.sql('select "group", avg(value) as value from bench where value > 5000 group by "group"')
+
+            return query
+
+
+def _peak_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(op: str, fmt: str, root: Path, rows: int, iterations: int, warmup: int) -> dict[str, float | None]:
+    """Run one benchmark against the inputs under *root*; meant to be called in a fresh worker."""
+    # Keep the SQL benchmarks from creating a database file under data/.
+    os.environ.setdefault("DUCKDB_DATABASE", ":memory:")
+    out = Path(tempfile.mkdtemp(prefix="out-", dir=root))
+    try:
+        fn = _operation(op, fmt, root, out)
+        before = _peak_rss_bytes()
+        for _ in range(warmup):
+            fn()
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        after = _peak_rss_bytes()
+    finally:
+        shutil.rmtree(out, ignore_errors=True)
+    p50 = statistics.median(samples)
+    return {{
+        "rows": rows,
+        "iterations": iterations,
+        "p50_ms": p50 * 1000,
+        "rows_per_sec": rows / p50 if p50 else 0.0,
+        "peak_rss_mb": (after - before) / 1024**2 if before is not None and after is not None else None,
+    }}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark {name} I/O and SQL helpers.")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows of synthetic data (default: 200000).")
+    parser.add_argument("--format", action="append", choices=FORMATS, help="Format to benchmark (repeatable; default: all).")
+    parser.add_argument("--operation", action="append", choices=OPERATIONS, help="Operation to benchmark (repeatable; default: all).")
+    parser.add_argument("-n", "--iterations", type=int, default=5, help="Timed iterations per benchmark (default: 5).")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warmup iterations (default: 1).")
+    parser.add_argument("--save", metavar="PATH", help="Write results as JSON to PATH.")
+    parser.add_argument("--compare", metavar="PATH", help="Compare p50 against a baseline JSON written by --save.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown as a fraction (default: 0.2).")
+    args = parser.parse_args(argv)
+
+    formats = args.format or FORMATS
+    results: dict[str, dict] = {{}}
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        root = Path(tmp)
+        prepare(root, args.rows, formats)
+        for fmt in formats:
+            for op in args.operation or OPERATIONS:
+                key = f"{{fmt}}/{{op}}"
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                    r = results[key] = pool.submit(measure, op, fmt, root, args.rows, args.iterations, args.warmup).result()
+                rss = f"+{{r['peak_rss_mb']:.0f}} MB" if r["peak_rss_mb"] is not None else "n/a"
+                sys.stdout.write(f"{{key:<28}} {{r['p50_ms']:>10.2f}} ms {{r['rows_per_sec']:>14,.0f}} rows/s  peak RSS {{rss}}\n")
+
+    if args.save:
+        payload = {{"python": platform.python_version(), "polars": pl.__version__, "platform": platform.platform(), "results": results}}
+        Path(args.save).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+        regressions = [key for key, r in results.items() if key in baseline and r["p50_ms"] > baseline[key]["p50_ms"] * (1 + args.threshold)]
+        for key in regressions:
+            sys.stderr.write(f"REGRESSION {{key}}: p50 {{baseline[key]['p50_ms']:.2f}} ms -> {{results[key]['p50_ms']:.2f}} ms\n")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,4 +6,8 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     app_name: str = "{name}"
     log_level: str = "INFO"
-    data_root: Path = Path("data")
\ No newline at end of file
+    data_root: Path = Path("data")
+    duckdb_database: str = "{module_name}.duckdb"
+    duckdb_threads: int | None = None
+    duckdb_memory_limit: str | None = None
+    cache_max_bytes: int = 2 * 1024**3
@@ -1,11 +1,12 @@
 import logging
+from pathlib import Path
 
 import click
 
 log = logging.getLogger(__name__)
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option(
     "--log-level",
     default="WARNING",
@@ -14,9 +15,93 @@ log = logging.getLogger(__name__)
 )
 def main(log_level: str) -> None:
     from {module_name}._logging import configure
+
     configure(log_level)
     log.info("Starting {name}")
 
 
+@main.command()
+@click.argument("source", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--out",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Output dataset directory; only an empty directory or a previous ingest output is replaced.  [default: <data_root>/features/<source name>]",
+)
+@click.option("--partition-by", multiple=True, help="Column to partition by (repeatable).")
+@click.option("--batch-size", default=100_000, show_default=True, type=click.IntRange(min=1), help="Maximum rows per batch.")
+@click.option("--max-memory", default=None, help="Approximate memory budget per batch, e.g. 512MB or 2GB; lowers --batch-size to fit.")
+@click.option("--compression", default="zstd", show_default=True, help="Parquet compression codec.")
+def ingest(source: Path, out: Path | None, partition_by: tuple[str, ...], batch_size: int, max_memory: str | None, compression: str) -> None:
+    """Convert a CSV or NDJSON file into partitioned Parquet without loading it whole.
+
+    A previous ingest output is replaced once every batch has been written; any
+    other non-empty directory is left alone and the command fails.
+    """
+    from {module_name}._ingest import ingest as ingest_file
+    from {module_name}._ingest import parse_size
+    from {module_name}.config import Settings
+
+    if out is None:
+        out = Settings().data_root / "features" / source.name.split(".")[0]
+
+    def report(rows: int, seconds: float) -> None:
+        click.echo(f"{{rows:,}} rows  {{rows / seconds if seconds else 0:,.0f}} rows/s", err=True)
+
+    try:
+        budget = parse_size(max_memory) if max_memory is not None else None
+        rows = ingest_file(source, out, partition_by=partition_by, batch_size=batch_size, max_memory=budget, compression=compression, progress=report)
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+    click.echo(f"wrote {{rows:,}} rows to {{out}}")
+
+
+def _default_retention_hours() -> int:
+    # Resolved when the option is parsed so --help doesn't import deltalake.
+    from {module_name}._delta import DEFAULT_RETENTION_HOURS
+
+    return DEFAULT_RETENTION_HOURS
+
+
+@main.command()
+@click.argument("table")
+@click.option("--z-order", "z_order_by", multiple=True, help="Cluster by this column while compacting (repeatable).")
+@click.option("--vacuum/--no-vacuum", "run_vacuum", default=True, show_default=True, help="Delete unreferenced files afterwards.")
+@click.option(
+    "--retention-hours",
+    default=_default_retention_hours,
+    type=click.IntRange(min=0),
+    help="Only vacuum files older than this.  [default: _delta.DEFAULT_RETENTION_HOURS]",
+)
+@click.option("--allow-short-retention", is_flag=True, help="Permit --retention-hours below the table's minimum.")
+@click.option("--dry-run", is_flag=True, help="List the files vacuum would delete without deleting them.")
+def optimize(table: str, z_order_by: tuple[str, ...], run_vacuum: bool, retention_hours: int, allow_short_retention: bool, dry_run: bool) -> None:
+    """Compact (or z-order) a Delta table, then vacuum it.
+
+    TABLE is a path, or the name of a table under <data_root>/features.
+    """
+    from deltalake.exceptions import DeltaError
+
+    from {module_name} import _delta
+    from {module_name}.config import Settings
+
+    path = Path(table) if Path(table).exists() else Settings().data_root / "features" / table
+    try:
+        before = _delta.file_count(path)
+        if dry_run:
+            click.echo(f"{{path}}: {{before}} files (dry run, not compacted)")
+        else:
+            if z_order_by:
+                _delta.z_order(path, z_order_by)
+            else:
+                _delta.compact(path)
+            click.echo(f"{{path}}: {{before}} -> {{_delta.file_count(path)}} files")
+        if run_vacuum:
+            removed = _delta.vacuum(path, retention_hours=retention_hours, dry_run=dry_run, enforce_retention_duration=not allow_short_retention)
+            click.echo(f"vacuum {{'would remove' if dry_run else 'removed'}} {{len(removed)}} files")
+    except (DeltaError, ValueError) as exc:
+        raise click.ClickException(str(exc)) from exc
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
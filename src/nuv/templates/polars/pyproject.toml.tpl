@@ -7,6 +7,7 @@ requires-python = ">={python_version}"
 dependencies = [
     "polars>=1.40.1",
     "duckdb>=1.5.2",
+    "pyarrow>=21.0.0",
     "deltalake>=1.5.1",
     "pydantic-settings>=2.14.0",
     "click>=8.3.3",
@@ -17,6 +17,8 @@ uv sync --group notebooks
 ```bash
 uv run python main.py --help
 uv run python main.py --log-level INFO
+uv run python main.py ingest data/raw/input.csv --partition-by day --max-memory 2GB
+uv run python main.py optimize <table> --z-order <column>   # compact + vacuum a Delta table in data/features/
 ```
 
 ## Development
@@ -32,4 +34,11 @@ uv run ty check .      # type check
 
 ```bash
 uv run marimo edit notebooks/explore.py
-```
\ No newline at end of file
+```
+
+## Benchmarks
+
+```bash
+uv run python benchmarks/run.py --save benchmarks/baseline.json        # record a baseline
+uv run python benchmarks/run.py --compare benchmarks/baseline.json     # exit 1 on a >20% p50 regression
+```
@@ -0,0 +1,74 @@
+import threading
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from {module_name} import _db
+from {module_name}.config import Settings
+
+
+@pytest.fixture(autouse=True)
+def _isolated_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path))
+    _db.close()
+    yield
+    _db.close()
+
+
+def test_database_path_under_data_root(tmp_path):
+    assert _db.database_path(Settings()) == str(tmp_path / "{module_name}.duckdb")
+    assert _db.database_path(Settings(duckdb_database=":memory:")) == ":memory:"
+
+
+def test_connection_is_persistent_and_configured(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_THREADS", "2")
+    monkeypatch.setenv("DUCKDB_MEMORY_LIMIT", "1GB")
+    _db.sql("create table t as select 42 as answer")
+    assert _db.connection() is _db.connection()
+    assert _db.sql("select current_setting('threads') as threads")["threads"].item() == 2
+    _db.close()
+    assert (tmp_path / "{module_name}.duckdb").exists()
+    assert _db.sql("select answer from t")["answer"].item() == 42
+
+
+def test_connection_rejects_different_settings():
+    settings = Settings(duckdb_database=":memory:")
+    shared = _db.connection(settings)
+    assert _db.connection(Settings(duckdb_database=":memory:")) is shared
+    assert _db.connection() is shared
+    with pytest.raises(ValueError, match="different settings"):
+        _db.connection(Settings(duckdb_threads=1))
+    _db.close()
+    assert _db.connection(Settings(duckdb_threads=1)) is not shared
+
+
+def test_in_memory_database(monkeypatch):
+    monkeypatch.setenv("DUCKDB_DATABASE", ":memory:")
+    assert _db.sql("select 1 as one")["one"].item() == 1
+
+
+def test_cursor_is_per_thread():
+    main_cursor = _db.cursor()
+    assert _db.cursor() is main_cursor
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(_db.cursor()))
+    thread.start()
+    thread.join()
+    assert seen[0] is not main_cursor
+
+
+def test_register_dataframe_and_lazyframe(sample_df):
+    _db.register("eager", sample_df)
+    _db.register("lazy", sample_df.lazy().filter(pl.col("x") > 1))
+    assert_frame_equal(_db.sql("select * from eager order by x"), sample_df)
+    assert _db.sql("select count(*) as n from lazy")["n"].item() == 2
+    _db.unregister("eager")
+    with pytest.raises(Exception, match="eager"):
+        _db.sql("select * from eager")
+
+
+def test_sql_with_parameters(sample_df):
+    _db.register("frame", sample_df)
+    result = _db.sql("select y from frame where x > ?", [1])
+    assert result["y"].to_list() == ["b", "c"]
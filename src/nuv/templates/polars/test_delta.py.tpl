@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from click.testing import CliRunner
+from deltalake.exceptions import DeltaError
+from polars.testing import assert_frame_equal
+
+from {module_name} import _delta
+from {module_name}._io import read_delta, write_delta
+from {module_name}.main import main
+
+
+@pytest.fixture
+def fragmented(tmp_path):
+    path = tmp_path / "data" / "features" / "events"
+    for day in range(5):
+        write_delta(pl.DataFrame({{"day": [day] * 4, "user": [f"u{{i}}" for i in range(4)]}}), path, mode="append")
+    return path
+
+
+def _parquet_on_disk(path):
+    return len(list(path.rglob("*.parquet")))
+
+
+def test_compact_reduces_file_count(fragmented):
+    expected = read_delta(fragmented)
+    assert _delta.file_count(fragmented) == 5
+    metrics = _delta.compact(fragmented)
+    assert metrics["numFilesRemoved"] == 5
+    assert _delta.file_count(fragmented) == 1
+    assert_frame_equal(read_delta(fragmented), expected, check_row_order=False)
+
+
+def test_z_order_reduces_file_count(fragmented):
+    _delta.z_order(fragmented, ["user"])
+    assert _delta.file_count(fragmented) == 1
+    with pytest.raises(ValueError, match="at least one column"):
+        _delta.z_order(fragmented, [])
+
+
+def test_vacuum_removes_unreferenced_files(fragmented):
+    _delta.compact(fragmented)
+    assert _parquet_on_disk(fragmented) == 6
+    with pytest.raises(DeltaError):
+        _delta.vacuum(fragmented, retention_hours=0)
+    assert len(_delta.vacuum(fragmented, retention_hours=0, dry_run=True, enforce_retention_duration=False)) == 5
+    assert _parquet_on_disk(fragmented) == 6
+    assert len(_delta.vacuum(fragmented, retention_hours=0, enforce_retention_duration=False)) == 5
+    assert _parquet_on_disk(fragmented) == 1
+
+
+def test_cli_optimize_table_under_features(fragmented, monkeypatch):
+    monkeypatch.setenv("DATA_ROOT", str(fragmented.parent.parent))
+    result = CliRunner().invoke(main, ["optimize", "events", "--retention-hours", "0", "--allow-short-retention"])
+    assert result.exit_code == 0, result.output
+    assert "5 -> 1 files" in result.output
+    assert "vacuum removed 5 files" in result.output
+    assert _parquet_on_disk(fragmented) == 1
+
+
+def test_cli_optimize_z_order_dry_run_and_no_vacuum(fragmented):
+    result = CliRunner().invoke(main, ["optimize", str(fragmented), "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "5 files (dry run" in result.output
+    assert "vacuum would remove 0 files" in result.output
+    with patch.object(_delta, "vacuum", return_value=[]) as mock_vacuum:
+        assert CliRunner().invoke(main, ["optimize", str(fragmented), "--dry-run"]).exit_code == 0
+    assert mock_vacuum.call_args.kwargs["retention_hours"] == _delta.DEFAULT_RETENTION_HOURS
+    result = CliRunner().invoke(main, ["optimize", str(fragmented), "--z-order", "user", "--no-vacuum"])
+    assert result.exit_code == 0, result.output
+    assert "5 -> 1 files" in result.output
+    assert "vacuum" not in result.output
+
+
+def test_cli_optimize_missing_table(tmp_path):
+    result = CliRunner().invoke(main, ["optimize", str(tmp_path / "nope")])
+    assert result.exit_code == 1
+    assert "Error" in result.output
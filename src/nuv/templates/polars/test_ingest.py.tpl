@@ -0,0 +1,156 @@
+import datetime as dt
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from click.testing import CliRunner
+from polars.testing import assert_frame_equal
+
+from {module_name}._ingest import ingest, parse_size, rows_per_batch
+from {module_name}._io import scan_partitioned
+from {module_name}.main import main
+
+
+@pytest.fixture
+def events() -> pl.DataFrame:
+    return pl.DataFrame(
+        {{
+            "day": [dt.date(2024, 1, 1 + i % 3) for i in range(10)],
+            "user": [f"u{{i}}" for i in range(10)],
+            "amount": [float(i) for i in range(10)],
+        }}
+    )
+
+
+@pytest.mark.parametrize(("text", "expected"), [("1024", 1024), ("2KB", 2048), ("1.5 MiB", 1572864), ("2g", 2 * 1024**3)])
+def test_parse_size(text, expected):
+    assert parse_size(text) == expected
+
+
+def test_parse_size_rejects_garbage():
+    with pytest.raises(ValueError, match="Invalid size"):
+        parse_size("lots")
+
+
+def test_rows_per_batch_respects_memory_budget(events):
+    lf = events.lazy()
+    assert rows_per_batch(lf, batch_size=1_000, max_memory=None) == 1_000
+    row_bytes = events.estimated_size() // events.height
+    assert rows_per_batch(lf, batch_size=1_000, max_memory=row_bytes * 4) == 4
+    assert rows_per_batch(lf, batch_size=1_000, max_memory=1) == 1
+    assert rows_per_batch(events.clear().lazy(), batch_size=7, max_memory=1) == 7
+
+
+def test_ingest_csv_in_batches(events, tmp_path):
+    source = tmp_path / "events.csv"
+    events.write_csv(source)
+    progress = []
+    rows = ingest(source, tmp_path / "out", batch_size=3, progress=lambda n, s: progress.append(n))
+    assert rows == 10
+    assert progress[-1] == 10
+    assert len(list((tmp_path / "out").glob("part-*.parquet"))) == len(progress) > 1
+    assert_frame_equal(pl.read_parquet(tmp_path / "out"), pl.read_csv(source))
+
+
+def test_ingest_partitioned_ndjson(events, tmp_path):
+    source = tmp_path / "events.ndjson"
+    events.with_columns(pl.when(pl.col("amount") == 0).then(None).otherwise(pl.col("day")).alias("day")).write_ndjson(source)
+    rows = ingest(source, tmp_path / "out", partition_by=["day"], batch_size=4)
+    assert rows == 10
+    assert (tmp_path / "out" / "day=2024-01-02").is_dir()
+    assert (tmp_path / "out" / "day=__HIVE_DEFAULT_PARTITION__").is_dir()
+    result = scan_partitioned(tmp_path / "out").collect()
+    assert result.height == 10
+    assert result["day"].null_count() == 1
+
+
+def test_ingest_replaces_previous_output(events, tmp_path):
+    source = tmp_path / "events.csv"
+    events.write_csv(source)
+    out = tmp_path / "out"
+    ingest(source, out, batch_size=3)
+    events.head(2).write_csv(source)
+    assert ingest(source, out, batch_size=3) == 2
+    assert sorted(p.name for p in out.iterdir()) == ["_INGESTED", "part-00000.parquet"]
+    assert pl.read_parquet(out).height == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["events.csv", "out"]
+
+
+def test_ingest_refuses_to_replace_unrelated_directory(events, tmp_path):
+    source = tmp_path / "events.csv"
+    events.write_csv(source)
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "notes.txt").write_text("keep me")
+    with pytest.raises(ValueError, match="Refusing to replace"):
+        ingest(source, tmp_path / "out")
+    with pytest.raises(ValueError, match="Refusing to replace"):
+        ingest(source, source)
+    assert (tmp_path / "out" / "notes.txt").read_text() == "keep me"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["events.csv", "out"]
+    (tmp_path / "empty").mkdir()
+    assert ingest(source, tmp_path / "empty") == 10
+
+
+def test_ingest_percent_encodes_partition_values(tmp_path):
+    source = tmp_path / "paths.csv"
+    pl.DataFrame({{"path": ["a/b", "../../x", "plain"], "n": [1, 2, 3]}}).write_csv(source)
+    out = tmp_path / "out"
+    ingest(source, out, partition_by=["path"])
+    assert sorted(p.name for p in out.iterdir()) == ["_INGESTED", "path=..%2F..%2Fx", "path=a%2Fb", "path=plain"]
+    assert sorted(scan_partitioned(out).collect()["path"].to_list()) == ["../../x", "a/b", "plain"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out", "paths.csv"]
+
+
+def test_ingest_failure_keeps_previous_output(events, tmp_path):
+    source = tmp_path / "events.csv"
+    events.write_csv(source)
+    out = tmp_path / "out"
+    ingest(source, out)
+    with pytest.raises(OSError, match="disk full"), patch.object(pl.DataFrame, "write_parquet", side_effect=OSError("disk full")):
+        ingest(source, out)
+    assert pl.read_parquet(out).height == 10
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["events.csv", "out"]
+
+
+def test_ingest_rejects_json_array(events, tmp_path):
+    source = tmp_path / "events.json"
+    events.write_json(source)
+    with pytest.raises(ValueError, match="convert to NDJSON"):
+        ingest(source, tmp_path / "out")
+
+
+def test_ingest_unknown_compression(events, tmp_path):
+    source = tmp_path / "events.csv"
+    events.write_csv(source)
+    with pytest.raises(ValueError, match="Unknown compression 'zip'"):
+        ingest(source, tmp_path / "out", compression="zip")
+
+
+def test_ingest_unknown_partition_column(events, tmp_path):
+    source = tmp_path / "events.csv"
+    events.write_csv(source)
+    with pytest.raises(ValueError, match="Unknown partition columns"):
+        ingest(source, tmp_path / "out", partition_by=["nope"])
+
+
+def test_cli_ingest_default_output(events, tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path / "data"))
+    source = tmp_path / "events.csv.gz"
+    events.write_csv(source, compression="gzip")
+    result = CliRunner().invoke(main, ["ingest", str(source), "--partition-by", "day", "--batch-size", "4", "--max-memory", "1MB"])
+    assert result.exit_code == 0, result.output
+    assert "rows/s" in result.output
+    assert "wrote 10 rows" in result.output
+    assert_frame_equal(scan_partitioned(tmp_path / "data" / "features" / "events").collect(), events, check_row_order=False, check_column_order=False)
+
+
+def test_cli_ingest_reports_errors(events, tmp_path):
+    source = tmp_path / "events.csv"
+    events.write_csv(source)
+    result = CliRunner().invoke(main, ["ingest", str(source), "--out", str(tmp_path / "out"), "--max-memory", "lots"])
+    assert result.exit_code == 1
+    assert "Invalid size" in result.output
+
+
+def test_main_without_subcommand():
+    assert CliRunner().invoke(main, ["--log-level", "INFO"]).exit_code == 0
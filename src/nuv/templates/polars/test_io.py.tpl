@@ -1,16 +1,40 @@
+import datetime as dt
+import os
+import time
+
 import polars as pl
+import pytest
 from polars.testing import assert_frame_equal
 
 from {module_name}._io import (
+    cached,
+    evict_cache,
+    expand,
+    fingerprint,
     glimpse,
+    profile,
     read_csv,
     read_delta,
+    read_ipc,
     read_json,
+    read_many,
+    read_ndjson,
     read_parquet,
+    scan,
+    scan_csv,
+    scan_delta,
+    scan_ipc,
+    scan_many,
+    scan_ndjson,
+    scan_parquet,
+    scan_partitioned,
     show,
+    sink,
     write,
     write_delta,
+    write_partitioned,
 )
+from {module_name}.config import Settings
 
 
 def test_read_parquet_roundtrip(tmp_path):
@@ -37,9 +61,31 @@ def test_read_json_roundtrip(tmp_path):
     assert_frame_equal(result, df)
 
 
-def test_write_unsupported_format(sample_df, tmp_path):
-    import pytest
+@pytest.mark.parametrize("suffix", [".arrow", ".ipc", ".feather"])
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_read_ipc_roundtrip(sample_df, tmp_path, suffix, compression):
+    path = tmp_path / f"test{{suffix}}"
+    write(sample_df, path, compression=compression)
+    assert_frame_equal(read_ipc(path), sample_df)
+    assert_frame_equal(scan_ipc(path).collect(), sample_df)
+
+
+@pytest.mark.parametrize("suffix", [".ndjson", ".jsonl"])
+def test_read_ndjson_roundtrip(sample_df, tmp_path, suffix):
+    path = tmp_path / f"test{{suffix}}"
+    write(sample_df, path)
+    assert_frame_equal(read_ndjson(path), sample_df)
+    assert_frame_equal(scan_ndjson(path).collect(), sample_df)
+
 
+@pytest.mark.parametrize(("name", "compression"), [("test.parquet", "snappy"), ("test.parquet", "uncompressed"), ("test.csv.gz", None), ("test.ndjson.zst", None)])
+def test_write_with_compression(sample_df, tmp_path, name, compression):
+    path = tmp_path / name
+    write(sample_df, path, compression=compression)
+    assert_frame_equal(scan(path).collect(), sample_df)
+
+
+def test_write_unsupported_format(sample_df, tmp_path):
     path = tmp_path / "test.xyz"
     with pytest.raises(ValueError, match="Unsupported format"):
         write(sample_df, path)
@@ -58,4 +104,268 @@ def test_show_does_not_raise(sample_df):
 
 
 def test_glimpse_does_not_raise(sample_df):
-    glimpse(sample_df)
\ No newline at end of file
+    glimpse(sample_df)
+
+
+def test_scan_parquet_pushes_down_predicate_and_projection(sample_df, tmp_path):
+    path = tmp_path / "test.parquet"
+    sample_df.write_parquet(path)
+    plan = scan_parquet(path).filter(pl.col("x") > 1).select("y").explain()
+    assert "SELECTION" in plan
+    assert "PROJECT 2/2 COLUMNS" in plan
+    plan = scan_parquet(path).select("y").explain()
+    assert "PROJECT 1/2 COLUMNS" in plan
+
+
+def test_scan_csv_pushes_down_predicate(sample_df, tmp_path):
+    path = tmp_path / "test.csv"
+    sample_df.write_csv(path)
+    lf = scan_csv(path).filter(pl.col("x") > 1)
+    assert "SELECTION" in lf.explain()
+    assert_frame_equal(lf.collect(), sample_df.filter(pl.col("x") > 1))
+
+
+def test_scan_delta_pushes_down_predicate(sample_df, tmp_path):
+    path = tmp_path / "delta-table"
+    write_delta(sample_df, path)
+    lf = scan_delta(path).filter(pl.col("x") > 1)
+    assert "SELECTION" in lf.explain()
+    assert_frame_equal(lf.collect(), sample_df.filter(pl.col("x") > 1))
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".csv", ".ndjson", ".jsonl", ".arrow"])
+def test_sink_roundtrip(sample_df, tmp_path, suffix):
+    path = tmp_path / f"test{{suffix}}"
+    sink(sample_df.lazy().filter(pl.col("x") > 1), path)
+    assert_frame_equal(scan(path).collect(), sample_df.filter(pl.col("x") > 1))
+
+
+def test_sink_with_compression(sample_df, tmp_path):
+    path = tmp_path / "test.feather"
+    sink(sample_df.lazy(), path, compression="zstd")
+    assert_frame_equal(read_ipc(path), sample_df)
+    sink(sample_df.lazy(), tmp_path / "test.csv.zst")
+    assert_frame_equal(scan(tmp_path / "test.csv.zst").collect(), sample_df)
+
+
+def test_sink_unsupported_format(sample_df, tmp_path):
+    with pytest.raises(ValueError, match="Unsupported format"):
+        sink(sample_df.lazy(), tmp_path / "test.json")
+
+
+@pytest.fixture
+def dated_df() -> pl.DataFrame:
+    return pl.DataFrame(
+        {{
+            "date": [dt.date(2024, 1, 1), dt.date(2024, 1, 1), dt.date(2024, 1, 2)],
+            "region": ["eu", "us", "eu"],
+            "value": [1, 2, 3],
+        }}
+    )
+
+
+def test_write_partitioned_roundtrip(dated_df, tmp_path):
+    root = tmp_path / "features"
+    write_partitioned(dated_df, root, ["date", "region"])
+    assert (root / "date=2024-01-02" / "region=eu").is_dir()
+    result = scan_partitioned(root).collect()
+    assert_frame_equal(result, dated_df, check_row_order=False, check_column_order=False)
+
+
+def test_scan_partitioned_prunes_partitions(dated_df, tmp_path):
+    root = tmp_path / "features"
+    write_partitioned(dated_df, root, "date")
+    lf = scan_partitioned(root).filter(pl.col("date") == dt.date(2024, 1, 2))
+    plan = lf.explain()
+    assert "date=2024-01-02" in plan
+    assert "date=2024-01-01" not in plan
+    # Unreadable files in other partitions prove they are never opened.
+    for path in (root / "date=2024-01-01").rglob("*.parquet"):
+        path.write_bytes(b"not parquet")
+    assert lf.collect()["value"].to_list() == [3]
+
+
+def test_write_delta_partitioned(dated_df, tmp_path):
+    path = tmp_path / "delta-table"
+    write_delta(dated_df, path, partition_by="date")
+    assert (path / "date=2024-01-01").is_dir()
+    assert_frame_equal(read_delta(path), dated_df, check_row_order=False, check_column_order=False)
+
+
+def test_scan_dispatches_on_layout(sample_df, tmp_path):
+    for name in ("a.csv", "a.parquet", "a.ndjson", "a.arrow"):
+        sink(sample_df.lazy(), tmp_path / name)
+        assert_frame_equal(scan(tmp_path / name).collect(), sample_df)
+    write_delta(sample_df, tmp_path / "delta")
+    assert_frame_equal(scan(tmp_path / "delta").collect(), sample_df)
+    write_partitioned(sample_df, tmp_path / "dataset", "y")
+    assert_frame_equal(scan(tmp_path / "dataset").collect(), sample_df, check_row_order=False, check_column_order=False)
+    with pytest.raises(ValueError, match="Unsupported format"):
+        scan(tmp_path / "a.xyz")
+
+
+def test_fingerprint_changes_with_contents(sample_df, tmp_path):
+    path = tmp_path / "a.parquet"
+    sample_df.write_parquet(path)
+    before = fingerprint(path)
+    assert fingerprint(path) == before
+    pl.concat([sample_df, sample_df]).write_parquet(path)
+    assert fingerprint(path) != before
+    write_delta(sample_df, tmp_path / "delta")
+    assert fingerprint(tmp_path / "delta") != fingerprint(tmp_path / "delta" / "_delta_log")
+
+
+def _cache_entries(settings):
+    return list((settings.data_root / "cache").glob("*.arrow"))
+
+
+def test_cached_hit_does_not_reparse(sample_df, tmp_path):
+    settings = Settings(data_root=tmp_path / "data")
+    path = tmp_path / "raw.csv"
+    sample_df.write_csv(path)
+    first = cached(path, lambda lf: lf.filter(pl.col("x") > 1), settings=settings)
+    assert_frame_equal(first, sample_df.filter(pl.col("x") > 1))
+    # Same size and mtime: a hit must come from the cache, not the (now garbage) file.
+    stat = path.stat()
+    path.write_bytes(b"\xff" * stat.st_size)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert_frame_equal(cached(path, lambda lf: lf.filter(pl.col("x") > 1), settings=settings), first)
+    assert len(_cache_entries(settings)) == 1
+
+
+def test_cached_misses_on_new_input_or_query(sample_df, tmp_path):
+    settings = Settings(data_root=tmp_path / "data")
+    path = tmp_path / "raw.parquet"
+    sample_df.write_parquet(path)
+    cached(path, settings=settings)
+    assert_frame_equal(cached(path, lambda lf: lf.select("x"), settings=settings), sample_df.select("x"))
+    bigger = pl.concat([sample_df, sample_df])
+    bigger.write_parquet(path)
+    assert_frame_equal(cached(path, settings=settings), bigger)
+    assert len(_cache_entries(settings)) == 3
+
+
+def test_evict_cache_drops_least_recently_used(sample_df, tmp_path):
+    settings = Settings(data_root=tmp_path / "data", cache_max_bytes=1)
+    for i in range(3):
+        path = tmp_path / f"raw{{i}}.parquet"
+        sample_df.write_parquet(path)
+        cached(path, settings=settings)
+    # Over budget, only the entry just written survives.
+    [survivor] = _cache_entries(settings)
+    assert_frame_equal(pl.read_ipc(survivor), sample_df)
+    assert evict_cache(Settings(data_root=tmp_path / "data", cache_max_bytes=0)) > 0
+    assert _cache_entries(settings) == []
+    assert evict_cache(settings) == 0
+
+
+def test_profile_single_pass(tmp_path):
+    df = pl.DataFrame(
+        {{
+            "id": [1, 2, 3, 4, None],
+            "name": ["a", "bb", "a", None, "ccc"],
+            "day": [dt.date(2024, 1, d) for d in range(1, 6)],
+            "tags": [[1], [2, 3], [], None, [4]],
+        }}
+    )
+    path = tmp_path / "profile.parquet"
+    df.write_parquet(path)
+    result = profile(scan_parquet(path))
+    assert result["column"].to_list() == ["id", "name", "day", "tags"]
+    ids = result.row(0, named=True)
+    assert (ids["count"], ids["null_count"], ids["n_unique"]) == (4, 1, 5)
+    assert (ids["min"], ids["max"], ids["p50"]) == ("1", "4", 3.0)
+    assert ids["bytes"] == 5 * 8
+    names = result.row(1, named=True)
+    assert (names["min"], names["max"], names["bytes"], names["p50"]) == ("a", "ccc", 7, None)
+    assert result.row(2, named=True)["min"] == "2024-01-01"
+    tags = result.row(3, named=True)
+    assert (tags["null_count"], tags["n_unique"], tags["bytes"]) == (1, None, None)
+
+
+def test_profile_accepts_dataframe_and_custom_quantiles(sample_df):
+    result = profile(sample_df, quantiles=(0.1, 0.9))
+    assert {{"p10", "p90"}} <= set(result.columns)
+    assert "p50" not in result.columns
+
+
+def test_profile_sample():
+    df = pl.DataFrame({{"x": range(10_000)}})
+    sampled = profile(df, sample=0.1).row(0, named=True)["count"]
+    assert 800 < sampled < 1200
+    assert profile(df, sample=0.1)["count"].item() == sampled
+    assert profile(df, sample=1.0)["count"].item() == 10_000
+    with pytest.raises(ValueError, match="sample must be"):
+        profile(df, sample=0)
+
+
+def test_profile_empty_schema():
+    assert profile(pl.DataFrame()).height == 0
+
+
+def _write_shards(root, count, rows, suffix=".csv"):
+    root.mkdir()
+    for i in range(count):
+        shard = pl.DataFrame({{"shard": [i] * rows, "value": range(rows)}})
+        write(shard, root / f"part-{{i:04d}}{{suffix}}")
+
+
+def test_expand_glob_directory_and_missing(tmp_path):
+    _write_shards(tmp_path / "shards", 3, 2)
+    (tmp_path / "shards" / "_SUCCESS").touch()
+    assert [p.name for p in expand(tmp_path / "shards")] == ["part-0000.csv", "part-0001.csv", "part-0002.csv"]
+    assert len(expand(tmp_path / "shards" / "*.csv")) == 3
+    with pytest.raises(FileNotFoundError, match="No files match"):
+        expand(tmp_path / "shards" / "*.parquet")
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json", ".ndjson", ".parquet"])
+def test_read_many_and_scan_many(tmp_path, suffix):
+    _write_shards(tmp_path / "shards", 5, 3, suffix)
+    expected = pl.concat([pl.DataFrame({{"shard": [i] * 3, "value": range(3)}}) for i in range(5)])
+    assert_frame_equal(read_many(tmp_path / "shards" / f"*{{suffix}}", max_workers=2), expected)
+    if suffix != ".json":
+        assert_frame_equal(scan_many(tmp_path / "shards").collect(), expected)
+
+
+def test_many_schema_drift(tmp_path):
+    root = tmp_path / "shards"
+    root.mkdir()
+    write(pl.DataFrame({{"id": [1], "value": [1]}}), root / "a.parquet")
+    write(pl.DataFrame({{"id": [2], "value": [2.5], "extra": ["x"]}}), root / "b.parquet")
+    result = read_many(root)
+    assert result.schema == pl.Schema({{"id": pl.Int64, "value": pl.Float64, "extra": pl.String}})
+    assert result["extra"].to_list() == [None, "x"]
+    assert_frame_equal(scan_many(root).collect(), result)
+    with pytest.raises(ValueError, match="Schema drift in .*b.parquet"):
+        read_many(root, on_drift="error")
+    with pytest.raises(pl.exceptions.SchemaError):
+        scan_many(root, on_drift="error").collect()
+    write(pl.DataFrame({{"id": [2], "value": [2]}}), root / "b.parquet")
+    assert scan_many(root, on_drift="error").collect().height == 2
+    assert read_many(root, on_drift="error").height == 2
+    write(pl.DataFrame({{"id": [3], "value": [3.5]}}), root / "c.csv")
+    with pytest.raises(ValueError, match="Schema drift in .*c.csv"):
+        scan_many(root, on_drift="error")
+
+
+def test_read_many_benchmark_against_naive_loop(tmp_path):
+    """Compare the pooled reader with a Python loop over 300 shards; run with -s to see timings."""
+    _write_shards(tmp_path / "shards", 300, 1_000)
+    paths = sorted((tmp_path / "shards").glob("*.csv"))
+
+    start = time.perf_counter()
+    naive = pl.concat([pl.read_csv(path) for path in paths])
+    naive_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pooled = read_many(tmp_path / "shards")
+    pooled_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    native = scan_many(tmp_path / "shards", on_drift="error").collect()
+    native_seconds = time.perf_counter() - start
+
+    print(f"\nnaive loop {{naive_seconds:.3f}}s  read_many {{pooled_seconds:.3f}}s  scan_many(on_drift='error') {{native_seconds:.3f}}s")
+    assert_frame_equal(pooled, naive)
+    assert_frame_equal(native, naive)
@@ -0,0 +1,88 @@
+"""Compare a row-at-a-time Python UDF with the vectorised transforms in jobs/vectorized.py.
+
+Every case computes the same column on the same generated data and forces it
+with an aggregate, so the timings differ only in how Python is called.
+
+    uv run python benchmarks/udf.py                         # 1M rows, every case
+    uv run python benchmarks/udf.py --rows 10_000_000 -n 3
+    uv run python benchmarks/udf.py --case python-udf --case map-in-arrow
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
+from pyspark.sql.types import DoubleType
+
+from {module_name}.jobs.vectorized import TAX_RATE, with_tax, with_tax_arrow
+from {module_name}.session import create_spark_session
+
+
+@F.udf(DoubleType())
+def add_tax_python(amount: float) -> float:
+    return amount * (1 + TAX_RATE)
+
+
+CASES: dict[str, Callable[[DataFrame], DataFrame]] = {{
+    "python-udf": lambda df: df.withColumn("amount_with_tax", add_tax_python("amount")),
+    "pandas-udf": with_tax,
+    "map-in-arrow": with_tax_arrow,
+    "builtin": lambda df: df.withColumn("amount_with_tax", F.col("amount") * (1 + TAX_RATE)),
+}}
+
+
+def synthetic(spark: SparkSession, rows: int) -> DataFrame:
+    return spark.range(rows).select(
+        F.col("id"),
+        ((F.col("id") * 7919) % 100_000 / 100).alias("amount"),
+    )
+
+
+def measure(spark: SparkSession, case: str, rows: int, iterations: int, warmup: int) -> dict[str, float]:
+    df = synthetic(spark, rows)
+    query = CASES[case](df).agg(F.sum("amount_with_tax"))
+    for _ in range(warmup):
+        query.collect()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        query.collect()
+        samples.append(time.perf_counter() - start)
+    p50 = statistics.median(samples)
+    return {{"rows": rows, "iterations": iterations, "p50_ms": p50 * 1000, "rows_per_sec": rows / p50 if p50 else 0.0}}
+
+
+def _format_table(results: dict[str, dict[str, float]]) -> str:
+    baseline = results.get("python-udf", {{}}).get("p50_ms")
+    header = f"{{'case':<14}} {{'p50 ms':>10}} {{'rows/s':>14}} {{'vs python-udf':>14}}"
+    lines = [header, "-" * len(header)]
+    for case, r in results.items():
+        speedup = f"{{baseline / r['p50_ms']:.1f}}x" if baseline and r["p50_ms"] else "n/a"
+        lines.append(f"{{case:<14}} {{r['p50_ms']:>10.1f}} {{r['rows_per_sec']:>14,.0f}} {{speedup:>14}}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Python UDF styles in {name}.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows of generated data (default: 1000000).")
+    parser.add_argument("--case", action="append", choices=CASES, help="Case to benchmark (repeatable; default: all).")
+    parser.add_argument("--profile", default="local-dev", help="Spark session profile (default: local-dev).")
+    parser.add_argument("-n", "--iterations", type=int, default=5, help="Timed iterations per case (default: 5).")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warmup iterations (default: 1).")
+    args = parser.parse_args(argv)
+
+    spark = create_spark_session("{name}-udf-benchmark", profile=args.profile)
+    try:
+        results = {{case: measure(spark, case, args.rows, args.iterations, args.warmup) for case in args.case or CASES}}
+    finally:
+        spark.stop()
+    sys.stdout.write(_format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
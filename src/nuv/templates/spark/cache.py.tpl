@@ -0,0 +1,65 @@
+"""Reuse intermediate DataFrames without leaking executor memory.
+
+``persisted`` caches a DataFrame for the duration of a ``with`` block and always
+unpersists it on the way out, logging how much the session's cache held. Use it when
+a DataFrame feeds more than one action; a single action gains nothing from
+caching.
+
+``checkpoint`` writes a DataFrame to the checkpoint directory and returns one
+whose lineage starts there. Use it to cut long iterative plans, or when a
+recomputation after executor loss would be expensive.
+"""
+
+import logging
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+from pyspark import StorageLevel
+from pyspark.sql import DataFrame, SparkSession
+
+log = logging.getLogger(__name__)
+
+DEFAULT_STORAGE_LEVEL = StorageLevel.MEMORY_AND_DISK_DESER
+
+
+def cached_bytes(spark: SparkSession) -> tuple[int, int]:
+    """Return the (memory, disk) bytes held by every cached RDD and DataFrame in the session.
+
+    This is a session-wide total from the storage status, not a per-DataFrame figure.
+    """
+    infos = spark._jsparkSession.sparkContext().getRDDStorageInfo()
+    return sum(info.memSize() for info in infos), sum(info.diskSize() for info in infos)
+
+
+@contextmanager
+def persisted(df: DataFrame, level: StorageLevel = DEFAULT_STORAGE_LEVEL) -> Generator[DataFrame]:
+    """Persist *df* at *level* inside the block and unpersist it afterwards, even on error.
+
+    Caching is lazy: the first action inside the block fills the cache.
+    """
+    cached = df.persist(level)
+    try:
+        yield cached
+    finally:
+        memory, disk = cached_bytes(df.sparkSession)
+        log.info("unpersisting DataFrame (%s); session cache held %d bytes in memory, %d on disk in total", level, memory, disk)
+        cached.unpersist()
+
+
+def set_checkpoint_dir(spark: SparkSession, directory: str | Path) -> None:
+    """Point reliable checkpoints at *directory*; on a cluster this must be shared storage (HDFS, S3, ...)."""
+    spark.sparkContext.setCheckpointDir(str(directory))
+
+
+def checkpoint(df: DataFrame, *, eager: bool = True, local: bool = False) -> DataFrame:
+    """Materialise *df* and return a DataFrame whose lineage starts at the saved data.
+
+    ``local=True`` keeps the data on the executors instead of the checkpoint
+    directory: faster, but lost with the executor.
+    """
+    if local:
+        return df.localCheckpoint(eager=eager)
+    if df.sparkSession.sparkContext.getCheckpointDir() is None:
+        raise RuntimeError("No checkpoint directory set; call set_checkpoint_dir() first or pass local=True")
+    return df.checkpoint(eager=eager)
@@ -4,17 +4,22 @@ import argparse
 import os
 from collections.abc import Sequence
 
+from {module_name}.session import PROFILES
+
 DEFAULTS: dict[str, str] = {{
+    "checkpoint_dir": "spark-checkpoints",
     "env": "dev",
     "job": "example",
     "log_level": "WARNING",
+    "profile": "local-dev",
 }}
 
 
 def resolve_params(argv: Sequence[str] | None = None) -> dict[str, str]:
     parser = argparse.ArgumentParser(description="{name}")
+    parser.add_argument("--checkpoint-dir", dest="checkpoint_dir", default=None, help="Directory for DataFrame checkpoints (default: spark-checkpoints).")
     parser.add_argument("--env", default=None, help="Environment (default: dev).")
-    parser.add_argument("--job", default=None, help="Job to run (default: example).")
+    parser.add_argument("--job", default=None, help="Job to run, or a comma-separated list to run concurrently on one session (default: example).")
     parser.add_argument(
         "--log-level",
         dest="log_level",
@@ -22,6 +27,12 @@ def resolve_params(argv: Sequence[str] | None = None) -> dict[str, str]:
         choices=("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
         help="Logging level (default: WARNING).",
     )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        choices=PROFILES,
+        help="Spark performance profile (default: local-dev).",
+    )
     parsed = parser.parse_args(argv)
 
     params: dict[str, str] = {{}}
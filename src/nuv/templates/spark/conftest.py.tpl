@@ -1,15 +1,40 @@
+import os
+
 import pytest
 from pyspark.sql import SparkSession
 
+# Tuned for many tiny DataFrames rather than throughput: two cores and two
+# shuffle partitions, no UI, event log, Hive metastore or AQE re-planning, and
+# loopback networking so CI runners skip hostname lookups.
+TEST_CONFIG: dict[str, str] = {{
+    "spark.master": "local[2]",
+    "spark.driver.memory": "1g",
+    "spark.driver.bindAddress": "127.0.0.1",
+    "spark.driver.host": "localhost",
+    "spark.sql.shuffle.partitions": "2",
+    "spark.default.parallelism": "2",
+    "spark.sql.autoBroadcastJoinThreshold": "1m",
+    "spark.sql.adaptive.enabled": "false",
+    "spark.sql.catalogImplementation": "in-memory",
+    "spark.sql.session.timeZone": "UTC",
+    "spark.ui.enabled": "false",
+    "spark.ui.showConsoleProgress": "false",
+    "spark.eventLog.enabled": "false",
+    "spark.shuffle.compress": "false",
+    "spark.rdd.compress": "false",
+}}
+
 
 @pytest.fixture(scope="session")
-def spark():
-    session = (
-        SparkSession.builder
-        .master("local[*]")
-        .appName("test")
-        .config("spark.ui.enabled", "false")
-        .getOrCreate()
-    )
+def spark(tmp_path_factory):
+    # Session scope gives one JVM per test process; under pytest-xdist (-n auto)
+    # that is one per worker, each with its own warehouse and scratch dirs.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    scratch = tmp_path_factory.mktemp(f"spark-{{worker}}")
+    config = {{**TEST_CONFIG, "spark.sql.warehouse.dir": str(scratch / "warehouse"), "spark.local.dir": str(scratch / "local")}}
+    builder = SparkSession.builder.appName(f"{name}-tests-{{worker}}")
+    for key, value in config.items():
+        builder = builder.config(key, value)
+    session = builder.getOrCreate()
     yield session
     session.stop()
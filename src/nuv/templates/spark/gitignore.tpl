@@ -26,6 +26,7 @@ dist/
 derby.log
 metastore_db/
 spark-warehouse/
+spark-checkpoints/
 *.parquet
 *.snappy
 .ipynb_checkpoints/
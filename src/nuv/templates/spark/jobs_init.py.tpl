@@ -1 +1,80 @@
+"""Job registry.
 
+Every public module in this package that defines ``run(spark, params)`` is a
+job, named after the module. Discovery lists module names without importing
+them, so only the jobs that are actually selected pay their import cost.
+
+Several jobs can share one SparkSession: ``run_jobs`` runs them on a thread
+pool, each in its own FAIR scheduler pool, so a short job is not queued behind
+a long one. A job that returns a DataFrame is forced with ``count()`` while its
+pool is set, so its work really runs there; a job that writes its own output
+should do so inside ``run`` and may return ``None``.
+"""
+
+import importlib
+import logging
+import pkgutil
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from pyspark.sql import DataFrame, SparkSession
+
+log = logging.getLogger(__name__)
+
+SCHEDULER_POOL = "spark.scheduler.pool"
+DEFAULT_POOL = "default"  # the FAIR pool Spark uses when none is set
+
+Job = Callable[[SparkSession, dict[str, str]], Any]
+
+
+def available() -> list[str]:
+    return sorted(module.name for module in pkgutil.iter_modules(__path__) if not module.name.startswith("_"))
+
+
+def parse_jobs(spec: str) -> list[str]:
+    """Split a comma-separated job list and check every name against the registry."""
+    names = list(dict.fromkeys(name.strip() for name in spec.split(",") if name.strip()))
+    known = available()
+    if not names:
+        raise ValueError(f"No job selected; choose from {{', '.join(known)}}")
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"Unknown job(s) {{', '.join(unknown)}}; choose from {{', '.join(known)}}")
+    return names
+
+
+def load(name: str) -> Job:
+    return importlib.import_module(f"{{__name__}}.{{name}}").run
+
+
+def _execute(spark: SparkSession, name: str, params: dict[str, str]) -> Any:
+    result = load(name)(spark, params)
+    if isinstance(result, DataFrame):
+        log.info("job %s produced %d rows", name, result.count())
+    return result
+
+
+def run_job(spark: SparkSession, name: str, params: dict[str, str], *, pool: str | None = None) -> Any:
+    """Import and run one job; with *pool*, its Spark jobs are scheduled in that FAIR pool."""
+    if pool is None:
+        return _execute(spark, name, params)
+    # Local properties are per thread, so concurrent jobs each keep their own pool.
+    spark.sparkContext.setLocalProperty(SCHEDULER_POOL, pool)
+    try:
+        return _execute(spark, name, params)
+    finally:
+        spark.sparkContext.setLocalProperty(SCHEDULER_POOL, DEFAULT_POOL)
+
+
+def run_jobs(spark: SparkSession, names: Sequence[str], params: dict[str, str], *, max_workers: int | None = None) -> Mapping[str, Any]:
+    """Run *names* on one session and return each job's result, keyed by name.
+
+    A single job runs on the calling thread. Several run concurrently, one
+    scheduler pool per job; the first failure is re-raised once all have finished.
+    """
+    if len(names) == 1:
+        return {{names[0]: run_job(spark, names[0], params)}}
+    with ThreadPoolExecutor(max_workers=max_workers or len(names), thread_name_prefix="spark-job") as executor:
+        futures = {{name: executor.submit(run_job, spark, name, params, pool=name) for name in names}}
+    return {{name: future.result() for name, future in futures.items()}}
@@ -1,19 +1,27 @@
 """Entry point for {name}."""
 
+import sys
 from collections.abc import Sequence
 
 from {module_name}._logging import configure
+from {module_name}.cache import set_checkpoint_dir
 from {module_name}.config import resolve_params
-from {module_name}.jobs import example
+from {module_name}.jobs import parse_jobs, run_jobs
 from {module_name}.session import create_spark_session
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     params = resolve_params(argv)
     configure(params["log_level"])
-    spark = create_spark_session("{name}")
     try:
-        example.run(spark, params)
+        names = parse_jobs(params["job"])
+    except ValueError as exc:
+        sys.stderr.write(f"error: {{exc}}\n")
+        return 2
+    spark = create_spark_session("{name}", profile=params["profile"])
+    try:
+        set_checkpoint_dir(spark, params["checkpoint_dir"])
+        run_jobs(spark, names, params)
     finally:
         spark.stop()
     return 0
@@ -5,6 +5,8 @@ description = ""
 readme = "README.md"
 requires-python = ">={python_version}"
 dependencies = [
+    "pandas>=2.2.0",
+    "pyarrow>=15.0.0",
     "pyspark>=4.1.1,<5",
 ]
 
@@ -16,6 +18,7 @@ dev = [
     "chispa>=0.12.0",
     "pytest>=9.0.3",
     "pytest-cov>=7.1.0",
+    "pytest-xdist>=3.8.0",
     "ruff>=0.15.12",
     "ty>=0.0.33",
 ]
@@ -41,7 +44,7 @@ select = ["E", "F", "I", "UP", "B", "SIM"]
 branch = true
 
 [tool.coverage.report]
-exclude_lines = ["if __name__ == .__main__.:"]
+exclude_lines = ["pragma: no cover", "if __name__ == .__main__.:"]
 
 [tool.hatch.build.targets.wheel]
 packages = ["src/{module_name}"]
@@ -17,12 +17,27 @@ uv sync --group notebooks
 ```bash
 uv run python main.py --help
 uv run python main.py --env dev --job example
+uv run python main.py --profile local-large           # or SPARK_APP_PROFILE=local-large
+uv run python main.py --job example,vectorized        # several jobs concurrently on one session
+```
+
+Every module in `src/{module_name}/jobs/` with a `run(spark, params)` function is a job named after the module; only the selected jobs are imported. Several jobs run on a thread pool, each in its own FAIR scheduler pool. A DataFrame returned by `run` is forced with `count()` inside the job's pool; write results to storage inside `run` when you need the output.
+
+Reuse an intermediate DataFrame across several actions with `with persisted(df) as cached:` from `src/{module_name}/cache.py`; it is unpersisted when the block exits. `checkpoint(df)` cuts long lineages, writing to `--checkpoint-dir` (default `spark-checkpoints/`; use shared storage on a cluster).
+
+`--profile` picks the Spark tuning in `src/{module_name}/session.py`: `local-dev` (default, laptop), `local-large` (big single machine), or `cluster` (under `spark-submit`). Every profile enables AQE, Kryo, and Arrow.
+
+When a job needs Python logic, start from `src/{module_name}/jobs/vectorized.py`: `pandas_udf` and `mapInArrow` move Arrow batches instead of pickled rows. Compare on your machine with:
+
+```bash
+uv run python benchmarks/udf.py --rows 5_000_000
 ```
 
 ## Development
 
 ```bash
 uv run pytest          # run tests
+uv run pytest -n auto  # run tests in parallel, one Spark JVM per worker
 uv run ruff check .    # lint
 uv run ruff format .   # format
 uv run ty check .      # type check
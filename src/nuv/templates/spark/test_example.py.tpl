@@ -1,12 +1,27 @@
 import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
+import pyarrow as pa
+import pytest
 from chispa import assert_df_equality
+from pyspark import StorageLevel
+from pyspark.sql import DataFrame
 
 from {module_name}._logging import configure
+from {module_name}.cache import cached_bytes, checkpoint, persisted, set_checkpoint_dir
 from {module_name}.config import resolve_params
+from {module_name}.jobs import DEFAULT_POOL, SCHEDULER_POOL, available, load, parse_jobs, run_job, run_jobs
 from {module_name}.jobs.example import run, transform
-from {module_name}.session import create_spark_session
+from {module_name}.jobs.vectorized import TAX_RATE, add_tax_column, tax, with_tax, with_tax_arrow
+from {module_name}.jobs.vectorized import run as run_vectorized
+from {module_name}.session import COMMON_CONFIG, PROFILES, create_spark_session, profile_config
 
 
 # --- Main ---
@@ -17,14 +32,26 @@ def test_main_returns_zero():
 
     mock_spark = MagicMock()
     with (
-        patch("main.create_spark_session", return_value=mock_spark),
-        patch("main.example") as mock_example,
+        patch("main.create_spark_session", return_value=mock_spark) as mock_create,
+        patch("main.run_jobs") as mock_run_jobs,
     ):
-        result = main([])
+        result = main(["--profile", "local-large"])
     assert result == 0
+    assert mock_create.call_args.kwargs["profile"] == "local-large"
+    assert mock_run_jobs.call_args.args[1] == ["example"]
+    mock_spark.sparkContext.setCheckpointDir.assert_called_once_with("spark-checkpoints")
     mock_spark.stop.assert_called_once()
 
 
+def test_main_rejects_unknown_job_before_starting_spark(capsys):
+    from main import main
+
+    with patch("main.create_spark_session") as mock_create:
+        assert main(["--job", "nope"]) == 2
+    mock_create.assert_not_called()
+    assert capsys.readouterr().err == "error: Unknown job(s) nope; choose from example, vectorized\n"
+
+
 # --- Jobs ---
 
 
@@ -46,14 +73,209 @@ def test_run_returns_filtered_dataframe(spark):
     assert result.count() == 2
 
 
+# --- Vectorised transforms ---
+
+
+def test_vectorized_modules_import_without_a_session():
+    # A UDF return type given as a DDL string is parsed at import and fails without a SparkContext.
+    code = (
+        "import importlib.util, {module_name}.jobs.vectorized;"
+        "spec = importlib.util.spec_from_file_location('udf_benchmark', 'benchmarks/udf.py');"
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parents[1], check=True)
+
+
+def test_tax():
+    result = tax(pd.Series([10.0, 25.5, None]))
+    assert result.iloc[:2].tolist() == [10.0 * (1 + TAX_RATE), 25.5 * (1 + TAX_RATE)]
+    assert pd.isna(result.iloc[2])
+
+
+def test_add_tax_column():
+    batch = pa.RecordBatch.from_pydict({{"name": ["alice", "nobody"], "amount": [10.0, None]}})
+    result = add_tax_column(batch)
+    assert result.schema.names == ["name", "amount", "amount_with_tax"]
+    assert result.column("amount_with_tax").to_pylist() == [10.0 * (1 + TAX_RATE), None]
+
+
+def test_with_tax_pandas_udf(spark):
+    source = spark.createDataFrame([("alice", 10.0), ("bob", 25.5), ("nobody", None)], "name string, amount double")
+    expected = spark.createDataFrame(
+        [("alice", 10.0, 10.0 * (1 + TAX_RATE)), ("bob", 25.5, 25.5 * (1 + TAX_RATE)), ("nobody", None, None)],
+        "name string, amount double, amount_with_tax double",
+    )
+    assert_df_equality(with_tax(source), expected, ignore_row_order=True)
+
+
+def test_with_tax_arrow_matches_pandas_udf(spark):
+    source = spark.range(1000).selectExpr("id", "id / 10 as amount")
+    assert_df_equality(with_tax_arrow(source), with_tax(source), ignore_row_order=True)
+
+
+def test_run_vectorized_job(spark):
+    result = run_vectorized(spark, {{"env": "dev", "job": "vectorized", "log_level": "WARNING"}})
+    assert result.columns == ["name", "amount", "amount_with_tax"]
+    assert result.count() == 3
+
+
+# --- Job registry ---
+
+
+def test_available_lists_jobs_without_importing_them(monkeypatch):
+    monkeypatch.delitem(sys.modules, "{module_name}.jobs.example", raising=False)
+    assert available() == ["example", "vectorized"]
+    assert "{module_name}.jobs.example" not in sys.modules
+
+
+def test_load_imports_the_selected_job():
+    assert load("example") is run
+
+
+def test_parse_jobs():
+    assert parse_jobs(" example, example ") == ["example"]
+    with pytest.raises(ValueError, match="No job selected; choose from example, vectorized"):
+        parse_jobs(" , ")
+    with pytest.raises(ValueError, match="Unknown job\\(s\\) etl; choose from example, vectorized"):
+        parse_jobs("example,etl")
+
+
+def test_run_job_sets_and_resets_scheduler_pool():
+    mock_spark = MagicMock()
+    with patch("{module_name}.jobs.load", return_value=lambda spark, params: "done") as mock_load:
+        assert run_job(mock_spark, "example", {{}}, pool="nightly") == "done"
+        assert run_job(mock_spark, "example", {{}}) == "done"
+    assert mock_load.call_count == 2
+    assert mock_spark.sparkContext.setLocalProperty.call_args_list == [
+        ((SCHEDULER_POOL, "nightly"),),
+        ((SCHEDULER_POOL, DEFAULT_POOL),),
+    ]
+
+
+def test_run_job_forces_returned_dataframe_inside_its_pool():
+    mock_spark = MagicMock()
+    df = MagicMock(spec=DataFrame)
+    pools_during_count = []
+    df.count.side_effect = lambda: pools_during_count.append(mock_spark.sparkContext.setLocalProperty.call_args.args[1]) or 3
+    with patch("{module_name}.jobs.load", return_value=lambda spark, params: df):
+        assert run_job(mock_spark, "example", {{}}, pool="nightly") is df
+    assert pools_during_count == ["nightly"]
+
+
+def test_run_jobs_runs_several_jobs_concurrently_in_their_own_pools():
+    barrier = threading.Barrier(2, timeout=5)
+    pools = {{}}
+    mock_spark = MagicMock()
+    mock_spark.sparkContext.setLocalProperty.side_effect = lambda key, value: value != DEFAULT_POOL and pools.setdefault(threading.get_ident(), value)
+
+    def fake_load(name):
+        def job(spark, params):
+            barrier.wait()  # both jobs must be in flight at once
+            return name.upper()
+
+        return job
+
+    with patch("{module_name}.jobs.load", side_effect=fake_load):
+        results = run_jobs(mock_spark, ["a", "b"], {{}})
+    assert results == {{"a": "A", "b": "B"}}
+    assert sorted(pools.values()) == ["a", "b"]
+
+
+def test_run_jobs_single_job_runs_inline(spark):
+    results = run_jobs(spark, ["example"], {{"env": "dev", "job": "example", "log_level": "WARNING"}})
+    assert results["example"].count() == 2
+
+
+def test_run_jobs_reraises_job_failure():
+    def fake_load(name):
+        def job(spark, params):
+            if name == "bad":
+                raise RuntimeError("boom")
+            return name
+
+        return job
+
+    with patch("{module_name}.jobs.load", side_effect=fake_load), pytest.raises(RuntimeError, match="boom"):
+        run_jobs(MagicMock(), ["good", "bad"], {{}})
+
+
+# --- Caching and checkpoints ---
+
+
+def test_persisted_caches_inside_block_and_unpersists_after(spark, caplog):
+    df = spark.range(1000)
+    with caplog.at_level(logging.INFO, logger="{module_name}.cache"), persisted(df, StorageLevel.MEMORY_ONLY) as cached:
+        assert cached.count() == 1000
+        assert cached.is_cached
+        memory, _ = cached_bytes(spark)
+        assert memory > 0
+    assert not df.is_cached
+    assert "session cache held" in caplog.text
+
+
+def test_persisted_unpersists_on_error(spark):
+    df = spark.range(10)
+    with pytest.raises(RuntimeError, match="boom"), persisted(df):
+        df.count()
+        raise RuntimeError("boom")
+    assert not df.is_cached
+
+
+def test_checkpoint_truncates_lineage(spark, tmp_path):
+    set_checkpoint_dir(spark, tmp_path)
+    df = spark.range(100).filter("id % 2 = 0")
+    saved = checkpoint(df)
+    assert saved.count() == 50
+    assert any(tmp_path.rglob("*"))
+    assert "Filter" not in saved._jdf.queryExecution().logical().toString()
+
+
+def test_local_checkpoint_needs_no_directory(spark):
+    assert checkpoint(spark.range(10), local=True).count() == 10
+
+
+def test_checkpoint_without_directory_raises():
+    df = MagicMock()
+    df.sparkSession.sparkContext.getCheckpointDir.return_value = None
+    with pytest.raises(RuntimeError, match="No checkpoint directory set"):
+        checkpoint(df)
+    df.checkpoint.assert_not_called()
+
+
+# --- Test fixture ---
+
+
+def test_spark_fixture_is_tuned_for_tests(spark):
+    # Static settings only: later tests may adjust runtime SQL config on the shared session.
+    assert spark.sparkContext.master == "local[2]"
+    assert spark.conf.get("spark.sql.catalogImplementation") == "in-memory"
+    assert spark.conf.get("spark.ui.enabled") == "false"
+
+
+def test_small_job_runs_within_budget(spark):
+    """Guard against fixture regressions: a trivial job on the warm session must stay fast.
+
+    Override the budget on slow runners with SPARK_TEST_BUDGET_SECONDS.
+    """
+    budget = float(os.environ.get("SPARK_TEST_BUDGET_SECONDS", "5"))
+    source = spark.createDataFrame([("alice", 1), ("bob", 2), ("charlie", 3)], ["name", "value"])
+    transform(source).groupBy("name").count().collect()  # warm up code generation
+    start = time.perf_counter()
+    transform(source).groupBy("name").count().collect()
+    elapsed = time.perf_counter() - start
+    assert elapsed < budget, f"trivial job took {{elapsed:.2f}}s (budget {{budget}}s)"
+
+
 # --- Config ---
 
 
 def test_resolve_params_defaults():
     params = resolve_params([])
+    assert params["checkpoint_dir"] == "spark-checkpoints"
     assert params["env"] == "dev"
     assert params["job"] == "example"
     assert params["log_level"] == "WARNING"
+    assert params["profile"] == "local-dev"
 
 
 def test_resolve_params_cli_overrides():
@@ -62,10 +284,18 @@ def test_resolve_params_cli_overrides():
     assert params["job"] == "etl"
 
 
+def test_resolve_params_rejects_unknown_profile(capsys):
+    with pytest.raises(SystemExit):
+        resolve_params(["--profile", "huge"])
+    assert "invalid choice: 'huge'" in capsys.readouterr().err
+
+
 def test_resolve_params_env_var(monkeypatch):
     monkeypatch.setenv("SPARK_APP_ENV", "staging")
+    monkeypatch.setenv("SPARK_APP_PROFILE", "cluster")
     params = resolve_params([])
     assert params["env"] == "staging"
+    assert params["profile"] == "cluster"
 
 
 # --- Logging ---
@@ -83,3 +313,55 @@ def test_configure_suppresses_spark_loggers():
 def test_create_spark_session_returns_active_session(spark):
     session = create_spark_session("test-app")
     assert session is not None
+
+
+def test_create_spark_session_applies_profile_config():
+    # Mocked so the shared test session keeps its fixture config.
+    with patch("{module_name}.session.SparkSession") as mock_session_cls:
+        builder = mock_session_cls.builder.appName.return_value
+        builder.config.return_value = builder
+        create_spark_session("test-app", profile="cluster", overrides={{"spark.sql.shuffle.partitions": "3"}})
+    applied = dict(call.args for call in builder.config.call_args_list)
+    assert applied == profile_config("cluster", {{"spark.sql.shuffle.partitions": "3"}})
+    builder.getOrCreate.assert_called_once()
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_every_profile_enables_aqe_kryo_and_arrow(profile):
+    config = profile_config(profile)
+    assert COMMON_CONFIG.items() <= config.items()
+    assert config["spark.sql.adaptive.enabled"] == "true"
+    assert config["spark.serializer"] == "org.apache.spark.serializer.KryoSerializer"
+    assert config["spark.sql.execution.arrow.pyspark.enabled"] == "true"
+    assert int(config["spark.sql.shuffle.partitions"]) > 0
+
+
+def test_local_dev_profile(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    config = profile_config("local-dev")
+    assert config["spark.master"] == "local[*]"
+    assert config["spark.sql.shuffle.partitions"] == "8"
+    assert config["spark.driver.memory"] == "2g"
+    assert config["spark.ui.enabled"] == "false"
+
+
+def test_local_large_profile(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 16)
+    config = profile_config("local-large")
+    assert config["spark.master"] == "local[*]"
+    assert config["spark.sql.shuffle.partitions"] == "128"
+    assert config["spark.driver.memory"] == "8g"
+
+
+def test_cluster_profile_leaves_master_to_spark_submit():
+    config = profile_config("cluster")
+    assert "spark.master" not in config
+    assert "spark.driver.memory" not in config
+    assert config["spark.sql.shuffle.partitions"] == "400"
+    assert config["spark.dynamicAllocation.enabled"] == "true"
+
+
+def test_profile_config_overrides_and_unknown_profile():
+    assert profile_config("cluster", {{"spark.sql.shuffle.partitions": "2000"}})["spark.sql.shuffle.partitions"] == "2000"
+    with pytest.raises(ValueError, match="Unknown Spark profile 'huge'"):
+        profile_config("huge")
@@ -0,0 +1,64 @@
+"""Vectorised Python transforms: the default when a job needs Python logic.
+
+A plain ``udf`` pickles every row across the JVM/Python boundary and calls the
+function once per row. ``pandas_udf`` and ``mapInArrow`` always move whole
+Arrow record batches instead and run the logic column-at-a-time in
+pandas/pyarrow. Prefer a built-in ``pyspark.sql.functions`` expression when
+one exists; reach for these only for logic Spark cannot express.
+
+The math lives in plain functions (``tax``, ``add_tax_column``) that are
+tested directly; the UDF wrappers only run inside Python worker processes,
+which coverage does not see. Return types are ``DataType`` objects, not DDL
+strings: a string is parsed at import time and needs an active SparkContext.
+
+``benchmarks/udf.py`` compares both against a plain Python UDF.
+"""
+
+from collections.abc import Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.functions import pandas_udf
+from pyspark.sql.types import DoubleType, StructField, StructType
+
+TAX_RATE = 0.2
+
+
+def tax(amount: pd.Series) -> pd.Series:
+    return amount * (1 + TAX_RATE)
+
+
+def add_tax_column(batch: pa.RecordBatch) -> pa.RecordBatch:
+    # pc.multiply is generated when pyarrow.compute is imported, so type checkers can't see it.
+    taxed = pc.call_function("multiply", [batch.column("amount"), pa.scalar(1 + TAX_RATE)])
+    return pa.RecordBatch.from_arrays([*batch.columns, taxed], names=[*batch.schema.names, "amount_with_tax"])
+
+
+# pyspark's stubs only type the deprecated functionType= form, not type-hinted UDFs.
+@pandas_udf(DoubleType())  # ty: ignore[no-matching-overload]
+def add_tax(amount: pd.Series) -> pd.Series:  # pragma: no cover - runs in a Python worker
+    return tax(amount)
+
+
+def with_tax(df: DataFrame) -> DataFrame:
+    """Add ``amount_with_tax`` with a scalar pandas UDF."""
+    return df.withColumn("amount_with_tax", add_tax("amount"))
+
+
+def _add_tax_batches(batches: Iterator[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:  # pragma: no cover - runs in a Python worker
+    for batch in batches:
+        yield add_tax_column(batch)
+
+
+def with_tax_arrow(df: DataFrame) -> DataFrame:
+    """Add ``amount_with_tax`` with ``mapInArrow``: whole batches, no pandas conversion."""
+    schema = StructType([*df.schema.fields, StructField("amount_with_tax", DoubleType())])
+    return df.mapInArrow(_add_tax_batches, schema)
+
+
+def run(spark: SparkSession, params: dict[str, str]) -> DataFrame:
+    data = [("alice", 10.0), ("bob", 25.5), ("charlie", 4.0)]
+    df = spark.createDataFrame(data, ["name", "amount"])
+    return with_tax(df)
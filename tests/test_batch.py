@@ -0,0 +1,284 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nuv.cli import main as cli_main
+from nuv.commands.batch import DEFAULT_JOBS, ManifestEntry, load_manifest, run_batch, validate_jobs
+
+
+def _write_manifest(tmp_path: Path, body: str) -> Path:
+    manifest = tmp_path / "manifest.toml"
+    manifest.write_text(body, encoding="utf-8")
+    return manifest
+
+
+# ---------------------------------------------------------------------------
+# load_manifest
+# ---------------------------------------------------------------------------
+
+
+def test_load_manifest_applies_defaults_and_archetype_versions(tmp_path: Path) -> None:
+    manifest = _write_manifest(
+        tmp_path,
+        """
+[defaults]
+archetype = "fastapi"
+
+[[project]]
+name = "api"
+
+[[project]]
+name = "jobs"
+archetype = "spark"
+at = "services/jobs"
+
+[[project]]
+name = "tool"
+archetype = "script"
+python_version = "3.12"
+""",
+    )
+    assert load_manifest(manifest) == [
+        ManifestEntry(name="api", archetype="fastapi", python_version="3.14", target=tmp_path / "api"),
+        ManifestEntry(name="jobs", archetype="spark", python_version="3.13", target=tmp_path / "services/jobs"),
+        ManifestEntry(name="tool", archetype="script", python_version="3.12", target=tmp_path / "tool"),
+    ]
+
+
+def test_load_manifest_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="Manifest not found"):
+        load_manifest(tmp_path / "nope.toml")
+
+
+def test_load_manifest_invalid_toml(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]\n")
+    with pytest.raises(ValueError, match="Invalid manifest"):
+        load_manifest(manifest)
+
+
+def test_load_manifest_no_projects(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[defaults]\narchetype = 'script'\n")
+    with pytest.raises(ValueError, match="no \\[\\[project\\]\\] entries"):
+        load_manifest(manifest)
+
+
+def test_load_manifest_unknown_default_key(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[defaults]\nname = 'x'\n\n[[project]]\nname = 'a'\n")
+    with pytest.raises(ValueError, match="\\[defaults\\]: unknown keys \\['name'\\]"):
+        load_manifest(manifest)
+
+
+def test_load_manifest_reports_every_invalid_entry(tmp_path: Path) -> None:
+    (tmp_path / "exists").mkdir()
+    manifest = _write_manifest(
+        tmp_path,
+        """
+[[project]]
+name = "bad name"
+
+[[project]]
+name = "ok"
+python_version = "3.14.1"
+
+[[project]]
+name = "ok2"
+archetype = "django"
+
+[[project]]
+name = "ok3"
+colour = "blue"
+
+[[project]]
+name = "exists"
+
+[[project]]
+name = "first"
+at = "shared"
+
+[[project]]
+name = "second"
+at = "shared"
+""",
+    )
+    with pytest.raises(ValueError) as exc_info:
+        load_manifest(manifest)
+    message = str(exc_info.value)
+    assert "project #1: Name cannot contain spaces" in message
+    assert "project #2: Python version must be MAJOR.MINOR" in message
+    assert "project #3: Unknown archetype: 'django'" in message
+    assert "project #4: unknown keys ['colour']" in message
+    assert "project #5: Directory already exists" in message
+    assert "project #7: target" in message
+    assert "already used by 'first'" in message
+
+
+def test_load_manifest_rejects_wrong_value_types(tmp_path: Path) -> None:
+    manifest = _write_manifest(
+        tmp_path,
+        """
+project = [{ name = "ok", python_version = 3.13 }, { name = "ok2", at = 7 }, { name = 5 }, "not-a-table"]
+""",
+    )
+    with pytest.raises(ValueError) as exc_info:
+        load_manifest(manifest)
+    message = str(exc_info.value)
+    assert "project #1: python_version must be a string" in message
+    assert "project #2: at must be a string" in message
+    assert "project #3: name must be a string" in message
+    assert "project #4: entry must be a table" in message
+
+
+def test_load_manifest_rejects_wrong_default_type(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[defaults]\narchetype = ['script']\n\n[[project]]\nname = 'a'\n")
+    with pytest.raises(ValueError, match="project #1: archetype must be a string"):
+        load_manifest(manifest)
+
+
+@pytest.mark.parametrize(
+    ("body", "match"),
+    [
+        ("defaults = 'fastapi'\n\n[[project]]\nname = 'a'\n", "\\[defaults\\] must be a table"),
+        ("project = 'a'\n", "project must be an array of tables"),
+    ],
+)
+def test_load_manifest_rejects_wrong_section_types(tmp_path: Path, body: str, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        load_manifest(_write_manifest(tmp_path, body))
+
+
+# ---------------------------------------------------------------------------
+# run_batch
+# ---------------------------------------------------------------------------
+
+
+def test_run_batch_scaffolds_every_project(tmp_path: Path) -> None:
+    manifest = _write_manifest(
+        tmp_path,
+        """
+[[project]]
+name = "tool"
+
+[[project]]
+name = "api"
+archetype = "fastapi"
+""",
+    )
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+        assert run_batch(manifest) == 0
+    assert (tmp_path / "tool" / "main.py").exists()
+    assert (tmp_path / "api" / "src" / "api" / "app.py").exists()
+    assert mock_run.call_count == 2
+
+
+def test_run_batch_invalid_manifest_scaffolds_nothing(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]]\nname = 'good'\n\n[[project]]\nname = 'bad name'\n")
+    with patch("nuv.commands.batch.run_new") as mock_run_new:
+        assert run_batch(manifest) == 1
+    mock_run_new.assert_not_called()
+    assert "project #2" in caplog.text
+
+
+def test_run_batch_invalid_install_mode(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]]\nname = 'good'\n")
+    assert run_batch(manifest, install_mode="bad") == 1
+
+
+def test_run_batch_reports_per_project_failures(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]]\nname = 'one'\n\n[[project]]\nname = 'two'\n")
+    with (
+        patch("nuv.commands.batch.run_new", side_effect=[0, 1]),
+        caplog.at_level("INFO", logger="nuv.commands.batch"),
+    ):
+        assert run_batch(manifest) == 1
+    assert "ok     one" in caplog.text
+    assert "failed two" in caplog.text
+    assert "batch: 1 succeeded, 1 failed" in caplog.text
+
+
+def test_validate_jobs() -> None:
+    assert validate_jobs(3) == 3
+    with pytest.raises(ValueError, match="at least 1"):
+        validate_jobs(0)
+
+
+def test_run_batch_invalid_jobs(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]]\nname = 'good'\n")
+    assert run_batch(manifest, jobs=0) == 1
+
+
+def test_run_batch_parallel_prefixes_output_and_rolls_back_per_project(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]]\nname = 'one'\n\n[[project]]\nname = 'two'\n")
+
+    def _fake_prefixed(command: list[str], *, cwd: Path, prefix: str) -> int:
+        return 1 if prefix == "two" else 0
+
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.run_prefixed", side_effect=_fake_prefixed) as mock_prefixed,
+    ):
+        assert run_batch(manifest, jobs=2) == 1
+    assert sorted(call.kwargs["prefix"] for call in mock_prefixed.call_args_list) == ["one", "two"]
+    assert (tmp_path / "one" / "main.py").exists()
+    assert not (tmp_path / "two").exists()
+
+
+def test_run_batch_single_job_does_not_prefix(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]]\nname = 'one'\n")
+    with patch("nuv.commands.batch.run_new", return_value=0) as mock_run_new:
+        assert run_batch(manifest, jobs=1) == 0
+    assert mock_run_new.call_args[1]["output_prefix"] is None
+
+
+def test_run_batch_passes_lock_cache_and_offline(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]]\nname = 'one'\n")
+    with patch("nuv.commands.batch.run_new", return_value=0) as mock_run_new:
+        assert run_batch(manifest, lock_cache=True, offline=True) == 0
+    assert mock_run_new.call_args[1]["lock_cache"] is True
+    assert mock_run_new.call_args[1]["offline"] is True
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def test_cli_batch_dispatches(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, "[[project]]\nname = 'tool'\n")
+    with patch("nuv.commands.batch.run_batch", return_value=0) as mock_run_batch:
+        assert cli_main(["batch", str(manifest), "--install", "command-only", "--keep-on-failure"]) == 0
+    mock_run_batch.assert_called_once_with(
+        str(manifest),
+        install_mode="command-only",
+        keep_on_failure=True,
+        jobs=DEFAULT_JOBS,
+        lock_cache=False,
+        offline=False,
+    )
+
+
+def test_cli_batch_jobs_passed_through(tmp_path: Path) -> None:
+    with patch("nuv.commands.batch.run_batch", return_value=0) as mock_run_batch:
+        assert cli_main(["batch", str(tmp_path / "manifest.toml"), "--jobs", "8"]) == 0
+    assert mock_run_batch.call_args[1]["jobs"] == 8
+
+
+@pytest.mark.parametrize("value", ["0", "many"])
+def test_cli_batch_invalid_jobs_rejected(value: str) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main(["batch", "manifest.toml", "--jobs", value])
+    assert exc_info.value.code == 2
+
+
+def test_cli_batch_unexpected_error_returns_1(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with (
+        patch("nuv.commands.batch.run_batch", side_effect=Exception("boom")),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        cli_main(["batch", str(tmp_path / "manifest.toml")])
+    assert exc_info.value.code == 1
+    assert "ERROR unexpected failure" in capsys.readouterr().err
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from nuv import _lockcache
+from nuv._lockcache import PROJECT_SENTINEL, cache_dir, evict, lock_key, restore, store
+
+LOCK = """version = 1
+requires-python = ">=3.14"
+
+[[package]]
+name = "my-project"
+version = "0.1.0"
+source = {{ {source} = "." }}
+dependencies = [
+    {{ name = "polars" }},
+]
+
+[[package]]
+name = "polars"
+version = "1.40.1"
+source = {{ registry = "https://pypi.org/simple" }}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("NUV_CACHE_DIR", str(cache))
+    return cache
+
+
+def test_cache_dir_env_precedence(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert cache_dir() == tmp_path / "cache"
+    monkeypatch.delenv("NUV_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert cache_dir() == tmp_path / "xdg" / "nuv"
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    assert cache_dir() == tmp_path / "home" / ".cache" / "nuv"
+
+
+def test_lock_key_is_stable_sha256() -> None:
+    assert lock_key("a") == lock_key("a")
+    assert lock_key("a") != lock_key("b")
+    assert len(lock_key("a")) == 64
+
+
+@pytest.mark.parametrize("source", ["editable", "virtual"])
+def test_store_then_restore_renames_project(tmp_path: Path, source: str) -> None:
+    first = tmp_path / "first"
+    first.mkdir()
+    (first / "uv.lock").write_text(LOCK.format(source=source))
+    assert store("k", first) is True
+    cached = (cache_dir() / "locks" / "k.lock").read_text()
+    assert f'name = "{PROJECT_SENTINEL}"' in cached
+    assert 'name = "polars"' in cached
+
+    second = tmp_path / "second"
+    second.mkdir()
+    assert restore("k", second, name="Other_Project") is True
+    restored = (second / "uv.lock").read_text()
+    assert restored == LOCK.format(source=source).replace('"my-project"', '"other-project"')
+
+
+def test_restore_miss(tmp_path: Path) -> None:
+    assert restore("missing", tmp_path, name="x") is False
+    assert not (tmp_path / "uv.lock").exists()
+
+
+def test_store_without_lock(tmp_path: Path) -> None:
+    assert store("k", tmp_path) is False
+
+
+def test_store_skips_unrecognised_lock(tmp_path: Path) -> None:
+    (tmp_path / "uv.lock").write_text("version = 1\n")
+    assert store("k", tmp_path) is False
+    assert not (cache_dir() / "locks" / "k.lock").exists()
+
+
+def test_evict(tmp_path: Path) -> None:
+    (tmp_path / "uv.lock").write_text(LOCK.format(source="editable"))
+    store("k", tmp_path)
+    evict("k")
+    evict("k")
+    assert not _lockcache._entry("k").exists()
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -8,12 +9,20 @@ from nuv.commands.new import (
     DEFAULT_PYTHON_VERSION,
     DEFAULT_PYTHON_VERSIONS,
     build_tool_install_command,
+    create_staging_dir,
+    discard_in_background,
     generate_jupyter_notebook,
+    lock_cache_key,
+    publish,
     render_template,
+    report_timings,
     resolve_target,
     run_new,
+    run_prefixed,
     run_tool_install,
     run_uv_sync,
+    scaffold_and_sync_pipelined,
+    scaffold_env_files,
     scaffold_files,
     validate_install_mode,
     validate_name,
@@ -365,6 +374,24 @@ def test_scaffold_files_unknown_archetype_raises(tmp_path: Path) -> None:
         scaffold_files(target, name="my-project", module_name="my_project", archetype="unknown")
 
 
+def test_scaffold_env_files_writes_only_uv_inputs(tmp_path: Path) -> None:
+    scaffold_env_files(tmp_path, name="my-project", module_name="my_project", python_version="3.13")
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".python-version", "pyproject.toml"]
+    assert (tmp_path / ".python-version").read_text() == "3.13\n"
+
+
+def test_scaffold_env_files_unknown_archetype_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unknown archetype"):
+        scaffold_env_files(tmp_path, name="my-project", module_name="my_project", archetype="unknown")
+
+
+def test_scaffold_files_without_env_files(tmp_path: Path) -> None:
+    scaffold_files(tmp_path, name="my-project", module_name="my_project", env_files=False)
+    assert (tmp_path / "main.py").exists()
+    assert not (tmp_path / ".python-version").exists()
+    assert not (tmp_path / "pyproject.toml").exists()
+
+
 # ---------------------------------------------------------------------------
 # run_uv_sync
 # ---------------------------------------------------------------------------
@@ -384,6 +411,32 @@ def test_run_uv_sync_calls_uv(tmp_path: Path) -> None:
         )
 
 
+def test_run_uv_sync_with_prefix_streams_output(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.run_prefixed", return_value=0) as mock_prefixed,
+    ):
+        run_uv_sync(tmp_path, output_prefix="my-project")
+    mock_prefixed.assert_called_once_with(["uv", "sync"], cwd=tmp_path, prefix="my-project")
+
+
+def test_run_uv_sync_with_prefix_nonzero_exit(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.run_prefixed", return_value=2),
+        pytest.raises(RuntimeError, match="uv sync failed \\(exit 2\\)"),
+    ):
+        run_uv_sync(tmp_path, output_prefix="my-project")
+
+
+def test_run_prefixed_prefixes_each_line(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    command = [sys.executable, "-c", "import sys; print('hello'); print('oops', file=sys.stderr); sys.exit(3)"]
+    assert run_prefixed(command, cwd=tmp_path, prefix="proj") == 3
+    err = capsys.readouterr().err
+    assert "[proj] hello\n" in err
+    assert "[proj] oops\n" in err
+
+
 def test_run_uv_sync_uv_not_found(tmp_path: Path) -> None:
     with (
         patch("nuv.commands.new.shutil.which", return_value=None),
@@ -402,6 +455,86 @@ def test_run_uv_sync_nonzero_exit(tmp_path: Path) -> None:
         run_uv_sync(tmp_path)
 
 
+# ---------------------------------------------------------------------------
+# scaffold_and_sync_pipelined
+# ---------------------------------------------------------------------------
+
+
+def test_scaffold_and_sync_pipelined_syncs_dependencies_then_project(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+        scaffold_and_sync_pipelined(tmp_path, name="my-project", module_name="my_project")
+    assert [c.args[0] for c in mock_run.call_args_list] == [["uv", "sync", "--no-install-project"], ["uv", "sync"]]
+    assert (tmp_path / "pyproject.toml").exists()
+    assert (tmp_path / "tests" / "test_main.py").exists()
+
+
+def test_scaffold_and_sync_pipelined_env_failure_raises(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+        pytest.raises(RuntimeError, match="uv sync failed \\(exit 1\\)"),
+    ):
+        mock_run.return_value = MagicMock(returncode=1)
+        scaffold_and_sync_pipelined(tmp_path, name="my-project", module_name="my_project")
+    mock_run.assert_called_once()
+
+
+def test_scaffold_and_sync_pipelined_uv_not_found(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value=None),
+        pytest.raises(RuntimeError, match="uv not found"),
+    ):
+        scaffold_and_sync_pipelined(tmp_path, name="my-project", module_name="my_project")
+    assert not (tmp_path / "pyproject.toml").exists()
+
+
+def test_run_new_pipeline_success(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+        result = run_new("cool-tool", cwd=tmp_path, pipeline=True, install_mode="none")
+    assert result == 0
+    assert (tmp_path / "cool-tool" / "main.py").exists()
+    assert mock_run.call_count == 2
+
+
+def test_run_new_pipeline_scaffold_failure_cleans_up(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+        patch("nuv.commands.new.scaffold_files", side_effect=FileNotFoundError("template not found")),
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+        result = run_new("cool-tool", cwd=tmp_path, pipeline=True)
+    assert result == 1
+    mock_run.assert_called_once_with(["uv", "sync", "--no-install-project"], cwd=tmp_path / "cool-tool", check=False)
+    assert not (tmp_path / "cool-tool").exists()
+
+
+def test_run_new_pipeline_env_failure_cleans_up(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=1)
+        result = run_new("cool-tool", cwd=tmp_path, pipeline=True)
+    assert result == 1
+    assert not (tmp_path / "cool-tool").exists()
+
+
+def test_cli_new_pipeline_flag(tmp_path: Path) -> None:
+    with patch("nuv.commands.new.run_new", return_value=0) as mock_run_new:
+        result = cli_main(["new", "test-proj", "--pipeline"])
+    assert result == 0
+    assert mock_run_new.call_args[1]["pipeline"] is True
+
+
 # ---------------------------------------------------------------------------
 # run_new
 # ---------------------------------------------------------------------------
@@ -453,6 +586,382 @@ def test_run_new_missing_template(tmp_path: Path) -> None:
     assert result == 1
 
 
+def test_run_new_timings_prints_table(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+        result = run_new("cool-tool", cwd=tmp_path, timings=True)
+    assert result == 0
+    err = capsys.readouterr().err
+    for label in ("validate", "scaffold", "uv sync", "uv tool install", "render (", "write (", "$ uv sync", "total"):
+        assert label in err
+
+
+def test_run_new_timings_json(tmp_path: Path) -> None:
+    import json
+
+    report = tmp_path / "timings.json"
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+        result = run_new("cool-tool", cwd=tmp_path, archetype="fastapi", pipeline=True, timings_json=str(report))
+    assert result == 0
+    data = json.loads(report.read_text())
+    assert data["name"] == "cool-tool"
+    assert data["archetype"] == "fastapi"
+    assert data["exit_code"] == 0
+    assert data["pipeline"] is True
+    assert data["total_seconds"] >= sum(data["phases"].values()) - 1e-6
+    assert list(data["phases"]) == ["validate", "scaffold + uv sync", "uv tool install"]
+    assert {r["template"] for r in data["renders"]} >= {"fastapi/app.py.tpl", "fastapi/dockerfile.tpl"}
+    assert any(w["path"] == "pyproject.toml" for w in data["writes"])
+    assert all(w["bytes"] > 0 for w in data["writes"] if w["path"] != "tests/__init__.py")
+    assert [p["command"] for p in data["subprocesses"]] == ["uv sync --no-install-project", "uv sync"]
+
+
+def test_run_new_timings_json_on_failure(tmp_path: Path) -> None:
+    import json
+
+    report = tmp_path / "timings.json"
+    result = run_new("bad name", cwd=tmp_path, timings_json=str(report))
+    assert result == 1
+    data = json.loads(report.read_text())
+    assert data["exit_code"] == 1
+    assert data["target"] is None
+    assert data["writes"] == []
+
+
+def test_run_new_timings_json_unknown_version(tmp_path: Path) -> None:
+    import json
+    from importlib.metadata import PackageNotFoundError
+
+    report = tmp_path / "timings.json"
+    with patch("importlib.metadata.version", side_effect=PackageNotFoundError("nuv")):
+        run_new("bad name", cwd=tmp_path, timings_json=str(report))
+    assert json.loads(report.read_text())["nuv_version"] == "unknown"
+
+
+def test_cli_new_timings_flags(tmp_path: Path) -> None:
+    with patch("nuv.commands.new.run_new", return_value=0) as mock_run_new:
+        result = cli_main(["new", "test-proj", "--timings", "--timings-json", str(tmp_path / "t.json")])
+    assert result == 0
+    assert mock_run_new.call_args[1]["timings"] is True
+    assert mock_run_new.call_args[1]["timings_json"] == str(tmp_path / "t.json")
+
+
+# ---------------------------------------------------------------------------
+# lock cache
+# ---------------------------------------------------------------------------
+
+
+def _fake_uv_sync_writing_lock(command: list[str], *, cwd: Path, check: bool) -> MagicMock:
+    if not (cwd / "uv.lock").exists():
+        (cwd / "uv.lock").write_text(f'version = 1\n\n[[package]]\nname = "{cwd.name}"\nversion = "0.1.0"\nsource = {{ editable = "." }}\n')
+    return MagicMock(returncode=0)
+
+
+def test_lock_cache_key_ignores_project_name() -> None:
+    assert lock_cache_key(archetype="polars", python_version="3.14") == lock_cache_key(archetype="polars", python_version="3.14")
+    assert lock_cache_key(archetype="polars", python_version="3.14") != lock_cache_key(archetype="polars", python_version="3.13")
+    assert lock_cache_key(archetype="polars", python_version="3.14") != lock_cache_key(archetype="spark", python_version="3.14")
+
+
+def test_run_new_lock_cache_miss_then_hit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUV_CACHE_DIR", str(tmp_path / "cache"))
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run", side_effect=_fake_uv_sync_writing_lock) as mock_run,
+    ):
+        assert run_new("first-app", cwd=tmp_path, install_mode="none", lock_cache=True) == 0
+        assert run_new("second-app", cwd=tmp_path, install_mode="none", lock_cache=True, offline=True) == 0
+    assert [c.args[0] for c in mock_run.call_args_list] == [["uv", "sync"], ["uv", "sync", "--frozen", "--offline"]]
+    assert 'name = "second-app"' in (tmp_path / "second-app" / "uv.lock").read_text()
+
+
+def test_run_new_lock_cache_pipeline_uses_frozen(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUV_CACHE_DIR", str(tmp_path / "cache"))
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run", side_effect=_fake_uv_sync_writing_lock) as mock_run,
+    ):
+        assert run_new("first-app", cwd=tmp_path, install_mode="none", lock_cache=True) == 0
+        assert run_new("second-app", cwd=tmp_path, install_mode="none", lock_cache=True, pipeline=True) == 0
+    assert [c.args[0] for c in mock_run.call_args_list[1:]] == [["uv", "sync", "--no-install-project", "--frozen"], ["uv", "sync", "--frozen"]]
+
+
+def _seed_lock_cache(tmp_path: Path) -> Path:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run", side_effect=_fake_uv_sync_writing_lock),
+    ):
+        assert run_new("first-app", cwd=tmp_path, install_mode="none", lock_cache=True) == 0
+    (entry,) = (tmp_path / "cache" / "locks").iterdir()
+    return entry
+
+
+def test_run_new_lock_cache_stale_lock_is_replaced(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    monkeypatch.setenv("NUV_CACHE_DIR", str(tmp_path / "cache"))
+    entry = _seed_lock_cache(tmp_path)
+    entry.write_text(entry.read_text() + "# stale\n")
+
+    def _frozen_fails(command: list[str], *, cwd: Path, check: bool) -> MagicMock:
+        if "--frozen" in command:
+            return MagicMock(returncode=2)
+        return _fake_uv_sync_writing_lock(command, cwd=cwd, check=check)
+
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run", side_effect=_frozen_fails) as mock_run,
+    ):
+        assert run_new("second-app", cwd=tmp_path, install_mode="none", lock_cache=True, offline=True) == 0
+    assert [c.args[0] for c in mock_run.call_args_list] == [["uv", "sync", "--frozen", "--offline"], ["uv", "sync", "--offline"]]
+    assert "# stale" not in entry.read_text()
+    assert "discarding cached uv.lock" in caplog.text
+
+
+def test_run_new_lock_cache_unrelated_sync_failure_keeps_entry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    monkeypatch.setenv("NUV_CACHE_DIR", str(tmp_path / "cache"))
+    entry = _seed_lock_cache(tmp_path)
+    cached = entry.read_text()
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run", return_value=MagicMock(returncode=2)) as mock_run,
+    ):
+        assert run_new("second-app", cwd=tmp_path, install_mode="none", lock_cache=True, offline=True) == 1
+    assert mock_run.call_count == 2
+    assert entry.read_text() == cached
+    assert "discarding cached uv.lock" not in caplog.text
+
+
+def test_run_new_lock_cache_missing_uv_keeps_entry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUV_CACHE_DIR", str(tmp_path / "cache"))
+    entry = _seed_lock_cache(tmp_path)
+    with patch("nuv.commands.new.shutil.which", return_value=None):
+        assert run_new("second-app", cwd=tmp_path, install_mode="none", lock_cache=True) == 1
+    assert entry.exists()
+
+
+def test_run_new_lock_cache_failed_unrestored_sync_keeps_cache_empty(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUV_CACHE_DIR", str(tmp_path / "cache"))
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run", return_value=MagicMock(returncode=1)),
+    ):
+        assert run_new("first-app", cwd=tmp_path, install_mode="none", lock_cache=True) == 1
+    assert not (tmp_path / "cache").exists()
+
+
+def test_cli_new_lock_cache_flags() -> None:
+    with patch("nuv.commands.new.run_new", return_value=0) as mock_run_new:
+        assert cli_main(["new", "test-proj", "--lock-cache", "--offline"]) == 0
+    assert mock_run_new.call_args[1]["lock_cache"] is True
+    assert mock_run_new.call_args[1]["offline"] is True
+
+
+# ---------------------------------------------------------------------------
+# staged creation
+# ---------------------------------------------------------------------------
+
+
+def _leftovers(parent: Path) -> list[str]:
+    return sorted(p.name for p in parent.iterdir() if ".nuv-" in p.name)
+
+
+def test_create_staging_dir_is_hidden_sibling(tmp_path: Path) -> None:
+    target = tmp_path / "nested" / "my-project"
+    staging = create_staging_dir(target)
+    assert staging.parent == target.parent
+    assert staging.name.startswith(".my-project.nuv-staging-")
+    assert staging.is_dir()
+    assert not target.exists()
+
+
+def test_publish_renames_into_place(tmp_path: Path) -> None:
+    staging = create_staging_dir(tmp_path / "my-project")
+    (staging / "main.py").write_text("x")
+    publish(staging, tmp_path / "my-project")
+    assert (tmp_path / "my-project" / "main.py").read_text() == "x"
+    assert not staging.exists()
+
+
+def test_publish_refuses_existing_target(tmp_path: Path) -> None:
+    staging = create_staging_dir(tmp_path / "my-project")
+    (tmp_path / "my-project").mkdir()
+    with pytest.raises(ValueError, match="already exists"):
+        publish(staging, tmp_path / "my-project")
+
+
+def test_publish_refuses_existing_empty_target(tmp_path: Path) -> None:
+    staging = create_staging_dir(tmp_path / "my-project")
+    (staging / "main.py").write_text("x")
+    (tmp_path / "my-project").mkdir()
+    with pytest.raises(ValueError, match="already exists"):
+        publish(staging, tmp_path / "my-project")
+    assert list((tmp_path / "my-project").iterdir()) == []
+    assert (staging / "main.py").exists()
+
+
+def test_publish_leaves_placeholder_that_was_written_to(tmp_path: Path) -> None:
+    staging = create_staging_dir(tmp_path / "my-project")
+    with patch("nuv.commands.new.os.rename", side_effect=OSError("Directory not empty")), pytest.raises(ValueError, match="already exists"):
+        publish(staging, tmp_path / "my-project")
+    assert (tmp_path / "my-project").is_dir()
+    assert staging.is_dir()
+
+
+def test_discard_in_background_hides_then_deletes_detached(tmp_path: Path) -> None:
+    doomed = tmp_path / "my-project"
+    (doomed / ".venv").mkdir(parents=True)
+    with patch("nuv.commands.new.subprocess.Popen") as mock_popen:
+        discard_in_background(doomed)
+    assert not doomed.exists()
+    [trash] = [p for p in tmp_path.iterdir() if p.name.startswith(".my-project.nuv-trash-")]
+    command = mock_popen.call_args.args[0]
+    assert command[0] == sys.executable
+    assert command[-1] == str(trash)
+    assert mock_popen.call_args.kwargs["start_new_session"] is True
+
+
+def test_discard_in_background_falls_back_to_rmtree(tmp_path: Path) -> None:
+    doomed = tmp_path / "my-project"
+    doomed.mkdir()
+    with patch("nuv.commands.new.subprocess.Popen", side_effect=OSError("no fork")):
+        discard_in_background(doomed)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_discard_in_background_rename_failure_removes_in_place(tmp_path: Path) -> None:
+    doomed = tmp_path / "my-project"
+    doomed.mkdir()
+    with patch("nuv.commands.new.os.rename", side_effect=OSError("busy")):
+        discard_in_background(doomed)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_run_new_stage_success(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+        assert run_new("cool-tool", cwd=tmp_path, stage=True, install_mode="none") == 0
+    assert (tmp_path / "cool-tool" / "main.py").exists()
+    assert _leftovers(tmp_path) == []
+    mock_run.assert_called_once_with(["uv", "sync"], cwd=tmp_path / "cool-tool", check=False)
+
+
+def test_run_new_stage_scaffold_failure_never_creates_target(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.scaffold_files", side_effect=FileNotFoundError("template not found")),
+        patch("nuv.commands.new.subprocess.Popen") as mock_popen,
+    ):
+        assert run_new("cool-tool", cwd=tmp_path, stage=True) == 1
+    assert not (tmp_path / "cool-tool").exists()
+    [leftover] = _leftovers(tmp_path)
+    assert ".nuv-trash-" in leftover
+    mock_popen.assert_called_once()
+
+
+def test_run_new_stage_sync_failure_discards_published_target(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.shutil.which", return_value=None),
+        patch("nuv.commands.new.subprocess.Popen") as mock_popen,
+    ):
+        assert run_new("cool-tool", cwd=tmp_path, stage=True) == 1
+    assert not (tmp_path / "cool-tool").exists()
+    assert mock_popen.call_args.args[0][-1].startswith(str(tmp_path / ".cool-tool.nuv-trash-"))
+
+
+def test_run_new_stage_keep_on_failure_publishes_partial(tmp_path: Path) -> None:
+    with patch("nuv.commands.new.scaffold_files", side_effect=FileNotFoundError("template not found")):
+        assert run_new("cool-tool", cwd=tmp_path, stage=True, keep_on_failure=True) == 1
+    assert (tmp_path / "cool-tool").is_dir()
+    assert _leftovers(tmp_path) == []
+
+
+def test_run_new_stage_keep_on_failure_after_publish(tmp_path: Path) -> None:
+    with patch("nuv.commands.new.shutil.which", return_value=None):
+        assert run_new("cool-tool", cwd=tmp_path, stage=True, keep_on_failure=True) == 1
+    assert (tmp_path / "cool-tool" / "main.py").exists()
+
+
+def test_run_new_stage_keep_on_failure_target_appeared(tmp_path: Path) -> None:
+    def _racing_publish(staging: Path, target: Path) -> None:
+        target.mkdir(exist_ok=True)
+        raise ValueError(f"Directory already exists: {target}")
+
+    with patch("nuv.commands.new.publish", side_effect=_racing_publish):
+        assert run_new("cool-tool", cwd=tmp_path, stage=True, keep_on_failure=True) == 1
+    assert list((tmp_path / "cool-tool").iterdir()) == []
+    assert len(_leftovers(tmp_path)) == 1
+
+
+def test_run_new_stage_never_discards_target_it_did_not_publish(tmp_path: Path) -> None:
+    def _racing_publish(staging: Path, target: Path) -> None:
+        target.mkdir(exist_ok=True)
+        (target / "theirs.txt").write_text("not nuv's")
+        raise ValueError(f"Directory already exists: {target}")
+
+    with (
+        patch("nuv.commands.new.publish", side_effect=_racing_publish),
+        patch("nuv.commands.new.subprocess.Popen") as mock_popen,
+    ):
+        assert run_new("cool-tool", cwd=tmp_path, stage=True) == 1
+    assert (tmp_path / "cool-tool" / "theirs.txt").read_text() == "not nuv's"
+    [trash] = [call.args[0][-1] for call in mock_popen.call_args_list]
+    assert Path(trash).name.startswith("..cool-tool.nuv-staging-")
+
+
+def test_run_new_stage_rejects_pipeline(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    assert run_new("cool-tool", cwd=tmp_path, stage=True, pipeline=True) == 1
+    assert "cannot be combined" in caplog.text
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_run_new_stage_timings_json_paths_are_relative(tmp_path: Path) -> None:
+    import json
+
+    with (
+        patch("nuv.commands.new.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.new.subprocess.run", return_value=MagicMock(returncode=0)),
+    ):
+        assert run_new("cool-tool", cwd=tmp_path, stage=True, install_mode="none", timings_json=str(tmp_path / "t.json")) == 0
+    data = json.loads((tmp_path / "t.json").read_text())
+    assert "publish" in data["phases"]
+    assert "main.py" in {w["path"] for w in data["writes"]}
+
+
+def test_report_timings_keeps_paths_outside_project(tmp_path: Path) -> None:
+    import json
+
+    from nuv._timing import WRITE, Recorder, Span
+
+    recorder = Recorder()
+    recorder.add(Span(WRITE, str(tmp_path / "elsewhere.txt"), 0.1))
+    report_timings(recorder, target=tmp_path / "proj", total_seconds=0.1, show=False, json_path=str(tmp_path / "t.json"))
+    data = json.loads((tmp_path / "t.json").read_text())
+    assert data["writes"][0]["path"] == str(tmp_path / "elsewhere.txt")
+
+
+def test_report_timings_warns_on_unwritable_json_path(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    from nuv._timing import Recorder
+
+    json_path = tmp_path / "missing" / "t.json"
+    report_timings(Recorder(), target=tmp_path, total_seconds=0.1, show=False, json_path=str(json_path))
+    assert not json_path.exists()
+    assert "Could not write timings" in caplog.text
+
+
+def test_cli_new_stage_flag() -> None:
+    with patch("nuv.commands.new.run_new", return_value=0) as mock_run_new:
+        assert cli_main(["new", "test-proj", "--stage"]) == 0
+    assert mock_run_new.call_args[1]["stage"] is True
+
+
 # ---------------------------------------------------------------------------
 # archetype-aware default Python versions
 # ---------------------------------------------------------------------------
@@ -602,8 +1111,11 @@ def test_scaffold_files_spark_creates_expected_files(tmp_path: Path) -> None:
     assert (target / "src" / "my_spark_app" / "_logging.py").exists()
     assert (target / "src" / "my_spark_app" / "config.py").exists()
     assert (target / "src" / "my_spark_app" / "session.py").exists()
+    assert (target / "src" / "my_spark_app" / "cache.py").exists()
     assert (target / "src" / "my_spark_app" / "jobs" / "__init__.py").exists()
     assert (target / "src" / "my_spark_app" / "jobs" / "example.py").exists()
+    assert (target / "src" / "my_spark_app" / "jobs" / "vectorized.py").exists()
+    assert (target / "benchmarks" / "udf.py").exists()
     assert (target / "tests" / "__init__.py").exists()
     assert (target / "tests" / "conftest.py").exists()
     assert (target / "tests" / "test_example.py").exists()
@@ -651,6 +1163,81 @@ def test_scaffold_files_spark_main_imports_package(tmp_path: Path) -> None:
     assert "from my_spark_app._logging import configure" in main_content
     assert "from my_spark_app.config import resolve_params" in main_content
     assert "from my_spark_app.session import create_spark_session" in main_content
+    assert 'create_spark_session("my-spark-app", profile=params["profile"])' in main_content
+
+
+def test_scaffold_files_spark_session_profiles(tmp_path: Path) -> None:
+    target = tmp_path / "my-spark-app"
+    target.mkdir()
+    scaffold_files(target, name="my-spark-app", module_name="my_spark_app", archetype="spark", python_version="3.13")
+    session = (target / "src" / "my_spark_app" / "session.py").read_text()
+    for profile in ("local-dev", "local-large", "cluster"):
+        assert f'"{profile}": {{' in session
+    assert '"spark.sql.adaptive.enabled": "true"' in session
+    assert "KryoSerializer" in session
+    config = (target / "src" / "my_spark_app" / "config.py").read_text()
+    assert '"profile": "local-dev"' in config
+    assert '"--profile"' in config
+    assert "choices=PROFILES" in config
+
+
+def test_scaffold_files_spark_job_registry(tmp_path: Path) -> None:
+    target = tmp_path / "my-spark-app"
+    target.mkdir()
+    scaffold_files(target, name="my-spark-app", module_name="my_spark_app", archetype="spark", python_version="3.13")
+    registry = (target / "src" / "my_spark_app" / "jobs" / "__init__.py").read_text()
+    assert "pkgutil.iter_modules(__path__)" in registry
+    assert 'SCHEDULER_POOL = "spark.scheduler.pool"' in registry
+    assert "ThreadPoolExecutor" in registry
+    main_content = (target / "main.py").read_text()
+    assert "from my_spark_app.jobs import parse_jobs, run_jobs" in main_content
+    assert "jobs import example" not in main_content
+    assert '"spark.scheduler.mode": "FAIR"' in (target / "src" / "my_spark_app" / "session.py").read_text()
+
+
+def test_scaffold_files_spark_cache_helpers(tmp_path: Path) -> None:
+    target = tmp_path / "my-spark-app"
+    target.mkdir()
+    scaffold_files(target, name="my-spark-app", module_name="my_spark_app", archetype="spark", python_version="3.13")
+    cache = (target / "src" / "my_spark_app" / "cache.py").read_text()
+    assert "def persisted(df: DataFrame, level: StorageLevel = DEFAULT_STORAGE_LEVEL) -> Generator[DataFrame]:" in cache
+    assert "cached.unpersist()" in cache
+    assert "getRDDStorageInfo()" in cache
+    assert "def checkpoint(df: DataFrame" in cache
+    assert '"checkpoint_dir": "spark-checkpoints"' in (target / "src" / "my_spark_app" / "config.py").read_text()
+    assert 'set_checkpoint_dir(spark, params["checkpoint_dir"])' in (target / "main.py").read_text()
+    assert "spark-checkpoints/" in (target / ".gitignore").read_text()
+
+
+def test_scaffold_files_spark_vectorized_job_and_benchmark(tmp_path: Path) -> None:
+    target = tmp_path / "my-spark-app"
+    target.mkdir()
+    scaffold_files(target, name="my-spark-app", module_name="my_spark_app", archetype="spark", python_version="3.13")
+    vectorized = (target / "src" / "my_spark_app" / "jobs" / "vectorized.py").read_text()
+    assert "@pandas_udf(DoubleType())" in vectorized
+    assert "df.mapInArrow(_add_tax_batches, schema)" in vectorized
+    benchmark = (target / "benchmarks" / "udf.py").read_text()
+    assert "from my_spark_app.jobs.vectorized import TAX_RATE, with_tax, with_tax_arrow" in benchmark
+    assert '"python-udf"' in benchmark
+    assert "@F.udf(DoubleType())" in benchmark
+    pyproject = (target / "pyproject.toml").read_text()
+    assert '"pandas>=' in pyproject
+    assert '"pyarrow>=' in pyproject
+    assert 'exclude_lines = ["pragma: no cover", ' in pyproject
+
+
+def test_scaffold_files_spark_fixture_tuned_for_tests(tmp_path: Path) -> None:
+    target = tmp_path / "my-spark-app"
+    target.mkdir()
+    scaffold_files(target, name="my-spark-app", module_name="my_spark_app", archetype="spark", python_version="3.13")
+    conftest = (target / "tests" / "conftest.py").read_text()
+    assert '"spark.master": "local[2]"' in conftest
+    assert '"spark.sql.shuffle.partitions": "2"' in conftest
+    assert '"spark.sql.catalogImplementation": "in-memory"' in conftest
+    assert "PYTEST_XDIST_WORKER" in conftest
+    assert 'scope="session"' in conftest
+    assert '"pytest-xdist>=' in (target / "pyproject.toml").read_text()
+    assert "SPARK_TEST_BUDGET_SECONDS" in (target / "tests" / "test_example.py").read_text()
 
 
 def test_scaffold_files_spark_test_uses_chispa(tmp_path: Path) -> None:
@@ -689,8 +1276,11 @@ def test_scaffold_files_spark_end_with_trailing_newline(tmp_path: Path) -> None:
         "src/my_spark_app/_logging.py",
         "src/my_spark_app/config.py",
         "src/my_spark_app/session.py",
+        "src/my_spark_app/cache.py",
         "src/my_spark_app/jobs/__init__.py",
         "src/my_spark_app/jobs/example.py",
+        "src/my_spark_app/jobs/vectorized.py",
+        "benchmarks/udf.py",
         "tests/__init__.py",
         "tests/conftest.py",
         "tests/test_example.py",
@@ -977,11 +1567,17 @@ def test_scaffold_files_polars_creates_expected_files(tmp_path: Path) -> None:
     assert (target / "src" / "my_polars_app" / "_logging.py").exists()
     assert (target / "src" / "my_polars_app" / "_io.py").exists()
     assert (target / "src" / "my_polars_app" / "_db.py").exists()
+    assert (target / "src" / "my_polars_app" / "_delta.py").exists()
+    assert (target / "src" / "my_polars_app" / "_ingest.py").exists()
     assert (target / "src" / "my_polars_app" / "config.py").exists()
     assert (target / "src" / "my_polars_app" / "main.py").exists()
     assert (target / "tests" / "__init__.py").exists()
     assert (target / "tests" / "conftest.py").exists()
     assert (target / "tests" / "test_io.py").exists()
+    assert (target / "tests" / "test_db.py").exists()
+    assert (target / "tests" / "test_delta.py").exists()
+    assert (target / "benchmarks" / "run.py").exists()
+    assert (target / "tests" / "test_ingest.py").exists()
     assert (target / "notebooks" / "explore.py").exists()
     assert (target / "data" / "raw").exists()
     assert (target / "data" / "features").exists()
@@ -994,6 +1590,7 @@ def test_scaffold_files_polars_pyproject_has_deps(tmp_path: Path) -> None:
     pyproject = (target / "pyproject.toml").read_text()
     assert "polars>=1.40.1" in pyproject
     assert "duckdb>=1.5.2" in pyproject
+    assert "pyarrow>=21.0.0" in pyproject
     assert "deltalake>=1.5.1" in pyproject
     assert "pydantic-settings>=2.14.0" in pyproject
     assert "click>=8.3.3" in pyproject
@@ -1009,7 +1606,10 @@ def test_scaffold_files_polars_main_uses_click(tmp_path: Path) -> None:
     scaffold_files(target, name="my-polars-app", module_name="my_polars_app", archetype="polars")
     main_content = (target / "main.py").read_text()
     assert "import click" in main_content
-    assert "@click.command()" in main_content
+    assert "@click.group(invoke_without_command=True)" in main_content
+    assert "def ingest(" in main_content
+    assert "from my_polars_app._ingest import ingest as ingest_file" in main_content
+    assert "def optimize(" in main_content
 
 
 def test_scaffold_files_polars_package_modules(tmp_path: Path) -> None:
@@ -1021,11 +1621,44 @@ def test_scaffold_files_polars_package_modules(tmp_path: Path) -> None:
     assert "read_parquet" in io_content
     assert "show" in io_content
     assert "glimpse" in io_content
+    assert "def scan_parquet" in io_content
+    assert "def scan_ndjson" in io_content
+    assert "def sink" in io_content
+    assert 'kwargs.setdefault("engine", "streaming")' in io_content
+    assert "def write_partitioned" in io_content
+    assert "def scan_partitioned" in io_content
+    assert "partition_chunk_size_bytes=file_size_bytes" in io_content
+    assert "def cached" in io_content
+    assert "def read_ipc" in io_content
+    assert "def profile" in io_content
+    assert "def read_many" in io_content
+    assert "def scan_many" in io_content
+    assert 'IPC_SUFFIXES = (".arrow", ".ipc", ".feather")' in io_content
+    assert 'write_ipc(tmp, compression="uncompressed")' in io_content
+    assert "from my_polars_app.config import Settings" in io_content
     db_content = (target / "src" / "my_polars_app" / "_db.py").read_text()
     assert "import duckdb" in db_content
     assert "def sql" in db_content
+    assert "def register" in db_content
+    assert "threading.local()" in db_content
+    assert "from my_polars_app.config import Settings" in db_content
     config = (target / "src" / "my_polars_app" / "config.py").read_text()
     assert "pydantic_settings" in config
+    assert 'duckdb_database: str = "my_polars_app.duckdb"' in config
+    assert "cache_max_bytes: int = 2 * 1024**3" in config
+
+
+def test_scaffold_files_polars_benchmarks(tmp_path: Path) -> None:
+    target = tmp_path / "my-polars-app"
+    target.mkdir()
+    scaffold_files(target, name="my-polars-app", module_name="my_polars_app", archetype="polars")
+    bench = (target / "benchmarks" / "run.py").read_text()
+    assert "from my_polars_app import _db, _io" in bench
+    assert 'FORMATS = ("csv", "parquet", "ipc", "delta")' in bench
+    assert "ru_maxrss" in bench
+    assert "def prepare(" in bench
+    assert "--compare" in bench
+    compile(bench, "run.py", "exec")
 
 
 def test_scaffold_files_polars_end_with_trailing_newline(tmp_path: Path) -> None:
@@ -1043,11 +1676,17 @@ def test_scaffold_files_polars_end_with_trailing_newline(tmp_path: Path) -> None
         "src/my_polars_app/_logging.py",
         "src/my_polars_app/_io.py",
         "src/my_polars_app/_db.py",
+        "src/my_polars_app/_delta.py",
+        "src/my_polars_app/_ingest.py",
         "src/my_polars_app/config.py",
         "src/my_polars_app/main.py",
         "tests/__init__.py",
         "tests/conftest.py",
         "tests/test_io.py",
+        "tests/test_db.py",
+        "tests/test_delta.py",
+        "benchmarks/run.py",
+        "tests/test_ingest.py",
         "notebooks/explore.py",
     ]
 
@@ -0,0 +1,53 @@
+"""Guard the cold-start cost of ``nuv --help`` (shell completions, editor integrations)."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Self import time of nuv's own modules, in microseconds; stdlib imports such as
+# argparse (~10-14 ms) are excluded so the budget only tracks code nuv controls.
+# Measured at 3-4 ms locally; the budget leaves headroom for slow CI runners.
+# Eager imports of the command modules are caught deterministically by
+# test_help_does_not_import_command_modules.
+IMPORT_BUDGET_US = 15_000
+
+DEFERRED_MODULES = {
+    "nuv._lockcache",
+    "nuv._logging",
+    "nuv._templates",
+    "nuv._timing",
+    "nuv.commands.batch",
+    "nuv.commands.new",
+    "nuv.commands.warm",
+    "subprocess",
+    "tomllib",
+}
+
+
+def _import_profile(argv: list[str]) -> dict[str, tuple[int, int]]:
+    """Run ``nuv <argv>`` under ``-X importtime``; return {module: (self, cumulative) microseconds}."""
+    code = f"from nuv.cli import main; main({argv!r})"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=False)
+    assert result.returncode == 0, result.stderr
+    profile: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, module = line.removeprefix("import time:").split("|")
+        profile[module.strip()] = (int(own), int(cumulative))
+    return profile
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["new", "--help"], ["batch", "--help"], ["warm", "--help"]], ids=" ".join)
+def test_help_does_not_import_command_modules(argv: list[str]) -> None:
+    profile = _import_profile(argv)
+    assert "nuv.cli" in profile
+    assert not DEFERRED_MODULES & profile.keys()
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["new", "--help"]], ids=" ".join)
+def test_help_import_time_budget(argv: list[str]) -> None:
+    profile = _import_profile(argv)
+    own = sum(self_us for module, (self_us, _) in profile.items() if module == "nuv" or module.startswith("nuv."))
+    assert own < IMPORT_BUDGET_US, f"nuv's own modules took {own} us to import (budget {IMPORT_BUDGET_US} us)"
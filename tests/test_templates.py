@@ -0,0 +1,91 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nuv import _templates
+from nuv._templates import TEMPLATES_ROOT, CompiledTemplate, clear_cache, load_template, warm
+
+VALUES = {
+    "name": "my-project",
+    "module_name": "my_project",
+    "python_version": "3.13",
+    "python_version_nodot": "313",
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+# ---------------------------------------------------------------------------
+# CompiledTemplate
+# ---------------------------------------------------------------------------
+
+
+def test_compiled_template_matches_str_format() -> None:
+    source = "a {name} b {{literal}} c {module_name!r} d {python_version:>6}"
+    compiled = CompiledTemplate("inline", source)
+    assert compiled.render(VALUES) == source.format(**VALUES)
+
+
+def test_compiled_template_missing_field_raises_key_error() -> None:
+    compiled = CompiledTemplate("inline", "{missing}")
+    with pytest.raises(KeyError):
+        compiled.render(VALUES)
+
+
+@pytest.mark.parametrize("tpl_path", sorted(TEMPLATES_ROOT.rglob("*.tpl")), ids=lambda p: p.relative_to(TEMPLATES_ROOT).as_posix())
+def test_every_shipped_template_renders_like_str_format(tpl_path: Path) -> None:
+    archetype_root = TEMPLATES_ROOT / tpl_path.relative_to(TEMPLATES_ROOT).parts[0]
+    compiled = load_template(archetype_root.name, tpl_path.relative_to(archetype_root).as_posix())
+    assert compiled.render(VALUES) == tpl_path.read_text(encoding="utf-8").format(**VALUES)
+
+
+# ---------------------------------------------------------------------------
+# load_template
+# ---------------------------------------------------------------------------
+
+
+def test_load_template_is_cached() -> None:
+    first = load_template("script", "main.py.tpl")
+    with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+        second = load_template("script", "main.py.tpl")
+    assert first is second
+
+
+def test_load_template_missing_raises() -> None:
+    with pytest.raises(FileNotFoundError, match="Template not found: script/nope.tpl"):
+        load_template("script", "nope.tpl")
+
+
+def test_load_template_reloads_when_mtime_changes(tmp_path: Path) -> None:
+    (tmp_path / "demo").mkdir()
+    tpl = tmp_path / "demo" / "x.tpl"
+    tpl.write_text("v1 {name}", encoding="utf-8")
+    with patch.object(_templates, "TEMPLATES_ROOT", tmp_path):
+        assert load_template("demo", "x.tpl").render(VALUES) == "v1 my-project"
+        tpl.write_text("v2 {name}", encoding="utf-8")
+        stat = tpl.stat()
+        os.utime(tpl, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_template("demo", "x.tpl").render(VALUES) == "v2 my-project"
+
+
+# ---------------------------------------------------------------------------
+# warm
+# ---------------------------------------------------------------------------
+
+
+def test_warm_loads_every_template() -> None:
+    assert warm() == len(list(TEMPLATES_ROOT.rglob("*.tpl")))
+    assert _templates._compile.cache_info().currsize == len(list(TEMPLATES_ROOT.rglob("*.tpl")))
+
+
+def test_warm_single_archetype_includes_nested_templates() -> None:
+    assert warm(("polars",)) == len(list((TEMPLATES_ROOT / "polars").rglob("*.tpl")))
+    with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+        load_template("polars", "notebooks/explore.py.tpl")
@@ -0,0 +1,68 @@
+from nuv._timing import PHASE, RENDER, SUBPROCESS, WRITE, Recorder, Span, recording, span
+
+
+def test_span_is_noop_without_recording() -> None:
+    with span(PHASE, "validate") as extra:
+        extra["ignored"] = True
+
+
+def test_span_records_duration_and_extra() -> None:
+    with recording() as recorder, span(SUBPROCESS, "uv sync") as extra:
+        extra["returncode"] = 0
+    [recorded] = recorder.spans
+    assert recorded.kind == SUBPROCESS
+    assert recorded.label == "uv sync"
+    assert recorded.seconds >= 0
+    assert recorded.extra == {"returncode": 0}
+
+
+def test_span_records_on_exception() -> None:
+    with recording() as recorder:
+        try:
+            with span(PHASE, "scaffold"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+    assert [s.label for s in recorder.spans] == ["scaffold"]
+
+
+def test_recording_is_scoped_to_block() -> None:
+    with recording() as recorder:
+        pass
+    with span(PHASE, "after"):
+        pass
+    assert recorder.spans == []
+
+
+def _sample_recorder() -> Recorder:
+    recorder = Recorder()
+    recorder.add(Span(PHASE, "scaffold", 0.5))
+    recorder.add(Span(RENDER, "script/main.py.tpl", 0.1))
+    recorder.add(Span(RENDER, "script/readme.md.tpl", 0.2))
+    recorder.add(Span(WRITE, "/tmp/x/main.py", 0.05, {"bytes": 10}))
+    recorder.add(Span(SUBPROCESS, "uv sync", 1.5, {"returncode": 0}))
+    return recorder
+
+
+def test_recorder_to_dict() -> None:
+    data = _sample_recorder().to_dict(name="x")
+    assert data["name"] == "x"
+    assert data["phases"] == {"scaffold": 0.5}
+    assert data["renders"] == [{"template": "script/main.py.tpl", "seconds": 0.1}, {"template": "script/readme.md.tpl", "seconds": 0.2}]
+    assert data["writes"] == [{"path": "/tmp/x/main.py", "seconds": 0.05, "bytes": 10}]
+    assert data["subprocesses"] == [{"command": "uv sync", "seconds": 1.5, "returncode": 0}]
+
+
+def test_recorder_format_table() -> None:
+    table = _sample_recorder().format_table(total_seconds=2.0)
+    lines = table.splitlines()
+    assert lines[0].split() == ["phase", "seconds"]
+    assert lines[1].split() == ["scaffold", "0.5000"]
+    assert "render (2 files)" in lines[2] and lines[2].endswith("0.3000")
+    assert "write (1 files)" in lines[3]
+    assert "$ uv sync" in lines[4]
+    assert lines[5].split() == ["total", "2.0000"]
+
+
+def test_recorder_format_table_empty() -> None:
+    assert Recorder().format_table().splitlines() == ["phase    seconds"]
@@ -0,0 +1,149 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nuv.cli import main as cli_main
+from nuv.commands.warm import _format_bytes, directory_size, run_warm, uv_cache_dir, warm_one
+
+
+def _fake_uv(cache: Path, *, fail: tuple[str, ...] = ()):
+    """Stand-in for subprocess.run: `uv cache dir` prints *cache*; `uv sync` grows it and writes a lock."""
+
+    def run(command: list[str], *, cwd: Path | None = None, check: bool = False, **kwargs) -> MagicMock:
+        if command[:3] == ["uv", "cache", "dir"]:
+            return MagicMock(returncode=0, stdout=f"{cache}\n")
+        if command[1] in fail:
+            return MagicMock(returncode=1)
+        if command[1] == "sync":
+            assert cwd is not None
+            assert (cwd / "pyproject.toml").exists()
+            (cache / f"{cwd.name}.whl").write_bytes(b"x" * 2048)
+            (cwd / "uv.lock").write_text('version = 1\n\n[[package]]\nname = "nuv-warm"\nversion = "0.1.0"\nsource = { editable = "." }\n')
+        return MagicMock(returncode=0)
+
+    return run
+
+
+def test_uv_cache_dir(tmp_path: Path) -> None:
+    with patch("nuv.commands.warm.subprocess.run", return_value=MagicMock(returncode=0, stdout=f"{tmp_path}\n")):
+        assert uv_cache_dir() == tmp_path
+    with patch("nuv.commands.warm.subprocess.run", return_value=MagicMock(returncode=2, stdout="")):
+        assert uv_cache_dir() is None
+
+
+def test_directory_size(tmp_path: Path) -> None:
+    import os
+
+    assert directory_size(None) == 0
+    assert directory_size(tmp_path / "missing") == 0
+    (tmp_path / "a").write_bytes(b"12345")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b").write_bytes(b"123")
+    (tmp_path / "vanished").write_bytes(b"1234567")
+    real_lstat = os.lstat
+
+    def flaky_lstat(path: str) -> os.stat_result:
+        if path.endswith("vanished"):
+            raise FileNotFoundError(path)
+        return real_lstat(path)
+
+    with patch("nuv.commands.warm.os.lstat", side_effect=flaky_lstat):
+        assert directory_size(tmp_path) == 8
+
+
+@pytest.mark.parametrize(("size", "expected"), [(512, "512 B"), (2048, "2.0 KiB"), (3 * 1024**2, "3.0 MiB"), (5 * 1024**3, "5.0 GiB")])
+def test_format_bytes(size: int, expected: str) -> None:
+    assert _format_bytes(size) == expected
+
+
+def test_warm_one_installs_python_and_syncs_all_groups(tmp_path: Path) -> None:
+    (tmp_path / "cache").mkdir()
+    with patch("nuv.commands.new.subprocess.run", side_effect=_fake_uv(tmp_path / "cache")) as mock_run:
+        warm_one("polars", "3.14", install_python=True, lock_cache=False)
+    assert [c.args[0] for c in mock_run.call_args_list] == [
+        ["uv", "python", "install", "3.14"],
+        ["uv", "sync", "--all-groups", "--no-install-project"],
+    ]
+
+
+def test_warm_one_python_install_failure(tmp_path: Path) -> None:
+    with (
+        patch("nuv.commands.new.subprocess.run", return_value=MagicMock(returncode=1)),
+        pytest.raises(RuntimeError, match="uv python install 3.14 failed"),
+    ):
+        warm_one("script", "3.14", install_python=True, lock_cache=False)
+
+
+def test_warm_one_stores_lock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NUV_CACHE_DIR", str(tmp_path / "nuv-cache"))
+    (tmp_path / "cache").mkdir()
+    with patch("nuv.commands.new.subprocess.run", side_effect=_fake_uv(tmp_path / "cache")):
+        warm_one("script", "3.14", install_python=False, lock_cache=True)
+    assert len(list((tmp_path / "nuv-cache" / "locks").iterdir())) == 1
+
+
+def test_run_warm_reports_each_archetype(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    fake = _fake_uv(cache)
+    with (
+        patch("nuv.commands.warm.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.warm.subprocess.run", side_effect=fake),
+        patch("nuv.commands.new.subprocess.run", side_effect=fake),
+    ):
+        assert run_warm() == 0
+    err = capsys.readouterr().err
+    for archetype, version in (("script", "3.14"), ("spark", "3.13"), ("fastapi", "3.14"), ("polars", "3.14")):
+        assert f"{archetype:<10} {version:<7} ok" in err
+    assert "2.0 KiB" in err
+    assert "8.0 KiB" in err
+
+
+def test_run_warm_explicit_versions_and_failure(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    fake = _fake_uv(cache, fail=("sync",))
+    with (
+        patch("nuv.commands.warm.shutil.which", return_value="/usr/bin/uv"),
+        patch("nuv.commands.warm.subprocess.run", side_effect=fake),
+        patch("nuv.commands.new.subprocess.run", side_effect=fake),
+    ):
+        assert run_warm(archetypes=["script"], python_versions=["3.12", "3.13"]) == 1
+    err = capsys.readouterr().err
+    assert "script     3.12    failed" in err
+    assert "script     3.13    failed" in err
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"archetypes": ["django"]}, "Unknown archetype"),
+        ({"python_versions": ["3"]}, "MAJOR.MINOR"),
+    ],
+)
+def test_run_warm_invalid_arguments(kwargs: dict, message: str, caplog: pytest.LogCaptureFixture) -> None:
+    assert run_warm(**kwargs) == 1
+    assert message in caplog.text
+
+
+def test_run_warm_uv_not_found(caplog: pytest.LogCaptureFixture) -> None:
+    with patch("nuv.commands.warm.shutil.which", return_value=None):
+        assert run_warm() == 1
+    assert "uv not found" in caplog.text
+
+
+def test_cli_warm_dispatches() -> None:
+    with patch("nuv.commands.warm.run_warm", return_value=0) as mock_run_warm:
+        assert cli_main(["warm", "--archetype", "spark", "--python-version", "3.12", "--install-python", "--lock-cache"]) == 0
+    mock_run_warm.assert_called_once_with(archetypes=["spark"], python_versions=["3.12"], install_python=True, lock_cache=True)
+
+
+def test_cli_warm_unexpected_error_returns_1(capsys: pytest.CaptureFixture[str]) -> None:
+    with (
+        patch("nuv.commands.warm.run_warm", side_effect=Exception("boom")),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        cli_main(["warm"])
+    assert exc_info.value.code == 1
+    assert "ERROR unexpected failure" in capsys.readouterr().err